@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+"""
+Benchmark of GerritClient.decode_response on large '/changes/' responses.
+
+Usage: python benchmarks/bench_decode_response.py [size in MB]
+"""
+import os
+import sys
+import json
+import time
+
+# run from a checkout without installing the package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gerrit import GerritClient
+from gerrit.utils import jsonlib
+
+
+class FakeResponse(object):
+    def __init__(self, content):
+        self.content = content
+        self.encoding = "utf-8"
+        self.headers = {"content-type": "application/json; charset=UTF-8"}
+
+
+def legacy_decode_response(response):
+    """decode_response as it was before the bytes fast path."""
+    magic_json_prefix = ")]}'\n"
+    content = response.content.strip()
+    if response.encoding:
+        content = content.decode(response.encoding)
+    if content.startswith(magic_json_prefix):
+        content = content[len(magic_json_prefix):]
+    return json.loads(content)
+
+
+def make_content(size_mb):
+    change = {
+        "id": "myProject~master~I8473b95934b5732ac55d26311a706c9c2bde9940",
+        "project": "myProject",
+        "branch": "master",
+        "change_id": "I8473b95934b5732ac55d26311a706c9c2bde9940",
+        "subject": "Implementing Feature X",
+        "status": "NEW",
+        "created": "2013-02-01 09:59:32.126000000",
+        "updated": "2013-02-21 11:16:36.775000000",
+        "mergeable": True,
+        "insertions": 34,
+        "deletions": 101,
+        "_number": 3965,
+        "owner": {"_account_id": 1000096, "name": "John Doe", "username": "jdoe"},
+        "labels": {"Code-Review": {"approved": {"_account_id": 1000096}}},
+    }
+    one = len(json.dumps(change)) + 2
+    count = int(size_mb * 1024 * 1024 / one)
+    return (")]}'\n" + json.dumps([change] * count) + "\n").encode("utf-8")
+
+
+def bench(decode, content, rounds=5):
+    best = None
+    for _ in range(rounds):
+        response = FakeResponse(content)
+        start = time.perf_counter()
+        decode(response)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    size_mb = float(sys.argv[1]) if len(sys.argv) > 1 else 8
+    content = make_content(size_mb)
+    mb = len(content) / (1024.0 * 1024.0)
+
+    print("response size: %.1f MB" % mb)
+    legacy = bench(legacy_decode_response, content)
+    print("%-24s %8.2f ms/MB" % ("legacy (str + json)", legacy * 1000 / mb))
+    for name in sorted(jsonlib.BACKENDS):
+        jsonlib.use_backend(name)
+        elapsed = bench(GerritClient.decode_response, content)
+        print(
+            "%-24s %8.2f ms/MB  x%.2f"
+            % ("bytes + %s" % name, elapsed * 1000 / mb, legacy / elapsed)
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+"""
+Benchmark of the memory and time used to parse models, compared with the
+models of python-gerrit-api 1.0.3 (a list of attributes and a __dict__ per instance).
+
+Usage: python benchmarks/bench_models.py [number of objects]
+"""
+import os
+import sys
+import time
+import tracemalloc
+
+# run from a checkout without installing the package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gerrit.changes.change import GerritChange
+from gerrit.projects.branches import Branch
+
+
+class LegacyModel(object):
+    """
+    The BaseModel of python-gerrit-api 1.0.3.
+    """
+
+    def __init__(self, **kwargs):
+        self.attributes = ["id"]
+
+    def __getattr__(self, key):
+        if key in self.attributes:
+            return self.__dict__.get(key)
+        else:
+            raise AttributeError(key)
+
+    @classmethod
+    def parse(cls, data, **kwargs):
+        data = data or {}
+        item = cls() if data else None
+        data.update(kwargs)
+        for key, value in data.items():
+            if key in item.attributes:
+                setattr(item, key, value)
+        return item
+
+    @classmethod
+    def parse_list(cls, data, **kwargs):
+        return [cls.parse(obj, **kwargs) for obj in data or [] if obj]
+
+
+class LegacyGerritChange(LegacyModel):
+    def __init__(self, **kwargs):
+        self.attributes = [
+            "id",
+            "project",
+            "branch",
+            "attention_set",
+            "change_id",
+            "subject",
+            "status",
+            "created",
+            "updated",
+            "mergeable",
+            "insertions",
+            "deletions",
+            "_number",
+            "owner",
+            "gerrit",
+        ]
+
+
+class LegacyBranch(LegacyModel):
+    def __init__(self, **kwargs):
+        self.attributes = [
+            "ref",
+            "web_links",
+            "revision",
+            "can_delete",
+            "project",
+            "gerrit",
+        ]
+
+
+def make_changes(count):
+    return [
+        {
+            "id": "myProject~master~I%040d" % i,
+            "project": "myProject",
+            "branch": "master",
+            "change_id": "I%040d" % i,
+            "subject": "Implementing Feature X",
+            "status": "NEW",
+            "created": "2013-02-01 09:59:32.126000000",
+            "updated": "2013-02-21 11:16:36.775000000",
+            "mergeable": True,
+            "insertions": 34,
+            "deletions": 101,
+            "_number": i,
+            "owner": {"_account_id": 1000096},
+        }
+        for i in range(count)
+    ]
+
+
+def make_branches(count):
+    return [
+        {"ref": "refs/heads/branch-%d" % i, "revision": "%040d" % i}
+        for i in range(count)
+    ]
+
+
+def bench(model, data, **kwargs):
+    # parse copies, LegacyModel.parse updates the JSON objects
+    data = [dict(obj) for obj in data]
+    tracemalloc.start()
+    start = time.perf_counter()
+    results = model.parse_list(data, **kwargs)
+    elapsed = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del results
+    return size, elapsed
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    for model, legacy, data in (
+        (GerritChange, LegacyGerritChange, make_changes(count)),
+        (Branch, LegacyBranch, make_branches(count)),
+    ):
+        runs = [("1.0.3", legacy, {})]
+        runs.append(("eager", model, {"lazy": False}))
+        runs.append(("lazy", model, {"lazy": True}))
+        for name, model_, kwargs in runs:
+            size, elapsed = bench(model_, data, **kwargs)
+            print(
+                "%-14s %-6s %6.0f bytes/object %8.2f us/object"
+                % (
+                    model.__name__,
+                    name,
+                    float(size) / count,
+                    elapsed * 1e6 / count,
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
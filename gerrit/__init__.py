@@ -1,16 +1,28 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 # @Author: Jialiang Shi
-import json
+import os
+from gerrit.utils import jsonlib
 from gerrit.utils.requester import Requester
+from gerrit.utils.features import ServerFeatures
+from gerrit.utils.cache import ETagCache, ResponseCache, ImmutableCache, make_principal
+from gerrit.utils.retry import RetryPolicy
+from gerrit.utils.throttle import ConcurrencyGovernor
+from gerrit.utils.router import ReplicaRouter
+from gerrit.utils.registry import EntityRegistry, NegativeCache
+from gerrit.utils.refs import RefCache
+from gerrit.utils.snapshot import Snapshot
 from gerrit.config.config import GerritConfig
 from gerrit.projects.projects import GerritProjects
 from gerrit.accounts.accounts import GerritAccounts
+from gerrit.accounts.resolver import AccountResolver
 from gerrit.groups.groups import GerritGroups
 from gerrit.plugins.plugins import GerritPlugins
 from gerrit.changes.changes import GerritChanges
 from gerrit.utils.common import logger
 
+MAGIC_JSON_PREFIX = b")]}'"
+
 
 class GerritClient(object):
     """
@@ -30,8 +42,142 @@ class GerritClient(object):
         cert=None,
         timeout=60,
         max_retries=None,
+        version_cache_ttl=3600,
+        pool_connections=None,
+        pool_maxsize=None,
+        pool_block=False,
+        keep_alive=True,
+        prewarm_connections=0,
+        etag_cache=False,
+        retry_policy=None,
+        single_flight=False,
+        rate_limiter=None,
+        governor=None,
+        replica_urls=None,
+        sticky_ttl=10.0,
+        entity_registry=False,
+        response_cache=False,
+        ref_cache=False,
+        immutable_cache=False,
+        negative_cache=False,
+        snapshot=None,
+        account_resolver=False,
     ):
+        """
+        :param base_url: gerrit url
+        :param username:
+        :param password:
+        :param ssl_verify:
+        :param cert:
+        :param timeout:
+        :param max_retries: number of retries of the transport adapter
+        :param version_cache_ttl: seconds the server version is cached, None for ever
+        :param pool_connections: number of host connection pools to cache (requests default is 10)
+        :param pool_maxsize: maximum number of connections kept per host (requests default is 10)
+        :param pool_block: block when no free connection is available instead of opening a throwaway one
+        :param keep_alive: set False to close the connection after every request
+        :param prewarm_connections: number of connections to open at construction time
+        :param etag_cache: True (or an ETagCache instance) to send conditional GETs with If-None-Match
+        :param retry_policy: True (or a RetryPolicy instance) to retry transient failures with backoff
+        :param single_flight: share one request and one decoded result between concurrent identical GETs
+        :param rate_limiter: a RateLimiter, or any object with an acquire(method, url) method
+        :param governor: True (or a ConcurrencyGovernor instance) to adapt the requests in flight to the server load
+        :param replica_urls: base urls of read-only replicas, GETs are sent to them and mutations to base_url
+        :param sticky_ttl: seconds the reads of a resource go to the primary after it was mutated
+        :param entity_registry: True (or an EntityRegistry instance) to return the same object for repeated gets
+        :param response_cache: True (or a ResponseCache instance) to cache the responses of the projects,
+          accounts, groups and config endpoints
+        :param ref_cache: True (or a RefCache instance) to keep the branches and tags of the projects
+          between accesses to project.branches and project.tags
+        :param immutable_cache: True (or an ImmutableCache instance) to keep on disk for ever the responses
+          addressed by a full commit SHA, e.g. file contents and diffs
+        :param negative_cache: True (or a NegativeCache instance) to remember for a short time the projects,
+          accounts, branches and tags not found
+        :param snapshot: path of a snapshot file (or a Snapshot instance) to start with the projects, accounts,
+          groups, ref listings and server version fetched by an earlier process, see save_snapshot()
+        :param account_resolver: True (or an AccountResolver instance) to share the accounts fetched by
+          username, email or account id across the client, fetching the unknown ones in batches
+        """
         self._base_url = self.strip_trailing_slash(base_url)
+        # Opaque id of the account, keeps the shared caches and snapshots apart
+        self._principal = make_principal(username)
+
+        if etag_cache is True:
+            etag_cache = ETagCache()
+        elif etag_cache is False:
+            etag_cache = None
+
+        if retry_policy is True:
+            retry_policy = RetryPolicy()
+
+        if governor is True:
+            governor = ConcurrencyGovernor()
+
+        if entity_registry is True:
+            entity_registry = EntityRegistry()
+        elif entity_registry is False:
+            entity_registry = None
+        # Identity map of the fetched projects, changes, accounts and groups
+        self.registry = entity_registry
+
+        if negative_cache is True:
+            negative_cache = NegativeCache()
+        elif negative_cache is False:
+            negative_cache = None
+        # Lookups known to find nothing
+        self.negative_cache = negative_cache
+
+        if response_cache is True:
+            response_cache = ResponseCache()
+        elif response_cache is False:
+            response_cache = None
+        if response_cache is not None:
+            if response_cache.prefix is None:
+                response_cache.prefix = self.get_endpoint_url("")
+            if response_cache.principal is None:
+                response_cache.principal = self._principal
+            elif response_cache.principal != self._principal:
+                raise ValueError("The response cache is used by the client of another account")
+
+        if immutable_cache is True:
+            immutable_cache = ImmutableCache()
+        elif immutable_cache is False:
+            immutable_cache = None
+        if immutable_cache is not None:
+            if immutable_cache.prefix is None:
+                immutable_cache.prefix = self.get_endpoint_url("")
+            if immutable_cache.principal is None:
+                immutable_cache.principal = self._principal
+            elif immutable_cache.principal != self._principal:
+                raise ValueError("The immutable cache is used by the client of another account")
+
+        if ref_cache is True:
+            ref_cache = RefCache()
+        elif ref_cache is False:
+            ref_cache = None
+        # Branch and tag listings of the projects
+        self.refs = ref_cache
+
+        if account_resolver is True:
+            account_resolver = AccountResolver()
+        elif account_resolver is False:
+            account_resolver = None
+        if account_resolver is not None and account_resolver.gerrit is None:
+            account_resolver.gerrit = self
+        self.account_resolver = account_resolver
+
+        if isinstance(snapshot, str):
+            snapshot = self.load_snapshot(snapshot)
+        # What an earlier process learned about the server, and what is saved for the next ones
+        self.snapshot = snapshot
+
+        router = None
+        if replica_urls:
+            router = ReplicaRouter(
+                self._base_url,
+                [self.strip_trailing_slash(url) for url in replica_urls],
+                sticky_ttl=sticky_ttl,
+            )
 
         self.requester = Requester(
             username=username,
@@ -40,8 +186,34 @@ class GerritClient(object):
             cert=cert,
             timeout=timeout,
             max_retries=max_retries,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            keep_alive=keep_alive,
+            etag_cache=etag_cache,
+            retry_policy=retry_policy or None,
+            single_flight=single_flight,
+            rate_limiter=rate_limiter,
+            governor=governor or None,
+            router=router,
+            registry=entity_registry,
+            response_cache=response_cache,
+            immutable_cache=immutable_cache,
+            snapshot=snapshot,
+            account_resolver=account_resolver,
         )
 
+        # Cached server version, used by the version dependent methods
+        self.features = ServerFeatures(self, ttl=version_cache_ttl)
+
+        if snapshot is not None:
+            snapshot.apply(self)
+
+        if prewarm_connections:
+            self.requester.prewarm(
+                self.get_endpoint_url("/config/server/version"), prewarm_connections
+            )
+
     @classmethod
     def strip_trailing_slash(cls, url):
         """
@@ -53,6 +225,31 @@ class GerritClient(object):
             url = url[:-1]
         return url
 
+    @staticmethod
+    def load_snapshot(path):
+        """
+        :param path: snapshot file
+        :return: the Snapshot, empty if the file is missing or unreadable
+        """
+        if os.path.exists(path):
+            try:
+                return Snapshot.load(path)
+            except (IOError, OSError, ValueError) as error:
+                logger.warning("Failed to load the snapshot %s: %s" % (path, error))
+        return Snapshot(path=path)
+
+    def save_snapshot(self, path=None):
+        """
+        Save the projects, accounts and groups fetched, the ref listings and the
+        server version, to start the next clients with them.
+
+        :param path: snapshot file, defaults to the snapshot given at construction
+        :return:
+        """
+        snapshot = self.snapshot if self.snapshot is not None else Snapshot(path=path)
+        snapshot.capture(self)
+        snapshot.save(path)
+
     def get_endpoint_url(self, endpoint):
         """
         Return the complete url including host and port for a given endpoint.
@@ -64,30 +261,102 @@ class GerritClient(object):
     @staticmethod
     def decode_response(response):
         """Strip off Gerrit's magic prefix and decode a response.
+        The decoded content is memoized on the response, so a response handed out
+        again (e.g. on '304 Not Modified') is not decoded twice.
         :returns:
             Decoded JSON content as a dict, or raw text if content could not be
             decoded as JSON.
         :raises:
             requests.HTTPError if the response contains an HTTP error status code.
         """
-        magic_json_prefix = ")]}'\n"
+        lock = getattr(response, "gerrit_decode_lock", None)
+        if lock is not None:
+            with lock:
+                return GerritClient._decode_once(response)
+        return GerritClient._decode_once(response)
+
+    @staticmethod
+    def _decode_once(response):
+        """
+        :param response:
+        :return:
+        """
+        try:
+            return response.gerrit_decoded
+        except AttributeError:
+            pass
+
+        result = GerritClient._decode_content(response)
+        try:
+            response.gerrit_decoded = result
+        except AttributeError:
+            pass
+        return result
+
+    @staticmethod
+    def _decode_content(response):
+        """
+        JSON content is parsed straight from the raw bytes: the magic prefix is
+        skipped through a memoryview instead of stripping and slicing copies of
+        the whole content.
+
+        :param response:
+        :return:
+        """
         content_type = response.headers.get("content-type", "")
+        content = response.content
+        encoding = (response.encoding or "utf-8").lower().replace("_", "-")
 
-        content = response.content.strip()
-        if response.encoding:
-            content = content.decode(response.encoding)
-        if not content:
-            return content
         if content_type.split(";")[0] != "application/json":
+            return GerritClient._decode_text(response)
+        if encoding not in ("utf-8", "utf8"):
+            return GerritClient._decode_json_text(response)
+
+        start = 0
+        while content[start:start + 1].isspace():
+            start += 1
+        if content.startswith(MAGIC_JSON_PREFIX, start):
+            start += len(MAGIC_JSON_PREFIX)
+
+        if len(content) - start < 64 and not content[start:].strip():
+            return GerritClient._decode_text(response)
+
+        try:
+            return jsonlib.loads(memoryview(content)[start:] if start else content)
+        except ValueError:
+            raise ValueError(
+                "Invalid json content: {}".format(GerritClient._decode_text(response))
+            )
+
+    @staticmethod
+    def _decode_json_text(response):
+        """
+        JSON content in another charset than UTF-8 is decoded to text first.
+
+        :param response:
+        :return:
+        """
+        content = GerritClient._decode_text(response)
+        if not content:
             return content
-        if content.startswith(magic_json_prefix):
-            index = len(magic_json_prefix)
-            content = content[index:]
+        if content.startswith(MAGIC_JSON_PREFIX.decode("ascii")):
+            content = content[len(MAGIC_JSON_PREFIX):]
         try:
-            return json.loads(content)
+            return jsonlib.loads(content)
         except ValueError:
             raise ValueError("Invalid json content: {}".format(content))
 
+    @staticmethod
+    def _decode_text(response):
+        """
+        :param response:
+        :return:
+        """
+        content = response.content.strip()
+        if response.encoding:
+            content = content.decode(response.encoding)
+        return content
+
     @property
     def config(self):
         """
@@ -145,10 +414,11 @@ class GerritClient(object):
     def version(self):
         """
         get the version of the Gerrit server.
+        The version is cached for version_cache_ttl seconds, see gerrit.features.refresh()
 
         :return:
         """
-        return self.config.get_version()
+        return self.features.version
 
     @property
     def server(self):
@@ -1,7 +1,6 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 # @Author: Jialiang Shi
-from packaging.version import parse
 from gerrit.utils.models import BaseModel
 from gerrit.accounts.emails import Emails
 from gerrit.accounts.ssh_keys import SSHKeys
@@ -10,22 +9,21 @@ from gerrit.utils.exceptions import UnsupportMethod
 
 
 class GerritAccount(BaseModel):
-    def __init__(self, **kwargs):
-        super(GerritAccount, self).__init__(**kwargs)
-        self.attributes = [
-            "username",
-            "registered_on",
-            "_account_id",
-            "name",
-            "email",
-            "secondary_emails",
-            "avatars",
-            "_more_accounts",
-            "inactive",
-            "tags",
-            "display_name",
-            "gerrit",
-        ]
+    attributes = (
+        "username",
+        "registered_on",
+        "_account_id",
+        "name",
+        "email",
+        "secondary_emails",
+        "avatars",
+        "_more_accounts",
+        "inactive",
+        "tags",
+        "display_name",
+        "gerrit",
+    )
+    __slots__ = attributes
 
     def set_name(self, input_):
         """
@@ -151,8 +149,7 @@ class GerritAccount(BaseModel):
           https://gerrit-review.googlesource.com/Documentation/rest-api-accounts.html#display-name-input
         :return:
         """
-        version = self.gerrit.version
-        if parse(version) < parse("3.2.0"):
+        if not self.gerrit.features.supports("account_display_name"):
             raise UnsupportMethod("The server does not support this method")
 
         endpoint = "/accounts/%s/displayname" % self.username
@@ -162,8 +159,8 @@ class GerritAccount(BaseModel):
         )
         result = self.gerrit.decode_response(response)
 
-        # update account model's displayname
-        self.displayname = result
+        # update account model's display_name
+        self.display_name = result
         return result
 
     def get_active(self):
@@ -2,23 +2,40 @@
 # -*- coding:utf-8 -*-
 # @Author: Jialiang Shi
 from gerrit.accounts.account import GerritAccount
+from gerrit.accounts.resolver import AccountResolver
+from gerrit.utils.exceptions import NotFoundError
+from gerrit.utils import endpoints
 
 
 class GerritAccounts(object):
     def __init__(self, gerrit):
         self.gerrit = gerrit
 
-    def search(self, query):
+    @property
+    def resolver(self):
+        """
+        The account resolver of the client, or one batching the lookups of a single call
+        if the client has none.
+
+        :return:
+        """
+        resolver = self.gerrit.account_resolver
+        if resolver is None:
+            resolver = AccountResolver(self.gerrit, ttl=None)
+        return resolver
+
+    def search(self, query, columnar=False):
         """
         Queries accounts visible to the caller.
 
         :param query:
+        :param columnar: return a ColumnarResultSet instead of a list of models
         :return:
         """
-        endpoint = "/accounts/?suggest&q=%s" % query
+        endpoint = endpoints.ACCOUNTS_SUGGEST % query
         response = self.gerrit.requester.get(self.gerrit.get_endpoint_url(endpoint))
         result = self.gerrit.decode_response(response)
-        return GerritAccount.parse_list(result, gerrit=self.gerrit)
+        return GerritAccount.parse_list(result, columnar=columnar, gerrit=self.gerrit)
 
     def whoami(self):
         """
@@ -26,10 +43,18 @@ class GerritAccounts(object):
 
         :return:
         """
-        endpoint = "/accounts/self"
+        resolver = self.gerrit.account_resolver
+        if resolver is not None:
+            account = resolver.get("self")
+            if account is not None:
+                return account
+
+        endpoint = endpoints.ACCOUNT_SELF_DETAIL
         response = self.gerrit.requester.get(self.gerrit.get_endpoint_url(endpoint))
         result = self.gerrit.decode_response(response)
-        return self.get(result.get("username"))
+        if resolver is not None:
+            return resolver.add(result, "self")
+        return GerritAccount.parse(result, gerrit=self.gerrit)
 
     def get(self, username):
         """
@@ -38,10 +63,52 @@ class GerritAccounts(object):
         :param username:
         :return:
         """
-        endpoint = "/accounts/%s/detail" % username
-        response = self.gerrit.requester.get(self.gerrit.get_endpoint_url(endpoint))
-        result = self.gerrit.decode_response(response)
-        return GerritAccount.parse(result, gerrit=self.gerrit)
+        registry = self.gerrit.registry
+        if registry is not None:
+            account = registry.get("accounts", username)
+            if account is not None:
+                return account
+
+        resolver = self.gerrit.account_resolver
+        if resolver is not None:
+            account = resolver.get(username)
+            if account is not None:
+                return account
+
+        negative_cache = self.gerrit.negative_cache
+        if negative_cache is not None:
+            negative_cache.check("accounts", username)
+
+        snapshot = self.gerrit.snapshot
+        result = snapshot.get("accounts", username) if snapshot is not None else None
+        if result is None:
+            endpoint = endpoints.ACCOUNT_DETAIL % username
+            try:
+                response = self.gerrit.requester.get(
+                    self.gerrit.get_endpoint_url(endpoint)
+                )
+            except NotFoundError as error:
+                if negative_cache is not None:
+                    negative_cache.add(error, "accounts", username)
+                raise
+            result = self.gerrit.decode_response(response)
+            if snapshot is not None and isinstance(result, dict):
+                snapshot.add(
+                    "accounts",
+                    result,
+                    result.get("_account_id"),
+                    result.get("username"),
+                    result.get("email"),
+                )
+        if resolver is not None:
+            account = resolver.add(result, username)
+        else:
+            account = GerritAccount.parse(result, gerrit=self.gerrit)
+        if registry is not None and account is not None:
+            registry.register(
+                "accounts", account, username, account._account_id, account.username
+            )
+        return account
 
     def create(self, username, input_):
         """
@@ -65,10 +132,12 @@ class GerritAccounts(object):
           https://gerrit-review.googlesource.com/Documentation/rest-api-accounts.html#account-input
         :return:
         """
-        endpoint = "/accounts/%s" % username
+        endpoint = endpoints.ACCOUNT % username
         base_url = self.gerrit.get_endpoint_url(endpoint)
         response = self.gerrit.requester.put(
             base_url, json=input_, headers=self.gerrit.default_headers
         )
         result = self.gerrit.decode_response(response)
+        if self.gerrit.negative_cache is not None:
+            self.gerrit.negative_cache.discard("accounts", username)
         return GerritAccount.parse(result, gerrit=self.gerrit)
@@ -5,15 +5,14 @@ from gerrit.utils.models import BaseModel
 
 
 class Email(BaseModel):
-    def __init__(self, **kwargs):
-        super(Email, self).__init__(**kwargs)
-        self.attributes = [
-            "email",
-            "preferred",
-            "pending_confirmation",
-            "username",
-            "gerrit",
-        ]
+    attributes = (
+        "email",
+        "preferred",
+        "pending_confirmation",
+        "username",
+        "gerrit",
+    )
+    __slots__ = attributes
 
     def delete(self):
         """
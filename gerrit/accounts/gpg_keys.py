@@ -5,18 +5,17 @@ from gerrit.utils.models import BaseModel
 
 
 class GPGKey(BaseModel):
-    def __init__(self, **kwargs):
-        super(GPGKey, self).__init__(**kwargs)
-        self.attributes = [
-            "id",
-            "fingerprint",
-            "user_ids",
-            "key",
-            "status",
-            "problems",
-            "username",
-            "gerrit",
-        ]
+    attributes = (
+        "id",
+        "fingerprint",
+        "user_ids",
+        "key",
+        "status",
+        "problems",
+        "username",
+        "gerrit",
+    )
+    __slots__ = attributes
 
     def delete(self):
         """
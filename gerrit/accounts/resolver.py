@@ -0,0 +1,199 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+import time
+import threading
+from gerrit.accounts.account import GerritAccount
+from gerrit.utils.concurrency import bounded_map
+from gerrit.utils.registry import get_resource
+from gerrit.utils import endpoints
+
+try:
+    from urllib.parse import unquote
+except ImportError:
+    from urllib import unquote
+
+
+class AccountResolver(object):
+    """
+    Client wide map of the usernames, emails and account ids to the accounts,
+    one GerritAccount per account whatever the id it was resolved from.
+
+    .. code-block:: python
+
+        gerrit = GerritClient(base_url=url, username=username, password=password, account_resolver=True)
+        members = gerrit.groups.get("Administrators").list_members()
+        owner = gerrit.accounts.get(members[0].email)  # no request
+
+    The accounts not known yet are fetched in batches, with one account query
+    of up to batch_size accounts per request (see resolve_many()). An account
+    is kept for ttl seconds, and forgotten when it is mutated through the client.
+    """
+
+    def __init__(self, gerrit=None, ttl=300.0, batch_size=50):
+        """
+        :param gerrit: the GerritClient, set by the GerritClient
+        :param ttl: seconds an account is kept, None for ever
+        :param batch_size: maximum number of accounts queried by one request
+        """
+        self.gerrit = gerrit
+        self.ttl = ttl
+        self.batch_size = batch_size
+        self._accounts = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(id_):
+        """
+        :param id_: username, email or account id, url-encoded or not
+        :return:
+        """
+        return unquote(str(id_))
+
+    @staticmethod
+    def make_query(id_):
+        """
+        :param id_: username, email or account id
+        :return: the account query term matching the id
+        """
+        id_ = str(id_)
+        if id_.isdigit():
+            return id_
+        if "@" in id_:
+            return "email:%s" % id_
+        return "username:%s" % id_
+
+    def get(self, id_):
+        """
+        :param id_: username, email or account id
+        :return: the account, None if unknown or expired
+        """
+        key = self.make_key(id_)
+        with self._lock:
+            entry = self._accounts.get(key)
+            if entry is None:
+                return None
+            account, expires = entry
+            if expires is not None and expires < time.time():
+                self._forget(account)
+                return None
+            return account
+
+    def add(self, data, *ids):
+        """
+        Build the account of an AccountInfo entity, and map its ids to it.
+
+        :param data: the AccountInfo entity
+        :param ids: other ids of the account, e.g. 'self'
+        :return: the account
+        """
+        account = GerritAccount.parse(data, gerrit=self.gerrit)
+        if account is None:
+            return account
+
+        keys = [data.get("_account_id"), data.get("username"), data.get("email")]
+        expires = time.time() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            for id_ in keys + list(ids):
+                if id_ is not None:
+                    self._accounts[self.make_key(id_)] = (account, expires)
+        snapshot = self.gerrit.snapshot
+        if snapshot is not None:
+            # only the ids of the entity itself, an alias like 'self' is
+            # relative to the account of the client
+            snapshot.add("accounts", data, *keys)
+        return account
+
+    def resolve(self, id_):
+        """
+        :param id_: username, email or account id
+        :return: the account, fetched if unknown
+        """
+        account = self.get(id_)
+        if account is None:
+            endpoint = endpoints.ACCOUNT_DETAIL % id_
+            response = self.gerrit.requester.get(self.gerrit.get_endpoint_url(endpoint))
+            result = self.gerrit.decode_response(response)
+            account = self.add(result, id_)
+        return account
+
+    def resolve_many(self, ids, options=("DETAILS",), max_workers=1):
+        """
+        Resolve accounts, querying the unknown ones in batches:
+        '/accounts/?q=1000096 OR username:jdoe OR email:jroe@example.com&o=DETAILS'
+
+        :param ids: usernames, emails or account ids
+        :param options: the account query options, e.g. ['DETAILS', 'ALL_EMAILS']
+        :param max_workers: maximum number of batches queried concurrently
+        :return: a dict of the accounts by id, without the ids not found
+        """
+        accounts = {}
+        missing = []
+        seen = set()
+        for id_ in ids:
+            account = self.get(id_)
+            if account is not None:
+                accounts[id_] = account
+            elif id_ not in seen:
+                seen.add(id_)
+                missing.append(id_)
+
+        def query(batch):
+            params = {"q": " OR ".join(self.make_query(id_) for id_ in batch)}
+            if options:
+                params["o"] = list(options)
+            response = self.gerrit.requester.get(
+                self.gerrit.get_endpoint_url(endpoints.ACCOUNTS), params=params
+            )
+            return self.gerrit.decode_response(response)
+
+        batches = [
+            missing[i:i + self.batch_size]
+            for i in range(0, len(missing), self.batch_size)
+        ]
+        for result in bounded_map(query, batches, max_workers):
+            for data in result:
+                self.add(data)
+        for id_ in missing:
+            account = self.get(id_)
+            if account is not None:
+                accounts[id_] = account
+        return accounts
+
+    def discard(self, id_):
+        """
+        Forget an account, under all its ids.
+
+        :param id_:
+        :return:
+        """
+        with self._lock:
+            entry = self._accounts.get(self.make_key(id_))
+            if entry is not None:
+                self._forget(entry[0])
+
+    def invalidate_url(self, method, url):
+        """
+        Forget the account mutated by a request.
+
+        :param method: http method
+        :param url:
+        :return:
+        """
+        if method.upper() in ("GET", "HEAD"):
+            return
+        resource = get_resource(url)
+        if resource is not None and resource[0] == "accounts":
+            self.discard(resource[1])
+
+    def clear(self):
+        with self._lock:
+            self._accounts.clear()
+
+    def __len__(self):
+        with self._lock:
+            return len(set(id(account) for account, _ in self._accounts.values()))
+
+    def _forget(self, account):
+        for key in [k for k, v in self._accounts.items() if v[0] is account]:
+            del self._accounts[key]
@@ -5,18 +5,17 @@ from gerrit.utils.models import BaseModel
 
 
 class SSHKey(BaseModel):
-    def __init__(self, **kwargs):
-        super(SSHKey, self).__init__(**kwargs)
-        self.attributes = [
-            "seq",
-            "ssh_public_key",
-            "encoded_key",
-            "algorithm",
-            "comment",
-            "valid",
-            "username",
-            "gerrit",
-        ]
+    attributes = (
+        "seq",
+        "ssh_public_key",
+        "encoded_key",
+        "algorithm",
+        "comment",
+        "valid",
+        "username",
+        "gerrit",
+    )
+    __slots__ = attributes
 
     def delete(self):
         """
@@ -0,0 +1,188 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from gerrit import GerritClient
+from gerrit.aio.requester import AsyncRequester
+from gerrit.aio.config import AsyncGerritConfig
+from gerrit.aio.projects import AsyncGerritProjects
+from gerrit.aio.accounts import AsyncGerritAccounts
+from gerrit.aio.groups import AsyncGerritGroups
+from gerrit.aio.plugins import AsyncGerritPlugins
+from gerrit.aio.changes import AsyncGerritChanges
+
+
+class AsyncGerritClient(object):
+    """
+    Asyncio flavour of :class:`gerrit.GerritClient`.
+
+    The methods of the top level collections (changes, projects, accounts, groups,
+    config and plugins) are coroutines running on aiohttp, so one event loop can
+    keep many requests in flight. Their endpoints (see gerrit.utils.endpoints) and
+    the response decoding are shared with the sync client.
+
+    The nested resources are not mirrored: the models returned (GerritChange,
+    GerritProject, ...) are bound to ``self.sync``, a :class:`gerrit.GerritClient`
+    built with the same settings, and their methods are blocking calls. Await them
+    through run(), which calls them in a pool of max_workers threads instead of
+    blocking the event loop:
+
+    .. code-block:: python
+
+        async with AsyncGerritClient(base_url, username, password) as gerrit:
+            changes = await gerrit.changes.search("q=status:open")
+            reviewers = await gerrit.run(changes[0].reviewers.list)
+
+    """
+
+    default_headers = GerritClient.default_headers
+
+    def __init__(
+        self,
+        base_url,
+        username,
+        password,
+        ssl_verify=True,
+        cert=None,
+        timeout=60,
+        max_connections=100,
+        version_cache_ttl=3600,
+        max_workers=10,
+    ):
+        """
+        :param base_url: gerrit url
+        :param username:
+        :param password:
+        :param ssl_verify:
+        :param cert:
+        :param timeout:
+        :param max_connections: maximum number of connections of the aiohttp session
+        :param version_cache_ttl: seconds the server version is cached, None for ever
+        :param max_workers: number of threads running the blocking calls of run()
+        """
+        self.sync = GerritClient(
+            base_url=base_url,
+            username=username,
+            password=password,
+            ssl_verify=ssl_verify,
+            cert=cert,
+            timeout=timeout,
+            version_cache_ttl=version_cache_ttl,
+        )
+        self.features = self.sync.features
+
+        self.requester = AsyncRequester(
+            username=username,
+            password=password,
+            ssl_verify=ssl_verify,
+            cert=cert,
+            timeout=timeout,
+            max_connections=max_connections,
+        )
+
+        self.max_workers = max_workers
+        self._executor = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def close(self):
+        """
+        Close the underlying http session.
+
+        :return:
+        """
+        await self.requester.close()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    async def run(self, func, *args, **kwargs):
+        """
+        Call a blocking method of the sync client or of a model in a worker thread.
+
+        .. code-block:: python
+
+            change = await gerrit.changes.get(id_)
+            await gerrit.run(change.abandon)
+            review = await gerrit.run(change.get_revision("current").get_review)
+
+        :param func: the blocking callable
+        :param args:
+        :param kwargs:
+        :return: the result of func
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs)
+        )
+
+    def get_endpoint_url(self, endpoint):
+        """
+        Return the complete url including host and port for a given endpoint.
+        :param endpoint: service endpoint as str
+        :return: complete url (including host and port) as str
+        """
+        return self.sync.get_endpoint_url(endpoint)
+
+    decode_response = staticmethod(GerritClient.decode_response)
+
+    @property
+    def config(self):
+        """
+        Config related REST APIs
+
+        :return:
+        """
+        return AsyncGerritConfig(gerrit=self)
+
+    @property
+    def projects(self):
+        """
+        Project related REST APIs
+        :return:
+        """
+        return AsyncGerritProjects(gerrit=self)
+
+    @property
+    def changes(self):
+        """
+        Change related REST APIs
+
+        :return:
+        """
+        return AsyncGerritChanges(gerrit=self)
+
+    @property
+    def accounts(self):
+        """
+        Account related REST APIs
+
+        :return:
+        """
+        return AsyncGerritAccounts(gerrit=self)
+
+    @property
+    def groups(self):
+        """
+        Group related REST APIs
+
+        :return:
+        """
+        return AsyncGerritGroups(gerrit=self)
+
+    @property
+    def plugins(self):
+        """
+        Plugin related REST APIs
+
+        :return:
+        """
+        return AsyncGerritPlugins(gerrit=self)
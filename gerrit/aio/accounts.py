@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+from gerrit.accounts.account import GerritAccount
+from gerrit.utils import endpoints
+
+
+class AsyncGerritAccounts(object):
+    def __init__(self, gerrit):
+        self.gerrit = gerrit
+
+    async def search(self, query, columnar=False):
+        """
+        Queries accounts visible to the caller.
+
+        :param query:
+        :param columnar: return a ColumnarResultSet instead of a list of models
+        :return:
+        """
+        endpoint = endpoints.ACCOUNTS_SUGGEST % query
+        response = await self.gerrit.requester.get(
+            self.gerrit.get_endpoint_url(endpoint)
+        )
+        result = self.gerrit.decode_response(response)
+        return GerritAccount.parse_list(
+            result, columnar=columnar, gerrit=self.gerrit.sync
+        )
+
+    async def whoami(self):
+        """
+        who am i
+
+        :return:
+        """
+        endpoint = endpoints.ACCOUNT_SELF_DETAIL
+        response = await self.gerrit.requester.get(
+            self.gerrit.get_endpoint_url(endpoint)
+        )
+        result = self.gerrit.decode_response(response)
+        return GerritAccount.parse(result, gerrit=self.gerrit.sync)
+
+    async def get(self, username):
+        """
+        Returns an account
+
+        :param username:
+        :return:
+        """
+        endpoint = endpoints.ACCOUNT_DETAIL % username
+        response = await self.gerrit.requester.get(
+            self.gerrit.get_endpoint_url(endpoint)
+        )
+        result = self.gerrit.decode_response(response)
+        return GerritAccount.parse(result, gerrit=self.gerrit.sync)
+
+    async def create(self, username, input_):
+        """
+        Creates a new account.
+
+        :param username: account username
+        :param input_: the AccountInput entity,
+          https://gerrit-review.googlesource.com/Documentation/rest-api-accounts.html#account-input
+        :return:
+        """
+        endpoint = endpoints.ACCOUNT % username
+        base_url = self.gerrit.get_endpoint_url(endpoint)
+        response = await self.gerrit.requester.put(
+            base_url, json=input_, headers=self.gerrit.default_headers
+        )
+        result = self.gerrit.decode_response(response)
+        return GerritAccount.parse(result, gerrit=self.gerrit.sync)
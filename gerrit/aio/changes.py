@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+from gerrit.changes.change import GerritChange
+from gerrit.utils import endpoints
+
+
+class AsyncGerritChanges(object):
+    def __init__(self, gerrit):
+        self.gerrit = gerrit
+
+    async def search(self, query, lazy=False, columnar=False):
+        """
+        Queries changes visible to the caller.
+
+        :param query: the query string
+        :param lazy: build the attributes of the changes on first access
+        :param columnar: return a ColumnarResultSet instead of a list of models
+        :return:
+        """
+        endpoint = endpoints.CHANGES_QUERY % query
+        response = await self.gerrit.requester.get(
+            self.gerrit.get_endpoint_url(endpoint)
+        )
+        result = self.gerrit.decode_response(response)
+        return GerritChange.parse_list(
+            result, lazy=lazy, columnar=columnar, gerrit=self.gerrit.sync
+        )
+
+    async def get(self, id_, lazy=False):
+        """
+        Retrieves a change.
+
+        :param id_: change id
+        :param lazy: build the attributes of the change on first access
+        :return:
+        """
+        endpoint = endpoints.CHANGE % id_
+        response = await self.gerrit.requester.get(
+            self.gerrit.get_endpoint_url(endpoint)
+        )
+        result = self.gerrit.decode_response(response)
+        return GerritChange.parse(result, lazy=lazy, gerrit=self.gerrit.sync)
+
+    async def create(self, input_):
+        """
+        create a change
+
+        :param input_: the ChangeInput entity,
+          https://gerrit-review.googlesource.com/Documentation/rest-api-changes.html#change-input
+        :return:
+        """
+        endpoint = endpoints.CHANGES
+        base_url = self.gerrit.get_endpoint_url(endpoint)
+        response = await self.gerrit.requester.post(
+            base_url, json=input_, headers=self.gerrit.default_headers
+        )
+        result = self.gerrit.decode_response(response)
+        return GerritChange.parse(result, gerrit=self.gerrit.sync)
+
+    async def delete(self, id_):
+        """
+        Deletes a change.
+
+        :param id_: change id
+        :return:
+        """
+        endpoint = endpoints.CHANGE % id_
+        await self.gerrit.requester.delete(self.gerrit.get_endpoint_url(endpoint))
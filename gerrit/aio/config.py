@@ -0,0 +1,221 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+from gerrit.utils import endpoints
+
+
+class AsyncGerritConfig(object):
+    def __init__(self, gerrit):
+        self.gerrit = gerrit
+
+    async def get_version(self):
+        """
+        get the version of the Gerrit server.
+
+        :return:
+        """
+        endpoint = endpoints.CONFIG_VERSION
+        response = await self.gerrit.requester.get(
+            self.gerrit.get_endpoint_url(endpoint)
+        )
+        result = self.gerrit.decode_response(response)
+        return result
+
+    async def get_server_info(self):
+        """
+        get the information about the Gerrit server configuration.
+
+        :return:
+        """
+        endpoint = endpoints.CONFIG_INFO
+        response = await self.gerrit.requester.get(
+            self.gerrit.get_endpoint_url(endpoint)
+        )
+        result = self.gerrit.decode_response(response)
+        return result
+
+    async def check_consistency(self, input_):
+        """
+        Runs consistency checks and returns detected problems.
+
+        :param input_: the ConsistencyCheckInput entity,
+          https://gerrit-review.googlesource.com/Documentation/rest-api-config.html#consistency-check-input
+        :return:
+        """
+        endpoint = endpoints.CONFIG_CHECK_CONSISTENCY
+        base_url = self.gerrit.get_endpoint_url(endpoint)
+        response = await self.gerrit.requester.post(
+            base_url, json=input_, headers=self.gerrit.default_headers
+        )
+        result = self.gerrit.decode_response(response)
+        return result
+
+    async def reload_config(self):
+        """
+        Reloads the gerrit.config configuration.
+
+        :return:
+        """
+        endpoint = endpoints.CONFIG_RELOAD
+        response = await self.gerrit.requester.post(
+            self.gerrit.get_endpoint_url(endpoint)
+        )
+        result = self.gerrit.decode_response(response)
+        return result
+
+    async def confirm_email(self, input_):
+        """
+        Confirms that the user owns an email address.
+
+        :param input_: the EmailConfirmationInput entity,
+          https://gerrit-review.googlesource.com/Documentation/rest-api-config.html#email-confirmation-input
+        :return:
+        """
+        endpoint = endpoints.CONFIG_CONFIRM_EMAIL
+        base_url = self.gerrit.get_endpoint_url(endpoint)
+        await self.gerrit.requester.put(
+            base_url, json=input_, headers=self.gerrit.default_headers
+        )
+
+    async def get_summary(self, option=None):
+        """
+        Retrieves a summary of the current server state.
+
+        :param option: query option.such as jvm or gc
+        :return:
+        """
+        endpoint = endpoints.CONFIG_SUMMARY
+        if option is not None:
+            endpoint += "?%s" % option
+        response = await self.gerrit.requester.get(
+            self.gerrit.get_endpoint_url(endpoint)
+        )
+        result = self.gerrit.decode_response(response)
+        return result
+
+    async def list_capabilities(self):
+        """
+        Lists the capabilities that are available in the system.
+
+        :return:
+        """
+        endpoint = endpoints.CONFIG_CAPABILITIES
+        response = await self.gerrit.requester.get(
+            self.gerrit.get_endpoint_url(endpoint)
+        )
+        result = self.gerrit.decode_response(response)
+        return result
+
+    async def get_top_menus(self):
+        """
+        Returns the list of additional top menu entries.
+
+        :return:
+        """
+        endpoint = endpoints.CONFIG_TOP_MENUS
+        response = await self.gerrit.requester.get(
+            self.gerrit.get_endpoint_url(endpoint)
+        )
+        result = self.gerrit.decode_response(response)
+        return result
+
+    async def get_default_user_preferences(self):
+        """
+        Returns the default user preferences for the server.
+
+        :return:
+        """
+        endpoint = endpoints.CONFIG_USER_PREFERENCES
+        response = await self.gerrit.requester.get(
+            self.gerrit.get_endpoint_url(endpoint)
+        )
+        result = self.gerrit.decode_response(response)
+        return result
+
+    async def set_default_user_preferences(self, input_):
+        """
+        Sets the default user preferences for the server.
+
+        :param input_: the PreferencesInput entity,
+          https://gerrit-review.googlesource.com/Documentation/rest-api-accounts.html#preferences-input
+        :return:
+        """
+        endpoint = endpoints.CONFIG_USER_PREFERENCES
+        base_url = self.gerrit.get_endpoint_url(endpoint)
+        response = await self.gerrit.requester.put(
+            base_url, json=input_, headers=self.gerrit.default_headers
+        )
+        result = self.gerrit.decode_response(response)
+        return result
+
+    async def get_default_diff_preferences(self):
+        """
+        Returns the default diff preferences for the server.
+
+        :return:
+        """
+        endpoint = endpoints.CONFIG_DIFF_PREFERENCES
+        response = await self.gerrit.requester.get(
+            self.gerrit.get_endpoint_url(endpoint)
+        )
+        result = self.gerrit.decode_response(response)
+        return result
+
+    async def set_default_diff_preferences(self, input_):
+        """
+        Sets the default diff preferences for the server.
+
+        :param input_: the DiffPreferencesInput entity,
+          https://gerrit-review.googlesource.com/Documentation/rest-api-accounts.html#diff-preferences-input
+        :return:
+        """
+        endpoint = endpoints.CONFIG_DIFF_PREFERENCES
+        base_url = self.gerrit.get_endpoint_url(endpoint)
+        response = await self.gerrit.requester.put(
+            base_url, json=input_, headers=self.gerrit.default_headers
+        )
+        result = self.gerrit.decode_response(response)
+        return result
+
+    async def get_default_edit_preferences(self):
+        """
+        Returns the default edit preferences for the server.
+
+        :return:
+        """
+        endpoint = endpoints.CONFIG_EDIT_PREFERENCES
+        response = await self.gerrit.requester.get(
+            self.gerrit.get_endpoint_url(endpoint)
+        )
+        result = self.gerrit.decode_response(response)
+        return result
+
+    async def set_default_edit_preferences(self, input_):
+        """
+        Sets the default edit preferences for the server.
+
+        :param input_: the EditPreferencesInfo entity,
+          https://gerrit-review.googlesource.com/Documentation/rest-api-accounts.html#edit-preferences-input
+        :return:
+        """
+        endpoint = endpoints.CONFIG_EDIT_PREFERENCES
+        base_url = self.gerrit.get_endpoint_url(endpoint)
+        response = await self.gerrit.requester.put(
+            base_url, json=input_, headers=self.gerrit.default_headers
+        )
+        result = self.gerrit.decode_response(response)
+        return result
+
+    async def index_changes(self, input_):
+        """
+        Index a set of changes
+
+        :param input_: the IndexChangesInput entity,
+          https://gerrit-review.googlesource.com/Documentation/rest-api-config.html#index-changes-input
+        :return:
+        """
+        endpoint = endpoints.CONFIG_INDEX_CHANGES
+        base_url = self.gerrit.get_endpoint_url(endpoint)
+        await self.gerrit.requester.post(
+            base_url, json=input_, headers=self.gerrit.default_headers
+        )
@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+from gerrit.groups.group import GerritGroup
+from gerrit.utils import endpoints
+
+
+class AsyncGerritGroups(object):
+    def __init__(self, gerrit):
+        self.gerrit = gerrit
+
+    async def list(self, columnar=False):
+        """
+        Lists the groups accessible by the caller.
+
+        :param columnar: return a ColumnarResultSet instead of a list of models
+        :return:
+        """
+        endpoint = endpoints.GROUPS
+        response = await self.gerrit.requester.get(
+            self.gerrit.get_endpoint_url(endpoint)
+        )
+        result = self.gerrit.decode_response(response)
+
+        groups = []
+        for key, value in result.items():
+            group = value
+            group.update({"name": key})
+            groups.append(group)
+
+        return GerritGroup.parse_list(
+            groups, columnar=columnar, gerrit=self.gerrit.sync
+        )
+
+    async def search(self, name, columnar=False):
+        """
+        Query Groups
+
+        :param name: group name
+        :param columnar: return a ColumnarResultSet instead of a list of models
+        :return:
+        """
+        features = self.gerrit.features
+        if features.is_stale():
+            features.update(await self.gerrit.config.get_version())
+
+        if not features.supports("groups_query"):
+            endpoint = endpoints.GROUPS_QUERY2 % name
+        else:
+            endpoint = endpoints.GROUPS_QUERY % name
+
+        response = await self.gerrit.requester.get(
+            self.gerrit.get_endpoint_url(endpoint)
+        )
+        result = self.gerrit.decode_response(response)
+        return GerritGroup.parse_list(
+            result, columnar=columnar, gerrit=self.gerrit.sync
+        )
+
+    async def get(self, id_):
+        """
+        Retrieves a group.
+
+        :param id_: group id
+        :return:
+        """
+        endpoint = endpoints.GROUP % id_
+        response = await self.gerrit.requester.get(
+            self.gerrit.get_endpoint_url(endpoint)
+        )
+        result = self.gerrit.decode_response(response)
+        return GerritGroup.parse(result, gerrit=self.gerrit.sync)
+
+    async def create(self, name, input_):
+        """
+        Creates a new Gerrit internal group.
+
+        :param name: group name
+        :param input_: the GroupInput entity,
+          https://gerrit-review.googlesource.com/Documentation/rest-api-groups.html#group-input
+        :return:
+        """
+        endpoint = endpoints.GROUP % name
+        base_url = self.gerrit.get_endpoint_url(endpoint)
+        response = await self.gerrit.requester.put(
+            base_url, json=input_, headers=self.gerrit.default_headers
+        )
+        result = self.gerrit.decode_response(response)
+        return GerritGroup.parse(result, gerrit=self.gerrit.sync)
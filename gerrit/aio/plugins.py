@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+from gerrit.plugins.plugins import GerritPlugin
+from gerrit.utils import endpoints
+
+
+class AsyncGerritPlugins(object):
+    def __init__(self, gerrit):
+        self.gerrit = gerrit
+
+    async def list(self):
+        """
+        Lists the plugins installed on the Gerrit server.
+
+        :return:
+        """
+        endpoint = endpoints.PLUGINS_ALL
+        response = await self.gerrit.requester.get(
+            self.gerrit.get_endpoint_url(endpoint)
+        )
+        result = self.gerrit.decode_response(response)
+        return GerritPlugin.parse_list(list(result.values()), gerrit=self.gerrit.sync)
+
+    async def get(self, id_):
+        """
+        Retrieves a plugin.
+
+        :param id_: plugin id
+        :return:
+        """
+        endpoint = endpoints.PLUGIN_STATUS % id_
+        response = await self.gerrit.requester.get(
+            self.gerrit.get_endpoint_url(endpoint)
+        )
+        result = self.gerrit.decode_response(response)
+        return GerritPlugin.parse(result, gerrit=self.gerrit.sync)
+
+    async def install(self, id_, input_):
+        """
+        Installs a new plugin on the Gerrit server.
+
+        :param id_: plugin id
+        :param input_: the PluginInput entity,
+          https://gerrit-review.googlesource.com/Documentation/rest-api-plugins.html#plugin-input
+        :return:
+        """
+        endpoint = endpoints.PLUGIN_JAR % id_
+        base_url = self.gerrit.get_endpoint_url(endpoint)
+        response = await self.gerrit.requester.put(
+            base_url, json=input_, headers=self.gerrit.default_headers
+        )
+        result = self.gerrit.decode_response(response)
+        return GerritPlugin.parse(result, gerrit=self.gerrit.sync)
@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+from gerrit.projects.project import GerritProject
+from gerrit.utils import endpoints
+
+
+class AsyncGerritProjects(object):
+    def __init__(self, gerrit):
+        self.gerrit = gerrit
+
+    async def list(self, columnar=False):
+        """
+        Lists the projects accessible by the caller.
+
+        :param columnar: return a ColumnarResultSet instead of a list of models
+        :return:
+        """
+        endpoint = endpoints.PROJECTS_ALL
+        response = await self.gerrit.requester.get(
+            self.gerrit.get_endpoint_url(endpoint)
+        )
+        result = self.gerrit.decode_response(response)
+        return GerritProject.parse_list(
+            list(result.values()), columnar=columnar, gerrit=self.gerrit.sync
+        )
+
+    async def search(self, query, columnar=False):
+        """
+        Queries projects visible to the caller.
+
+        :param query:
+        :param columnar: return a ColumnarResultSet instead of a list of models
+        :return:
+        """
+        endpoint = endpoints.PROJECTS_QUERY % query
+        response = await self.gerrit.requester.get(
+            self.gerrit.get_endpoint_url(endpoint)
+        )
+        result = self.gerrit.decode_response(response)
+        return GerritProject.parse_list(
+            result, columnar=columnar, gerrit=self.gerrit.sync
+        )
+
+    async def get(self, project_name):
+        """
+        Retrieves a project.
+
+        :param project_name: the name of the project
+        :return:
+        """
+        endpoint = endpoints.PROJECT % project_name
+        response = await self.gerrit.requester.get(
+            self.gerrit.get_endpoint_url(endpoint)
+        )
+        result = self.gerrit.decode_response(response)
+        return GerritProject.parse(result, gerrit=self.gerrit.sync)
+
+    async def create(self, project_name, input_):
+        """
+        Creates a new project.
+
+        :param project_name: the name of the project
+        :param input_: the ProjectInput entity,
+          https://gerrit-review.googlesource.com/Documentation/rest-api-projects.html#project-input
+        :return:
+        """
+        endpoint = endpoints.PROJECT % project_name
+        base_url = self.gerrit.get_endpoint_url(endpoint)
+        response = await self.gerrit.requester.put(
+            base_url, json=input_, headers=self.gerrit.default_headers
+        )
+        result = self.gerrit.decode_response(response)
+        return GerritProject.parse(result, gerrit=self.gerrit.sync)
+
+    async def delete(self, project_name):
+        """
+        Delete the project, requires delete-project plugin
+
+        :param project_name: project name
+        :return:
+        """
+        endpoint = endpoints.PROJECT_DELETE % project_name
+        await self.gerrit.requester.post(self.gerrit.get_endpoint_url(endpoint))
@@ -0,0 +1,212 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+import ssl
+from gerrit.utils.requester import Requester
+
+
+class AsyncResponse(object):
+    """
+    A fully read HTTP response. It exposes the same attributes as a
+    ``requests.Response`` (status_code, reason, url, headers, encoding, content)
+    so that ``Requester.confirm_status`` and ``GerritClient.decode_response``
+    can be shared by the sync and the async client.
+    """
+
+    def __init__(self, status_code, reason, url, headers, encoding, content):
+        self.status_code = status_code
+        self.reason = reason
+        self.url = url
+        self.headers = headers
+        self.encoding = encoding
+        self.content = content
+
+
+class AsyncRequester(object):
+    """
+    A class which carries out HTTP requests on an asyncio event loop, using
+    aiohttp as transport. It mirrors the interface of
+    :class:`gerrit.utils.requester.Requester`, but all the request methods are
+    coroutines.
+    """
+
+    def __init__(self, **kwargs):
+        """
+        :param kwargs:
+        """
+        try:
+            import aiohttp
+        except ImportError:
+            raise ImportError(
+                "AsyncGerritClient requires aiohttp, "
+                "install it with 'pip install python-gerrit-api[async]'"
+            )
+
+        self._aiohttp = aiohttp
+        timeout = 10
+        self.username = kwargs.get("username")
+        self.password = kwargs.get("password")
+        self.ssl_verify = kwargs.get("ssl_verify")
+        self.cert = kwargs.get("cert")
+        self.timeout = kwargs.get("timeout", timeout)
+        self.max_connections = kwargs.get("max_connections", 100)
+        self.session = None
+
+    def get_ssl_context(self):
+        """
+        Translate the requests style ssl_verify/cert settings into an aiohttp
+        ``ssl`` argument.
+
+        :return:
+        """
+        if self.ssl_verify is False:
+            return False
+
+        if isinstance(self.ssl_verify, str):
+            context = ssl.create_default_context(cafile=self.ssl_verify)
+        else:
+            context = ssl.create_default_context()
+
+        if self.cert:
+            if isinstance(self.cert, (tuple, list)):
+                context.load_cert_chain(*self.cert)
+            else:
+                context.load_cert_chain(self.cert)
+        return context
+
+    def get_session(self):
+        """
+        The aiohttp session has to be created inside a running event loop,
+        so it is built lazily on the first request.
+
+        :return:
+        """
+        if self.session is None or self.session.closed:
+            aiohttp = self._aiohttp
+            auth = None
+            if self.username and self.password:
+                auth = aiohttp.BasicAuth(self.username, self.password)
+
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections, ssl=self.get_ssl_context()
+            )
+            self.session = aiohttp.ClientSession(
+                auth=auth,
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        return self.session
+
+    async def request(self, method, url, **kwargs):
+        """
+        :param method: http method
+        :param url:
+        :param kwargs:
+        :return:
+        """
+        if kwargs.get("data") and kwargs.get("json"):
+            raise ValueError("Cannot use data and json together")
+
+        request_kwargs = {}
+        for key, value in kwargs.items():
+            if value is not None:
+                request_kwargs[key] = value
+
+        if Requester.AUTH_COOKIE:
+            headers = dict(request_kwargs.get("headers") or {})
+            headers.update({"Cookie": Requester.AUTH_COOKIE})
+            request_kwargs["headers"] = headers
+
+        session = self.get_session()
+        async with session.request(method, url, **request_kwargs) as res:
+            content = await res.read()
+            response = AsyncResponse(
+                status_code=res.status,
+                reason=res.reason,
+                url=str(res.url),
+                headers=res.headers,
+                encoding=res.charset,
+                content=content,
+            )
+        return Requester.confirm_status(response)
+
+    async def get(self, url, params=None, headers=None, allow_redirects=True):
+        """
+        :param url:
+        :param params:
+        :param headers:
+        :param allow_redirects:
+        :return:
+        """
+        return await self.request(
+            "GET",
+            url,
+            params=params,
+            headers=headers,
+            allow_redirects=allow_redirects,
+        )
+
+    async def post(
+        self, url, params=None, data=None, json=None, headers=None, allow_redirects=True
+    ):
+        """
+        :param url:
+        :param params:
+        :param data:
+        :param json:
+        :param headers:
+        :param allow_redirects:
+        :return:
+        """
+        return await self.request(
+            "POST",
+            url,
+            params=params,
+            data=data,
+            json=json,
+            headers=headers,
+            allow_redirects=allow_redirects,
+        )
+
+    async def put(
+        self, url, params=None, data=None, json=None, headers=None, allow_redirects=True
+    ):
+        """
+        :param url:
+        :param params:
+        :param data:
+        :param json:
+        :param headers:
+        :param allow_redirects:
+        :return:
+        """
+        return await self.request(
+            "PUT",
+            url,
+            params=params,
+            data=data,
+            json=json,
+            headers=headers,
+            allow_redirects=allow_redirects,
+        )
+
+    async def delete(self, url, headers=None, allow_redirects=True):
+        """
+        :param url:
+        :param headers:
+        :param allow_redirects:
+        :return:
+        """
+        return await self.request(
+            "DELETE", url, headers=headers, allow_redirects=allow_redirects
+        )
+
+    async def close(self):
+        """
+        Close the underlying aiohttp session.
+
+        :return:
+        """
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+        self.session = None
@@ -1,35 +1,44 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 # @Author: Jialiang Shi
-from packaging.version import parse
 from gerrit.changes.reviewers import Reviewers
 from gerrit.changes.revision import Revision
 from gerrit.changes.edit import Edit
-from gerrit.changes.messages import Messages
+from gerrit.changes.messages import Message, Messages
 from gerrit.utils.models import BaseModel
 from gerrit.utils.exceptions import UnsupportMethod
 
 
+def _parse_messages(change, value):
+    return Message.parse_list(value, change=change.id, gerrit=change.gerrit)
+
+
 class GerritChange(BaseModel):
-    def __init__(self, **kwargs):
-        super(GerritChange, self).__init__(**kwargs)
-        self.attributes = [
-            "id",
-            "project",
-            "branch",
-            "attention_set",
-            "change_id",
-            "subject",
-            "status",
-            "created",
-            "updated",
-            "mergeable",
-            "insertions",
-            "deletions",
-            "_number",
-            "owner",
-            "gerrit",
-        ]
+    attributes = (
+        "id",
+        "project",
+        "branch",
+        "attention_set",
+        "change_id",
+        "subject",
+        "status",
+        "created",
+        "updated",
+        "mergeable",
+        "insertions",
+        "deletions",
+        "_number",
+        "owner",
+        "current_revision",
+        "revisions",
+        "labels",
+        "_messages",
+        "gerrit",
+    )
+    __slots__ = attributes
+    # the 'messages' key of a ChangeInfo is shadowed by the messages property
+    aliases = {"_messages": "messages"}
+    nested = {"_messages": _parse_messages}
 
     def update(self, input_):
         """
@@ -324,8 +333,7 @@ class GerritChange(BaseModel):
 
         :return:
         """
-        version = self.gerrit.version
-        if parse(version) < parse("3.2.0"):
+        if not self.gerrit.features.supports("revert_submission"):
             raise UnsupportMethod("The server does not support this method")
 
         endpoint = "/changes/%s/revert_submission" % self.id
@@ -656,6 +664,13 @@ class GerritChange(BaseModel):
 
     @property
     def messages(self):
+        """
+        The messages of the change, listed by a request. The messages embedded in the
+        change when it was fetched (the MESSAGES option) are change._messages, a list
+        of Message built on first access, or None.
+
+        :return:
+        """
         return Messages(change=self.id, gerrit=self.gerrit)
 
     def get_edit(self):
@@ -706,8 +721,7 @@ class GerritChange(BaseModel):
 
         :return:
         """
-        version = self.gerrit.version
-        if parse(version) < parse("3.3.0"):
+        if not self.gerrit.features.supports("attention_set"):
             raise UnsupportMethod("The server does not support this method")
 
         endpoint = "/changes/%s/attention" % self.id
@@ -736,8 +750,7 @@ class GerritChange(BaseModel):
           https://gerrit-review.googlesource.com/Documentation/rest-api-changes.html#attention-set-input
         :return:
         """
-        version = self.gerrit.version
-        if parse(version) < parse("3.3.0"):
+        if not self.gerrit.features.supports("attention_set"):
             raise UnsupportMethod("The server does not support this method")
 
         endpoint = "/changes/%s/attention" % self.id
@@ -771,8 +784,7 @@ class GerritChange(BaseModel):
           https://gerrit-review.googlesource.com/Documentation/rest-api-changes.html#attention-set-input
         :return:
         """
-        version = self.gerrit.version
-        if parse(version) < parse("3.3.0"):
+        if not self.gerrit.features.supports("attention_set"):
             raise UnsupportMethod("The server does not support this method")
 
         if input_ is None:
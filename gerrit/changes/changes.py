@@ -1,35 +1,124 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 # @Author: Jialiang Shi
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from urllib.parse import parse_qsl, urlencode
+except ImportError:
+    from urllib import urlencode
+    from urlparse import parse_qsl
+
 from gerrit.changes.change import GerritChange
+from gerrit.utils import endpoints
+
+# parameters and operator of the query which conflict with the paging of iter_search()
+_PAGING_PARAMETERS = ("n", "S", "start")
+_LIMIT_OPERATOR = re.compile(r"(?:^|[\s(])limit:")
 
 
 class GerritChanges(object):
     def __init__(self, gerrit):
         self.gerrit = gerrit
 
-    def search(self, query):
+    def search(self, query, lazy=False, columnar=False):
         """
         Queries changes visible to the caller.
 
+        .. code-block:: python
+
+            # only the fields read are built from the response
+            changes = gerrit.changes.search("q=status:open&o=ALL_REVISIONS&o=MESSAGES", lazy=True)
+            numbers = [change._number for change in changes]
+
+        :param query: the query string
+        :param lazy: build the attributes of the changes on first access
+        :param columnar: return a ColumnarResultSet instead of a list of models
         :return:
         """
-        endpoint = "/changes/?%s" % query
+        endpoint = endpoints.CHANGES_QUERY % query
         response = self.gerrit.requester.get(self.gerrit.get_endpoint_url(endpoint))
         result = self.gerrit.decode_response(response)
-        return GerritChange.parse_list(result, gerrit=self.gerrit)
+        return GerritChange.parse_list(
+            result, lazy=lazy, columnar=columnar, gerrit=self.gerrit
+        )
+
+    def iter_search(self, query, page_size=100, lazy=False):
+        """
+        Queries changes visible to the caller, page by page.
+        The 'n' and 'S' parameters are used to request pages of page_size changes, following '_more_changes'
+        until the query is exhausted. The next page is fetched in the background while the current one is consumed,
+        so only two pages at most are held in memory.
+
+        .. code-block:: python
+
+            for change in gerrit.changes.iter_search("q=status:open+project:myProject", page_size=200):
+                print(change.subject)
+
+        :param query: the query string, the same as search(), without the 'n', 'S' and 'start' parameters
+          nor a 'limit:' operator
+        :param page_size: the number of changes requested per page
+        :param lazy: build the attributes of the changes on first access
+        :return: a generator of GerritChange
+        """
+        params = parse_qsl(query, keep_blank_values=True)
+        for key, value in params:
+            if key in _PAGING_PARAMETERS:
+                raise ValueError(
+                    "The '%s' parameter conflicts with the paging of iter_search()" % key
+                )
+            if key == "q" and _LIMIT_OPERATOR.search(value):
+                raise ValueError(
+                    "The 'limit:' operator conflicts with the paging of iter_search()"
+                )
+
+        def fetch(start):
+            endpoint = endpoints.CHANGES_QUERY % urlencode(
+                params + [("n", page_size), ("S", start)]
+            )
+            response = self.gerrit.requester.get(self.gerrit.get_endpoint_url(endpoint))
+            return self.gerrit.decode_response(response) or []
 
-    def get(self, id_):
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            start = 0
+            future = executor.submit(fetch, start)
+            while future is not None:
+                result = future.result()
+                start += len(result)
+
+                future = None
+                if result and result[-1].get("_more_changes"):
+                    future = executor.submit(fetch, start)
+
+                for item in result:
+                    yield GerritChange.parse(item, lazy=lazy, gerrit=self.gerrit)
+                del result
+        finally:
+            executor.shutdown(wait=False)
+
+    def get(self, id_, lazy=False):
         """
         Retrieves a change.
 
         :param id_: change id
+        :param lazy: build the attributes of the change on first access
         :return:
         """
-        endpoint = "/changes/%s" % id_
+        registry = self.gerrit.registry
+        if registry is not None:
+            change = registry.get("changes", id_)
+            if change is not None:
+                return change
+
+        endpoint = endpoints.CHANGE % id_
         response = self.gerrit.requester.get(self.gerrit.get_endpoint_url(endpoint))
         result = self.gerrit.decode_response(response)
-        return GerritChange.parse(result, gerrit=self.gerrit)
+        change = GerritChange.parse(result, lazy=lazy, gerrit=self.gerrit)
+        if registry is not None and change is not None:
+            registry.register("changes", change, id_, change.id, change._number)
+        return change
 
     def create(self, input_):
         """
@@ -50,7 +139,7 @@ class GerritChanges(object):
           https://gerrit-review.googlesource.com/Documentation/rest-api-changes.html#change-input
         :return:
         """
-        endpoint = "/changes/"
+        endpoint = endpoints.CHANGES
         base_url = self.gerrit.get_endpoint_url(endpoint)
         response = self.gerrit.requester.post(
             base_url, json=input_, headers=self.gerrit.default_headers
@@ -65,5 +154,5 @@ class GerritChanges(object):
         :param id_: change id
         :return:
         """
-        endpoint = "/changes/%s" % id_
+        endpoint = endpoints.CHANGE % id_
         self.gerrit.requester.delete(self.gerrit.get_endpoint_url(endpoint))
@@ -10,16 +10,15 @@ from gerrit.utils.models import BaseModel
 
 
 class Edit(BaseModel):
-    def __init__(self, **kwargs):
-        super(Edit, self).__init__(**kwargs)
-        self.attributes = [
-            "ref",
-            "base_revision",
-            "base_patch_set_number",
-            "commit",
-            "change",
-            "gerrit",
-        ]
+    attributes = (
+        "ref",
+        "base_revision",
+        "base_patch_set_number",
+        "commit",
+        "change",
+        "gerrit",
+    )
+    __slots__ = attributes
 
     def get_change_file_content(self, file):
         """
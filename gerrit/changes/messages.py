@@ -6,19 +6,18 @@ from gerrit.utils.models import BaseModel
 
 
 class Message(BaseModel):
-    def __init__(self, **kwargs):
-        super(Message, self).__init__(**kwargs)
-        self.attributes = [
-            "id",
-            "_revision_number",
-            "message",
-            "date",
-            "author",
-            "real_author",
-            "tag",
-            "change",
-            "gerrit",
-        ]
+    attributes = (
+        "id",
+        "_revision_number",
+        "message",
+        "date",
+        "author",
+        "real_author",
+        "tag",
+        "change",
+        "gerrit",
+    )
+    __slots__ = attributes
 
     def delete(self, input_=None):
         """
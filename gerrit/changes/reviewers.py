@@ -6,17 +6,16 @@ from gerrit.utils.models import BaseModel
 
 
 class Reviewer(BaseModel):
-    def __init__(self, **kwargs):
-        super(Reviewer, self).__init__(**kwargs)
-        self.attributes = [
-            "username",
-            "_account_id",
-            "name",
-            "email",
-            "approvals",
-            "change",
-            "gerrit",
-        ]
+    attributes = (
+        "username",
+        "_account_id",
+        "name",
+        "email",
+        "approvals",
+        "change",
+        "gerrit",
+    )
+    __slots__ = attributes
 
     def delete(self, input_=None):
         """
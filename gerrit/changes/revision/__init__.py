@@ -9,6 +9,7 @@ except ImportError:
 from gerrit.changes.revision.drafts import Drafts
 from gerrit.changes.revision.comments import Comments
 from gerrit.changes.revision.files import Files
+from gerrit.utils.streaming import DEFAULT_CHUNK_SIZE, iter_content, save_content
 
 
 class Revision(object):
@@ -225,6 +226,20 @@ class Revision(object):
 
         If the path parameter is set, the returned content is a diff of the single file that the path refers to.
 
+        :param zip_:
+        :param download:
+        :param path:
+        :return:
+        """
+        endpoint = self.get_patch_endpoint(zip_=zip_, download=download, path=path)
+        response = self.gerrit.requester.get(self.gerrit.get_endpoint_url(endpoint))
+        result = self.gerrit.decode_response(response)
+        return result
+
+    def get_patch_endpoint(self, zip_=False, download=False, path=None):
+        """
+        Build the endpoint of the formatted patch.
+
         :param zip_:
         :param download:
         :param path:
@@ -232,18 +247,61 @@ class Revision(object):
         """
         endpoint = "/changes/%s/revisions/%s/patch" % (self.change, self.revision)
 
-        if zip:
-            endpoint += endpoint + "?zip"
+        options = []
+        if zip_:
+            options.append("zip")
 
         if download:
-            endpoint += endpoint + "?download"
+            options.append("download")
 
         if path:
-            endpoint += endpoint + "?path=%s" % quote(path, safe="")
+            options.append("path=%s" % quote(path, safe=""))
 
-        response = self.gerrit.requester.get(self.gerrit.get_endpoint_url(endpoint))
-        result = self.gerrit.decode_response(response)
-        return result
+        if options:
+            endpoint += "?" + "&".join(options)
+        return endpoint
+
+    def iter_patch(self, zip_=False, path=None, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Streams the formatted patch for one revision.
+        The patch is decoded on the fly, from base64 or from the zip archive if zip_ is set,
+        so it is never held in memory as a whole.
+
+        .. code-block:: python
+
+            for chunk in revision.iter_patch():
+                sys.stdout.buffer.write(chunk)
+
+        :param zip_: download the patch as a zip archive instead of base64
+        :param path: only the diff of the file the path refers to
+        :param chunk_size: size of the chunks read from the socket
+        :return: a generator of bytes of the plain text patch
+        """
+        endpoint = self.get_patch_endpoint(zip_=zip_, path=path)
+        response = self.gerrit.requester.get(
+            self.gerrit.get_endpoint_url(endpoint), stream=True
+        )
+        return iter_content(
+            response, chunk_size, encoding="zip" if zip_ else "base64"
+        )
+
+    def save_patch(self, dest, zip_=False, path=None, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Streams the formatted patch for one revision to a file.
+
+        .. code-block:: python
+
+            revision.save_patch('/tmp/3848807f.diff')
+
+        :param dest: file path or file object opened in binary mode
+        :param zip_: download the patch as a zip archive instead of base64
+        :param path: only the diff of the file the path refers to
+        :param chunk_size: size of the chunks read from the socket
+        :return: the number of bytes written
+        """
+        return save_content(
+            self.iter_patch(zip_=zip_, path=path, chunk_size=chunk_size), dest
+        )
 
     def submit_preview(self):
         """
@@ -3,23 +3,23 @@
 # @Author: Jialiang Shi
 
 from gerrit.utils.models import BaseModel
+from gerrit.utils.streaming import DEFAULT_CHUNK_SIZE, iter_content, iter_json_object
 
 
 class Comment(BaseModel):
-    def __init__(self, **kwargs):
-        super(Comment, self).__init__(**kwargs)
-        self.attributes = [
-            "id",
-            "path",
-            "line",
-            "in_reply_to",
-            "message",
-            "updated",
-            "author",
-            "change",
-            "revision",
-            "gerrit",
-        ]
+    attributes = (
+        "id",
+        "path",
+        "line",
+        "in_reply_to",
+        "message",
+        "updated",
+        "author",
+        "change",
+        "revision",
+        "gerrit",
+    )
+    __slots__ = attributes
 
     def delete(self, input_=None):
         """
@@ -94,6 +94,25 @@ class Comments(object):
             comments, change=self.change, revision=self.revision, gerrit=self.gerrit
         )
 
+    def iter_list(self, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Lists the published comments of a revision, parsing the streamed response incrementally.
+        The comments are held in memory one file at a time.
+
+        :param chunk_size: size of the chunks read from the socket
+        :return: a generator of Comment
+        """
+        endpoint = "/changes/%s/revisions/%s/comments" % (self.change, self.revision)
+        response = self.gerrit.requester.get(
+            self.gerrit.get_endpoint_url(endpoint), stream=True
+        )
+        for key, value in iter_json_object(iter_content(response, chunk_size)):
+            for item in value:
+                item.update({"path": key})
+                yield Comment.parse(
+                    item, change=self.change, revision=self.revision, gerrit=self.gerrit
+                )
+
     def get(self, id_):
         """
         Retrieves a published comment of a revision.
@@ -6,19 +6,18 @@ from gerrit.utils.models import BaseModel
 
 
 class Draft(BaseModel):
-    def __init__(self, **kwargs):
-        super(Draft, self).__init__(**kwargs)
-        self.attributes = [
-            "id",
-            "path",
-            "line",
-            "message",
-            "unresolved",
-            "updated",
-            "change",
-            "revision",
-            "gerrit",
-        ]
+    attributes = (
+        "id",
+        "path",
+        "line",
+        "message",
+        "unresolved",
+        "updated",
+        "change",
+        "revision",
+        "gerrit",
+    )
+    __slots__ = attributes
 
     def update(self, input_):
         """
@@ -8,23 +8,23 @@ except ImportError:
 
 from gerrit.utils.models import BaseModel
 from gerrit.utils.exceptions import UnknownFile
+from gerrit.utils.streaming import DEFAULT_CHUNK_SIZE, iter_content, save_content
 
 
 class File(BaseModel):
-    def __init__(self, **kwargs):
-        super(File, self).__init__(**kwargs)
-        self.attributes = [
-            "path",
-            "lines_deleted",
-            "lines_inserted",
-            "size",
-            "size_delta",
-            "status",
-            "old_path",
-            "change",
-            "revision",
-            "gerrit",
-        ]
+    attributes = (
+        "path",
+        "lines_deleted",
+        "lines_inserted",
+        "size",
+        "size_delta",
+        "status",
+        "old_path",
+        "change",
+        "revision",
+        "gerrit",
+    )
+    __slots__ = attributes
 
     def get_content(self):
         """
@@ -62,6 +62,68 @@ class File(BaseModel):
         result = self.gerrit.decode_response(response)
         return result
 
+    def iter_content(self, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Streams the content of a file from a certain revision, decoded from base64 on the fly.
+
+        :param chunk_size: size of the chunks read from the socket
+        :return: a generator of bytes
+        """
+        endpoint = "/changes/%s/revisions/%s/files/%s/content" % (
+            self.change,
+            self.revision,
+            quote(self.path, safe=""),
+        )
+        response = self.gerrit.requester.get(
+            self.gerrit.get_endpoint_url(endpoint), stream=True
+        )
+        return iter_content(response, chunk_size, encoding="base64")
+
+    def save_content(self, dest, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Streams the content of a file from a certain revision to a file.
+
+        :param dest: file path or file object opened in binary mode
+        :param chunk_size: size of the chunks read from the socket
+        :return: the number of bytes written
+        """
+        return save_content(self.iter_content(chunk_size=chunk_size), dest)
+
+    def iter_download(self, unzip=False, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Streams the safe download of a file from a certain revision, see download_content().
+
+        :param unzip: extract the file on the fly if the server sent it inside a ZIP file
+        :param chunk_size: size of the chunks read from the socket
+        :return: a generator of bytes
+        """
+        endpoint = "/changes/%s/revisions/%s/files/%s/download" % (
+            self.change,
+            self.revision,
+            quote(self.path, safe=""),
+        )
+        response = self.gerrit.requester.get(
+            self.gerrit.get_endpoint_url(endpoint), stream=True
+        )
+        content_type = response.headers.get("content-type", "")
+        zipped = content_type.split(";")[0] == "application/zip"
+        return iter_content(
+            response, chunk_size, encoding="zip" if unzip and zipped else None
+        )
+
+    def save_download(self, dest, unzip=False, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Streams the safe download of a file from a certain revision to a file.
+
+        :param dest: file path or file object opened in binary mode
+        :param unzip: extract the file on the fly if the server sent it inside a ZIP file
+        :param chunk_size: size of the chunks read from the socket
+        :return: the number of bytes written
+        """
+        return save_content(
+            self.iter_download(unzip=unzip, chunk_size=chunk_size), dest
+        )
+
     def get_diff(self, intraline=False):
         """
         Gets the diff of a file from a certain revision.
@@ -76,7 +138,7 @@ class File(BaseModel):
         )
 
         if intraline:
-            endpoint += endpoint + "?intraline"
+            endpoint += "?intraline"
 
         response = self.gerrit.requester.get(self.gerrit.get_endpoint_url(endpoint))
         result = self.gerrit.decode_response(response)
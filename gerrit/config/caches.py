@@ -2,19 +2,19 @@
 # -*- coding:utf-8 -*-
 # @Author: Jialiang Shi
 from gerrit.utils.models import BaseModel
+from gerrit.utils.streaming import DEFAULT_CHUNK_SIZE, iter_content, iter_json_object
 
 
 class Cache(BaseModel):
-    def __init__(self, **kwargs):
-        super(Cache, self).__init__(**kwargs)
-        self.attributes = [
-            "name",
-            "type",
-            "entries",
-            "average_get",
-            "hit_ratio",
-            "gerrit",
-        ]
+    attributes = (
+        "name",
+        "type",
+        "entries",
+        "average_get",
+        "hit_ratio",
+        "gerrit",
+    )
+    __slots__ = attributes
 
     def flush(self):
         """
@@ -48,6 +48,21 @@ class Caches(object):
 
         return Cache.parse_list(caches, gerrit=self.gerrit)
 
+    def iter_list(self, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Lists the caches of the server, parsing the streamed response incrementally.
+
+        :param chunk_size: size of the chunks read from the socket
+        :return: a generator of Cache
+        """
+        endpoint = "/config/server/caches/"
+        response = self.gerrit.requester.get(
+            self.gerrit.get_endpoint_url(endpoint), stream=True
+        )
+        for key, value in iter_json_object(iter_content(response, chunk_size)):
+            value.update({"name": key})
+            yield Cache.parse(value, gerrit=self.gerrit)
+
     def get(self, name):
         """
         Retrieves information about a cache.
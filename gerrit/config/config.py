@@ -3,6 +3,7 @@
 # @Author: Jialiang Shi
 from gerrit.config.caches import Caches
 from gerrit.config.tasks import Tasks
+from gerrit.utils import endpoints
 
 
 class GerritConfig(object):
@@ -15,7 +16,7 @@ class GerritConfig(object):
 
         :return:
         """
-        endpoint = "/config/server/version"
+        endpoint = endpoints.CONFIG_VERSION
         response = self.gerrit.requester.get(self.gerrit.get_endpoint_url(endpoint))
         result = self.gerrit.decode_response(response)
         return result
@@ -26,7 +27,7 @@ class GerritConfig(object):
 
         :return:
         """
-        endpoint = "/config/server/info"
+        endpoint = endpoints.CONFIG_INFO
         response = self.gerrit.requester.get(self.gerrit.get_endpoint_url(endpoint))
         result = self.gerrit.decode_response(response)
         return result
@@ -47,7 +48,7 @@ class GerritConfig(object):
           https://gerrit-review.googlesource.com/Documentation/rest-api-config.html#consistency-check-input
         :return:
         """
-        endpoint = "/config/server/check.consistency"
+        endpoint = endpoints.CONFIG_CHECK_CONSISTENCY
         base_url = self.gerrit.get_endpoint_url(endpoint)
         response = self.gerrit.requester.post(
             base_url, json=input_, headers=self.gerrit.default_headers
@@ -61,7 +62,7 @@ class GerritConfig(object):
 
         :return:
         """
-        endpoint = "/config/server/reload"
+        endpoint = endpoints.CONFIG_RELOAD
         response = self.gerrit.requester.post(self.gerrit.get_endpoint_url(endpoint))
         result = self.gerrit.decode_response(response)
         return result
@@ -83,7 +84,7 @@ class GerritConfig(object):
           https://gerrit-review.googlesource.com/Documentation/rest-api-config.html#email-confirmation-input
         :return:
         """
-        endpoint = "/config/server/email.confirm"
+        endpoint = endpoints.CONFIG_CONFIRM_EMAIL
         base_url = self.gerrit.get_endpoint_url(endpoint)
         self.gerrit.requester.put(
             base_url, json=input_, headers=self.gerrit.default_headers
@@ -100,7 +101,7 @@ class GerritConfig(object):
         :param option: query option.such as jvm or gc
         :return:
         """
-        endpoint = "/config/server/summary"
+        endpoint = endpoints.CONFIG_SUMMARY
         if option is not None:
             endpoint += "?%s" % option
         response = self.gerrit.requester.get(self.gerrit.get_endpoint_url(endpoint))
@@ -114,7 +115,7 @@ class GerritConfig(object):
 
         :return:
         """
-        endpoint = "/config/server/capabilities"
+        endpoint = endpoints.CONFIG_CAPABILITIES
         response = self.gerrit.requester.get(self.gerrit.get_endpoint_url(endpoint))
         result = self.gerrit.decode_response(response)
         return result
@@ -129,7 +130,7 @@ class GerritConfig(object):
 
         :return:
         """
-        endpoint = "/config/server/top-menus"
+        endpoint = endpoints.CONFIG_TOP_MENUS
         response = self.gerrit.requester.get(self.gerrit.get_endpoint_url(endpoint))
         result = self.gerrit.decode_response(response)
         return result
@@ -140,7 +141,7 @@ class GerritConfig(object):
 
         :return:
         """
-        endpoint = "/config/server/preferences"
+        endpoint = endpoints.CONFIG_USER_PREFERENCES
         response = self.gerrit.requester.get(self.gerrit.get_endpoint_url(endpoint))
         result = self.gerrit.decode_response(response)
         return result
@@ -160,7 +161,7 @@ class GerritConfig(object):
           https://gerrit-review.googlesource.com/Documentation/rest-api-accounts.html#preferences-input
         :return:
         """
-        endpoint = "/config/server/preferences"
+        endpoint = endpoints.CONFIG_USER_PREFERENCES
         base_url = self.gerrit.get_endpoint_url(endpoint)
         response = self.gerrit.requester.put(
             base_url, json=input_, headers=self.gerrit.default_headers
@@ -174,7 +175,7 @@ class GerritConfig(object):
 
         :return:
         """
-        endpoint = "/config/server/preferences.diff"
+        endpoint = endpoints.CONFIG_DIFF_PREFERENCES
         response = self.gerrit.requester.get(self.gerrit.get_endpoint_url(endpoint))
         result = self.gerrit.decode_response(response)
         return result
@@ -205,7 +206,7 @@ class GerritConfig(object):
           https://gerrit-review.googlesource.com/Documentation/rest-api-accounts.html#diff-preferences-input
         :return:
         """
-        endpoint = "/config/server/preferences.diff"
+        endpoint = endpoints.CONFIG_DIFF_PREFERENCES
         base_url = self.gerrit.get_endpoint_url(endpoint)
         response = self.gerrit.requester.put(
             base_url, json=input_, headers=self.gerrit.default_headers
@@ -219,7 +220,7 @@ class GerritConfig(object):
 
         :return:
         """
-        endpoint = "/config/server/preferences.edit"
+        endpoint = endpoints.CONFIG_EDIT_PREFERENCES
         response = self.gerrit.requester.get(self.gerrit.get_endpoint_url(endpoint))
         result = self.gerrit.decode_response(response)
         return result
@@ -248,7 +249,7 @@ class GerritConfig(object):
           https://gerrit-review.googlesource.com/Documentation/rest-api-accounts.html#edit-preferences-input
         :return:
         """
-        endpoint = "/config/server/preferences.edit"
+        endpoint = endpoints.CONFIG_EDIT_PREFERENCES
         base_url = self.gerrit.get_endpoint_url(endpoint)
         response = self.gerrit.requester.put(
             base_url, json=input_, headers=self.gerrit.default_headers
@@ -269,7 +270,7 @@ class GerritConfig(object):
           https://gerrit-review.googlesource.com/Documentation/rest-api-config.html#index-changes-input
         :return:
         """
-        endpoint = "/config/server/index.changes"
+        endpoint = endpoints.CONFIG_INDEX_CHANGES
         base_url = self.gerrit.get_endpoint_url(endpoint)
         self.gerrit.requester.post(
             base_url, json=input_, headers=self.gerrit.default_headers
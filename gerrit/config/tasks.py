@@ -5,18 +5,17 @@ from gerrit.utils.models import BaseModel
 
 
 class Task(BaseModel):
-    def __init__(self, **kwargs):
-        super(Task, self).__init__(**kwargs)
-        self.attributes = [
-            "id",
-            "state",
-            "command",
-            "start_time",
-            "remote_name",
-            "project",
-            "delay",
-            "gerrit",
-        ]
+    attributes = (
+        "id",
+        "state",
+        "command",
+        "start_time",
+        "remote_name",
+        "project",
+        "delay",
+        "gerrit",
+    )
+    __slots__ = attributes
 
     def delete(self):
         """
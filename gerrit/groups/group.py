@@ -2,23 +2,24 @@
 # -*- coding:utf-8 -*-
 # @Author: Jialiang Shi
 from gerrit.utils.models import BaseModel
+from gerrit.accounts.account import GerritAccount
+from gerrit.utils.concurrency import DEFAULT_MAX_WORKERS
 
 
 class GerritGroup(BaseModel):
-    def __init__(self, **kwargs):
-        super(GerritGroup, self).__init__(**kwargs)
-        self.attributes = [
-            "name",
-            "url",
-            "options",
-            "description",
-            "id",
-            "group_id",
-            "owner",
-            "owner_id",
-            "created_on",
-            "gerrit",
-        ]
+    attributes = (
+        "name",
+        "url",
+        "options",
+        "description",
+        "id",
+        "group_id",
+        "owner",
+        "owner_id",
+        "created_on",
+        "gerrit",
+    )
+    __slots__ = attributes
 
     def rename(self, input_):
         """
@@ -173,33 +174,57 @@ class GerritGroup(BaseModel):
         endpoint = "/groups/%s/index" % self.id
         self.gerrit.requester.post(self.gerrit.get_endpoint_url(endpoint))
 
-    def list_members(self):
+    def list_members(self, options=None, max_workers=DEFAULT_MAX_WORKERS):
         """
         Lists the direct members of a Gerrit internal group.
         This endpoint is only allowed for Gerrit internal groups;
         attempting to call on a non-internal group will return 405 Method Not Allowed.
 
+        The members are built from the AccountInfo entities of the listing. With options,
+        e.g. ['DETAILS'], the accounts are fetched again through account queries of many
+        members each, max_workers of them at a time; the members the queries don't return
+        (e.g. hidden from the account queries) are built from the listing.
+
+        :param options: the account query options of the members details, e.g. ['DETAILS', 'ALL_EMAILS']
+        :param max_workers: maximum number of concurrent requests fetching the details
         :return:
         """
         endpoint = "/groups/%s/members/" % self.id
         response = self.gerrit.requester.get(self.gerrit.get_endpoint_url(endpoint))
         result = self.gerrit.decode_response(response)
-        return [self.gerrit.accounts.get(member.get("username")) for member in result]
+        if not options:
+            return GerritAccount.parse_list(result, gerrit=self.gerrit)
+
+        ids = [member.get("_account_id") for member in result]
+        accounts = self.gerrit.accounts.resolver.resolve_many(
+            [id_ for id_ in ids if id_ is not None],
+            options=options,
+            max_workers=max_workers,
+        )
+        return [
+            accounts.get(id_) or GerritAccount.parse(member, gerrit=self.gerrit)
+            for id_, member in zip(ids, result)
+        ]
 
-    def get_member(self, username):
+    def get_member(self, username, options=None):
         """
         Retrieves a group member.
         This endpoint is only allowed for Gerrit internal groups;
         attempting to call on a non-internal group will return 405 Method Not Allowed.
 
         :param username: account username
+        :param options: the account query options of the member details, e.g. ['DETAILS']
         :return:
         """
-        account = self.gerrit.accounts.get(username)
-        endpoint = "/groups/%s/members/%s" % (self.id, str(account._account_id))
+        endpoint = "/groups/%s/members/%s" % (self.id, username)
         response = self.gerrit.requester.get(self.gerrit.get_endpoint_url(endpoint))
         result = self.gerrit.decode_response(response)
-        return self.gerrit.accounts.get(result.get("username"))
+        if not options:
+            return GerritAccount.parse(result, gerrit=self.gerrit)
+
+        id_ = result.get("_account_id")
+        accounts = self.gerrit.accounts.resolver.resolve_many([id_], options=options)
+        return accounts.get(id_) or GerritAccount.parse(result, gerrit=self.gerrit)
 
     def add_member(self, username):
         """
@@ -213,7 +238,7 @@ class GerritGroup(BaseModel):
         endpoint = "/groups/%s/members/%s" % (self.id, username)
         response = self.gerrit.requester.put(self.gerrit.get_endpoint_url(endpoint))
         result = self.gerrit.decode_response(response)
-        return self.gerrit.accounts.get(result.get("username"))
+        return self.gerrit.accounts.resolver.resolve(result.get("_account_id"))
 
     def remove_member(self, username):
         """
@@ -2,20 +2,22 @@
 # -*- coding:utf-8 -*-
 # @Author: Jialiang Shi
 from gerrit.groups.group import GerritGroup
-from packaging.version import parse
+from gerrit.utils.streaming import DEFAULT_CHUNK_SIZE, iter_content, iter_json_object
+from gerrit.utils import endpoints
 
 
 class GerritGroups(object):
     def __init__(self, gerrit):
         self.gerrit = gerrit
 
-    def list(self):
+    def list(self, columnar=False):
         """
         Lists the groups accessible by the caller.
 
+        :param columnar: return a ColumnarResultSet instead of a list of models
         :return:
         """
-        endpoint = "/groups/"
+        endpoint = endpoints.GROUPS
         response = self.gerrit.requester.get(self.gerrit.get_endpoint_url(endpoint))
         result = self.gerrit.decode_response(response)
 
@@ -25,24 +27,39 @@ class GerritGroups(object):
             group.update({"name": key})
             groups.append(group)
 
-        return GerritGroup.parse_list(groups, gerrit=self.gerrit)
+        return GerritGroup.parse_list(groups, columnar=columnar, gerrit=self.gerrit)
 
-    def search(self, name):
+    def iter_list(self, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Lists the groups accessible by the caller, parsing the streamed response incrementally.
+
+        :param chunk_size: size of the chunks read from the socket
+        :return: a generator of GerritGroup
+        """
+        endpoint = endpoints.GROUPS
+        response = self.gerrit.requester.get(
+            self.gerrit.get_endpoint_url(endpoint), stream=True
+        )
+        for key, value in iter_json_object(iter_content(response, chunk_size)):
+            value.update({"name": key})
+            yield GerritGroup.parse(value, gerrit=self.gerrit)
+
+    def search(self, name, columnar=False):
         """
         Query Groups
 
         :param name: group name
+        :param columnar: return a ColumnarResultSet instead of a list of models
         :return:
         """
-        version = self.gerrit.version
-        if parse(version) < parse("3.2.0"):
-            endpoint = "/groups/?query2=inname:%s" % name
+        if not self.gerrit.features.supports("groups_query"):
+            endpoint = endpoints.GROUPS_QUERY2 % name
         else:
-            endpoint = "/groups/?query=inname:%s" % name
+            endpoint = endpoints.GROUPS_QUERY % name
 
         response = self.gerrit.requester.get(self.gerrit.get_endpoint_url(endpoint))
         result = self.gerrit.decode_response(response)
-        return GerritGroup.parse_list(result, gerrit=self.gerrit)
+        return GerritGroup.parse_list(result, columnar=columnar, gerrit=self.gerrit)
 
     def get(self, id_):
         """
@@ -51,10 +68,26 @@ class GerritGroups(object):
         :param id_: group id
         :return:
         """
-        endpoint = "/groups/%s" % id_
-        response = self.gerrit.requester.get(self.gerrit.get_endpoint_url(endpoint))
-        result = self.gerrit.decode_response(response)
-        return GerritGroup.parse(result, gerrit=self.gerrit)
+        registry = self.gerrit.registry
+        if registry is not None:
+            group = registry.get("groups", id_)
+            if group is not None:
+                return group
+
+        snapshot = self.gerrit.snapshot
+        result = snapshot.get("groups", id_) if snapshot is not None else None
+        if result is None:
+            endpoint = endpoints.GROUP % id_
+            response = self.gerrit.requester.get(self.gerrit.get_endpoint_url(endpoint))
+            result = self.gerrit.decode_response(response)
+            if snapshot is not None and isinstance(result, dict):
+                snapshot.add(
+                    "groups", result, id_, result.get("id"), result.get("group_id")
+                )
+        group = GerritGroup.parse(result, gerrit=self.gerrit)
+        if registry is not None and group is not None:
+            registry.register("groups", group, id_, group.id, group.group_id)
+        return group
 
     def create(self, name, input_):
         """
@@ -75,7 +108,7 @@ class GerritGroups(object):
           https://gerrit-review.googlesource.com/Documentation/rest-api-groups.html#group-input
         :return:
         """
-        endpoint = "/groups/%s" % name
+        endpoint = endpoints.GROUP % name
         base_url = self.gerrit.get_endpoint_url(endpoint)
         response = self.gerrit.requester.put(
             base_url, json=input_, headers=self.gerrit.default_headers
@@ -2,20 +2,20 @@
 # -*- coding:utf-8 -*-
 # @Author: Jialiang Shi
 from gerrit.utils.models import BaseModel
+from gerrit.utils import endpoints
 
 
 class GerritPlugin(BaseModel):
-    def __init__(self, **kwargs):
-        super(GerritPlugin, self).__init__(**kwargs)
-        self.attributes = [
-            "id",
-            "index_url",
-            "filename",
-            "api_version",
-            "disabled",
-            "version",
-            "gerrit",
-        ]
+    attributes = (
+        "id",
+        "index_url",
+        "filename",
+        "api_version",
+        "disabled",
+        "version",
+        "gerrit",
+    )
+    __slots__ = attributes
 
     def enable(self):
         """
@@ -61,7 +61,7 @@ class GerritPlugins(object):
 
         :return:
         """
-        endpoint = "/plugins/?all"
+        endpoint = endpoints.PLUGINS_ALL
         response = self.gerrit.requester.get(self.gerrit.get_endpoint_url(endpoint))
         result = self.gerrit.decode_response(response)
         return GerritPlugin.parse_list(list(result.values()), gerrit=self.gerrit)
@@ -72,7 +72,7 @@ class GerritPlugins(object):
         :param id_: plugin id
         :return:
         """
-        endpoint = "/plugins/%s/gerrit~status" % id_
+        endpoint = endpoints.PLUGIN_STATUS % id_
         response = self.gerrit.requester.get(self.gerrit.get_endpoint_url(endpoint))
         result = self.gerrit.decode_response(response)
         return GerritPlugin.parse(result, gerrit=self.gerrit)
@@ -94,7 +94,7 @@ class GerritPlugins(object):
           https://gerrit-review.googlesource.com/Documentation/rest-api-plugins.html#plugin-input
         :return:
         """
-        endpoint = "/plugins/%s.jar" % id_
+        endpoint = endpoints.PLUGIN_JAR % id_
         base_url = self.gerrit.get_endpoint_url(endpoint)
         response = self.gerrit.requester.put(
             base_url, json=input_, headers=self.gerrit.default_headers
@@ -7,22 +7,23 @@ except ImportError:
     from urllib import quote
 
 from gerrit.utils.models import BaseModel
+from gerrit.utils.refs import RefListing
+from gerrit.utils.streaming import DEFAULT_CHUNK_SIZE, iter_content, save_content
 from gerrit.utils.exceptions import UnknownBranch
 
 
 class Branch(BaseModel):
     branch_prefix = "refs/heads/"
 
-    def __init__(self, **kwargs):
-        super(Branch, self).__init__(**kwargs)
-        self.attributes = [
-            "ref",
-            "web_links",
-            "revision",
-            "can_delete",
-            "project",
-            "gerrit",
-        ]
+    attributes = (
+        "ref",
+        "web_links",
+        "revision",
+        "can_delete",
+        "project",
+        "gerrit",
+    )
+    __slots__ = attributes
 
     @property
     def name(self):
@@ -45,6 +46,35 @@ class Branch(BaseModel):
         result = self.gerrit.decode_response(response)
         return result
 
+    def iter_file_content(self, file, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Streams the content of a file from the HEAD revision of a certain branch, decoded from base64 on the fly.
+
+        :param file: the file path
+        :param chunk_size: size of the chunks read from the socket
+        :return: a generator of bytes
+        """
+        endpoint = "/projects/%s/branches/%s/files/%s/content" % (
+            self.project,
+            self.name,
+            quote(file, safe=""),
+        )
+        response = self.gerrit.requester.get(
+            self.gerrit.get_endpoint_url(endpoint), stream=True
+        )
+        return iter_content(response, chunk_size, encoding="base64")
+
+    def save_file_content(self, file, dest, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Streams the content of a file from the HEAD revision of a certain branch to a file.
+
+        :param file: the file path
+        :param dest: file path or file object opened in binary mode
+        :param chunk_size: size of the chunks read from the socket
+        :return: the number of bytes written
+        """
+        return save_content(self.iter_file_content(file, chunk_size=chunk_size), dest)
+
     def is_mergeable(self, input_):
         """
         Gets whether the source is mergeable with the target branch.
@@ -88,6 +118,8 @@ class Branch(BaseModel):
         """
         endpoint = "/projects/%s/branches/%s" % (self.project, self.name)
         self.gerrit.requester.delete(self.gerrit.get_endpoint_url(endpoint))
+        if self.gerrit.refs is not None:
+            self.gerrit.refs.remove("branches", self.project, self.ref)
 
 
 class Branches(object):
@@ -96,49 +128,64 @@ class Branches(object):
     def __init__(self, project, gerrit):
         self.project = project
         self.gerrit = gerrit
-        self._data = []
+        refs = gerrit.refs
+        if refs is not None:
+            # shared by all the Branches objects of the project
+            self._listing = refs.get_listing("branches", project, self.poll)
+        else:
+            self._listing = RefListing(self.poll)
 
-    def poll(self):
+    def poll(self, refresh=False):
         """
 
+        :param refresh: fetch the branches from the server, not from the response cache
         :return:
         """
         endpoint = "/projects/%s/branches/" % self.project
-        response = self.gerrit.requester.get(self.gerrit.get_endpoint_url(endpoint))
+        url = self.gerrit.get_endpoint_url(endpoint)
+        response_cache = self.gerrit.requester.response_cache
+        if refresh and response_cache is not None:
+            response_cache.delete(url)
+        response = self.gerrit.requester.get(url)
         result = self.gerrit.decode_response(response)
-        for item in result:
-            if item["ref"] == "refs/meta/config":
-                result.remove(item)
-        return result
+        if self.gerrit.negative_cache is not None:
+            # the listing says which refs exist now
+            self.gerrit.negative_cache.discard_all("branches", self.project)
+        return [item for item in result if item["ref"] != "refs/meta/config"]
+
+    def refresh(self):
+        """
+        Fetch the branches again, e.g. to see the branches created by others before the listing expires.
+
+        :return:
+        """
+        self._listing.refresh()
 
     def iterkeys(self):
         """
         Iterate over the names of all available branches
         """
-        if not self._data:
-            self._data = self.poll()
-
-        for row in self._data:
-            yield row["ref"]
+        for ref in list(self._listing.refs):
+            yield ref
 
     def keys(self):
         """
         Return a list of the names of all branches
         """
-        return list(self.iterkeys())
+        return list(self._listing.refs)
 
     def __len__(self):
         """
 
         :return:
         """
-        return len(self.keys())
+        return len(self._listing.refs)
 
     def __contains__(self, ref):
         """
         True if ref exists in project
         """
-        return ref in self.keys()
+        return ref in self._listing.refs
 
     def __getitem__(self, ref):
         """
@@ -150,14 +197,19 @@ class Branches(object):
         if not ref.startswith(self.branch_prefix):
             raise KeyError("branch ref should start with {}".format(self.branch_prefix))
 
-        if not self._data:
-            self._data = self.poll()
-
-        result = [row for row in self._data if row["ref"] == ref]
-        if result:
-            return Branch.parse(result[0], project=self.project, gerrit=self.gerrit)
+        # the listing decides, as in __contains__, the negative cache only records the misses
+        negative_cache = self.gerrit.negative_cache
+        row = self._listing.refs.get(ref)
+        if row is not None:
+            if negative_cache is not None:
+                # created since the miss was recorded
+                negative_cache.discard("branches", self.project, ref)
+            return Branch.parse(row, project=self.project, gerrit=self.gerrit)
         else:
-            raise UnknownBranch(ref)
+            error = UnknownBranch(ref)
+            if negative_cache is not None:
+                negative_cache.add(error, "branches", self.project, ref)
+            raise error
 
     def __setitem__(self, key, value):
         """
@@ -178,20 +230,14 @@ class Branches(object):
         :param key:
         :return:
         """
-        self[key].delete()
-
-        # Reset to get it refreshed from Gerrit
-        self._data = []
+        self.delete(key)
 
     def __iter__(self):
         """
 
         :return:
         """
-        if not self._data:
-            self._data = self.poll()
-
-        for row in self._data:
+        for row in list(self._listing.refs.values()):
             yield Branch.parse(row, project=self.project, gerrit=self.gerrit)
 
     def get(self, name):
@@ -231,9 +277,9 @@ class Branches(object):
             base_url, json=input_, headers=self.gerrit.default_headers
         )
         result = self.gerrit.decode_response(response)
-
-        # Reset to get it refreshed from Gerrit
-        self._data = []
+        self._listing.add(result)
+        if self.gerrit.negative_cache is not None:
+            self.gerrit.negative_cache.discard("branches", self.project, ref)
 
         return Branch.parse(result, project=self.project, gerrit=self.gerrit)
 
@@ -245,6 +291,4 @@ class Branches(object):
         :return:
         """
         self[name].delete()
-
-        # Reset to get it refreshed from Gerrit
-        self._data = []
+        self._listing.remove(name)
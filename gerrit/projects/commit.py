@@ -7,22 +7,22 @@ except ImportError:
     from urllib import quote
 
 from gerrit.utils.models import BaseModel
+from gerrit.utils.streaming import DEFAULT_CHUNK_SIZE, iter_content, save_content
 
 
 class Commit(BaseModel):
-    def __init__(self, **kwargs):
-        super(Commit, self).__init__(**kwargs)
-        self.attributes = [
-            "commit",
-            "author",
-            "committer",
-            "message",
-            "parents",
-            "subject",
-            "web_links",
-            "project",
-            "gerrit",
-        ]
+    attributes = (
+        "commit",
+        "author",
+        "committer",
+        "message",
+        "parents",
+        "subject",
+        "web_links",
+        "project",
+        "gerrit",
+    )
+    __slots__ = attributes
 
     def get_include_in(self):
         """
@@ -51,6 +51,35 @@ class Commit(BaseModel):
         result = self.gerrit.decode_response(response)
         return result
 
+    def iter_file_content(self, file, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Streams the content of a file from a certain commit, decoded from base64 on the fly.
+
+        :param file: the file path
+        :param chunk_size: size of the chunks read from the socket
+        :return: a generator of bytes
+        """
+        endpoint = "/projects/%s/commits/%s/files/%s/content" % (
+            self.project,
+            self.commit,
+            quote(file, safe=""),
+        )
+        response = self.gerrit.requester.get(
+            self.gerrit.get_endpoint_url(endpoint), stream=True
+        )
+        return iter_content(response, chunk_size, encoding="base64")
+
+    def save_file_content(self, file, dest, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Streams the content of a file from a certain commit to a file.
+
+        :param file: the file path
+        :param dest: file path or file object opened in binary mode
+        :param chunk_size: size of the chunks read from the socket
+        :return: the number of bytes written
+        """
+        return save_content(self.iter_file_content(file, chunk_size=chunk_size), dest)
+
     def cherry_pick(self, input_):
         """
         Cherry-picks a commit of a project to a destination branch.
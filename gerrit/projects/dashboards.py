@@ -6,22 +6,21 @@ from gerrit.utils.models import BaseModel
 
 
 class Dashboard(BaseModel):
-    def __init__(self, **kwargs):
-        super(Dashboard, self).__init__(**kwargs)
-        self.attributes = [
-            "id",
-            "ref",
-            "path",
-            "description",
-            "url",
-            "is_default",
-            "title",
-            "sections",
-            "defining_project",
-            "foreach",
-            "project",
-            "gerrit",
-        ]
+    attributes = (
+        "id",
+        "ref",
+        "path",
+        "description",
+        "url",
+        "is_default",
+        "title",
+        "sections",
+        "defining_project",
+        "foreach",
+        "project",
+        "gerrit",
+    )
+    __slots__ = attributes
 
     def delete(self):
         """
@@ -6,26 +6,25 @@ from gerrit.utils.models import BaseModel
 
 
 class Label(BaseModel):
-    def __init__(self, **kwargs):
-        super(Label, self).__init__(**kwargs)
-        self.attributes = [
-            "name",
-            "function",
-            "values",
-            "default_value",
-            "can_override",
-            "copy_min_score",
-            "copy_max_score",
-            "copy_all_scores_if_no_change",
-            "copy_all_scores_if_no_code_change",
-            "copy_all_scores_on_trivial_rebase",
-            "copy_all_scores_on_merge_first_parent_update",
-            "copy_values",
-            "allow_post_submit",
-            "ignore_self_approval",
-            "project",
-            "gerrit",
-        ]
+    attributes = (
+        "name",
+        "function",
+        "values",
+        "default_value",
+        "can_override",
+        "copy_min_score",
+        "copy_max_score",
+        "copy_all_scores_if_no_change",
+        "copy_all_scores_if_no_code_change",
+        "copy_all_scores_on_trivial_rebase",
+        "copy_all_scores_on_merge_first_parent_update",
+        "copy_values",
+        "allow_post_submit",
+        "ignore_self_approval",
+        "project",
+        "gerrit",
+    )
+    __slots__ = attributes
 
     def set(self, input_):
         """
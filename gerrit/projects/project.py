@@ -1,7 +1,6 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 # @Author: Jialiang Shi
-from packaging.version import parse
 from gerrit.projects.branches import Branches
 from gerrit.projects.tags import Tags
 from gerrit.projects.commit import Commit
@@ -10,13 +9,19 @@ from gerrit.projects.labels import Labels
 from gerrit.projects.webhooks import Webhooks
 from gerrit.changes.change import GerritChange
 from gerrit.utils.models import BaseModel
+from gerrit.utils.concurrency import DEFAULT_MAX_WORKERS, bounded_map
 from gerrit.utils.exceptions import UnsupportMethod
 
 
 class GerritProject(BaseModel):
-    def __init__(self, **kwargs):
-        super(GerritProject, self).__init__(**kwargs)
-        self.attributes = ["id", "name", "state", "web_links", "gerrit"]
+    attributes = (
+        "id",
+        "name",
+        "state",
+        "web_links",
+        "gerrit",
+    )
+    __slots__ = attributes
 
     @property
     def description(self):
@@ -307,8 +312,7 @@ class GerritProject(BaseModel):
         :param input_:
         :return:
         """
-        version = self.gerrit.version
-        if parse(version) < parse("3.3.0"):
+        if not self.gerrit.features.supports("project_create_change"):
             raise UnsupportMethod("The server does not support this method")
 
         endpoint = "/projects/%s/create.change" % self.id
@@ -435,12 +439,29 @@ class GerritProject(BaseModel):
         """
         List the direct child projects of a project.
 
+        :return:
+        """
+        return self.list_child_projects()
+
+    def list_child_projects(self, detailed=False, max_workers=DEFAULT_MAX_WORKERS):
+        """
+        List the direct child projects of a project.
+
+        The projects are built from the ProjectInfo entities of the listing. With detailed=True
+        every project is fetched again, max_workers of them at a time.
+
+        :param detailed: fetch every child project
+        :param max_workers: maximum number of concurrent requests fetching the projects
         :return:
         """
         endpoint = "/projects/%s/children/" % self.id
         response = self.gerrit.requester.get(self.gerrit.get_endpoint_url(endpoint))
         result = self.gerrit.decode_response(response)
-        return [self.gerrit.projects.get(item.get("id")) for item in result]
+        if not detailed:
+            return GerritProject.parse_list(result, gerrit=self.gerrit)
+        return bounded_map(
+            self.gerrit.projects.get, [item.get("id") for item in result], max_workers
+        )
 
     @property
     def tags(self):
@@ -478,8 +499,7 @@ class GerritProject(BaseModel):
 
         :return:
         """
-        version = self.gerrit.version
-        if parse(version) < parse("3.2.0"):
+        if not self.gerrit.features.supports("project_labels"):
             endpoint = "/projects/%s" % self.id
             response = self.gerrit.requester.get(self.gerrit.get_endpoint_url(endpoint))
             result = self.gerrit.decode_response(response)
@@ -2,24 +2,45 @@
 # -*- coding:utf-8 -*-
 # @Author: Jialiang Shi
 from gerrit.projects.project import GerritProject
+from gerrit.utils.exceptions import NotFoundError
+from gerrit.utils.streaming import DEFAULT_CHUNK_SIZE, iter_content, iter_json_object
+from gerrit.utils import endpoints
 
 
 class GerritProjects(object):
     def __init__(self, gerrit):
         self.gerrit = gerrit
 
-    def list(self):
+    def list(self, columnar=False):
         """
         Lists the projects accessible by the caller.
 
+        :param columnar: return a ColumnarResultSet instead of a list of models
         :return:
         """
-        endpoint = "/projects/?all"
+        endpoint = endpoints.PROJECTS_ALL
         response = self.gerrit.requester.get(self.gerrit.get_endpoint_url(endpoint))
         result = self.gerrit.decode_response(response)
-        return GerritProject.parse_list(list(result.values()), gerrit=self.gerrit)
+        return GerritProject.parse_list(
+            list(result.values()), columnar=columnar, gerrit=self.gerrit
+        )
+
+    def iter_list(self, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Lists the projects accessible by the caller, parsing the streamed response incrementally.
+        Only one project is held in memory at a time, instead of the whole map of projects.
 
-    def search(self, query):
+        :param chunk_size: size of the chunks read from the socket
+        :return: a generator of GerritProject
+        """
+        endpoint = endpoints.PROJECTS_ALL
+        response = self.gerrit.requester.get(
+            self.gerrit.get_endpoint_url(endpoint), stream=True
+        )
+        for _, value in iter_json_object(iter_content(response, chunk_size)):
+            yield GerritProject.parse(value, gerrit=self.gerrit)
+
+    def search(self, query, columnar=False):
         """
         Queries projects visible to the caller. The query string must be provided by the query parameter.
         The start and limit parameters can be used to skip/limit results.
@@ -32,12 +53,13 @@ class GerritProjects(object):
           * state:'STATE' Matches project’s state. Can be either 'active' or 'read-only'.
 
         :param query:
+        :param columnar: return a ColumnarResultSet instead of a list of models
         :return:
         """
-        endpoint = "/projects/?query=%s" % query
+        endpoint = endpoints.PROJECTS_QUERY % query
         response = self.gerrit.requester.get(self.gerrit.get_endpoint_url(endpoint))
         result = self.gerrit.decode_response(response)
-        return GerritProject.parse_list(result, gerrit=self.gerrit)
+        return GerritProject.parse_list(result, columnar=columnar, gerrit=self.gerrit)
 
     def get(self, project_name):
         """
@@ -46,10 +68,35 @@ class GerritProjects(object):
         :param project_name: the name of the project
         :return:
         """
-        endpoint = "/projects/%s" % project_name
-        response = self.gerrit.requester.get(self.gerrit.get_endpoint_url(endpoint))
-        result = self.gerrit.decode_response(response)
-        return GerritProject.parse(result, gerrit=self.gerrit)
+        registry = self.gerrit.registry
+        if registry is not None:
+            project = registry.get("projects", project_name)
+            if project is not None:
+                return project
+
+        negative_cache = self.gerrit.negative_cache
+        if negative_cache is not None:
+            negative_cache.check("projects", project_name)
+
+        snapshot = self.gerrit.snapshot
+        result = snapshot.get("projects", project_name) if snapshot is not None else None
+        if result is None:
+            endpoint = endpoints.PROJECT % project_name
+            try:
+                response = self.gerrit.requester.get(
+                    self.gerrit.get_endpoint_url(endpoint)
+                )
+            except NotFoundError as error:
+                if negative_cache is not None:
+                    negative_cache.add(error, "projects", project_name)
+                raise
+            result = self.gerrit.decode_response(response)
+            if snapshot is not None and isinstance(result, dict):
+                snapshot.add("projects", result, project_name, result.get("id"))
+        project = GerritProject.parse(result, gerrit=self.gerrit)
+        if registry is not None and project is not None:
+            registry.register("projects", project, project_name, project.id)
+        return project
 
     def create(self, project_name, input_):
         """
@@ -72,12 +119,14 @@ class GerritProjects(object):
 
         :return:
         """
-        endpoint = "/projects/%s" % project_name
+        endpoint = endpoints.PROJECT % project_name
         base_url = self.gerrit.get_endpoint_url(endpoint)
         response = self.gerrit.requester.put(
             base_url, json=input_, headers=self.gerrit.default_headers
         )
         result = self.gerrit.decode_response(response)
+        if self.gerrit.negative_cache is not None:
+            self.gerrit.negative_cache.discard("projects", project_name)
         return GerritProject.parse(result, gerrit=self.gerrit)
 
     def delete(self, project_name):
@@ -87,5 +136,5 @@ class GerritProjects(object):
         :param project_name: project name
         :return:
         """
-        endpoint = "/projects/%s/delete-project~delete" % project_name
+        endpoint = endpoints.PROJECT_DELETE % project_name
         self.gerrit.requester.post(self.gerrit.get_endpoint_url(endpoint))
@@ -3,26 +3,26 @@
 # @Author: Jialiang Shi
 
 from gerrit.utils.models import BaseModel
+from gerrit.utils.refs import RefListing
 from gerrit.utils.exceptions import UnknownTag
 
 
 class Tag(BaseModel):
     tag_prefix = "refs/tags/"
 
-    def __init__(self, **kwargs):
-        super(Tag, self).__init__(**kwargs)
-        self.attributes = [
-            "ref",
-            "object",
-            "message",
-            "revision",
-            "tagger",
-            "created",
-            "can_delete",
-            "web_links",
-            "project",
-            "gerrit",
-        ]
+    attributes = (
+        "ref",
+        "object",
+        "message",
+        "revision",
+        "tagger",
+        "created",
+        "can_delete",
+        "web_links",
+        "project",
+        "gerrit",
+    )
+    __slots__ = attributes
 
     @property
     def name(self):
@@ -36,6 +36,8 @@ class Tag(BaseModel):
         """
         endpoint = "/projects/%s/tags/%s" % (self.project, self.name)
         self.gerrit.requester.delete(self.gerrit.get_endpoint_url(endpoint))
+        if self.gerrit.refs is not None:
+            self.gerrit.refs.remove("tags", self.project, self.ref)
 
 
 class Tags(object):
@@ -44,46 +46,64 @@ class Tags(object):
     def __init__(self, project, gerrit):
         self.project = project
         self.gerrit = gerrit
-        self._data = []
+        refs = gerrit.refs
+        if refs is not None:
+            # shared by all the Tags objects of the project
+            self._listing = refs.get_listing("tags", project, self.poll)
+        else:
+            self._listing = RefListing(self.poll)
 
-    def poll(self):
+    def poll(self, refresh=False):
         """
 
+        :param refresh: fetch the tags from the server, not from the response cache
         :return:
         """
         endpoint = "/projects/%s/tags/" % self.project
-        response = self.gerrit.requester.get(self.gerrit.get_endpoint_url(endpoint))
+        url = self.gerrit.get_endpoint_url(endpoint)
+        response_cache = self.gerrit.requester.response_cache
+        if refresh and response_cache is not None:
+            response_cache.delete(url)
+        response = self.gerrit.requester.get(url)
         result = self.gerrit.decode_response(response)
+        if self.gerrit.negative_cache is not None:
+            # the listing says which refs exist now
+            self.gerrit.negative_cache.discard_all("tags", self.project)
         return result
 
+    def refresh(self):
+        """
+        Fetch the tags again, e.g. to see the tags created by others before the listing expires.
+
+        :return:
+        """
+        self._listing.refresh()
+
     def iterkeys(self):
         """
         Iterate over the names of all available tags
         """
-        if not self._data:
-            self._data = self.poll()
-
-        for row in self._data:
-            yield row["ref"]
+        for ref in list(self._listing.refs):
+            yield ref
 
     def keys(self):
         """
         Return a list of the names of all tags
         """
-        return list(self.iterkeys())
+        return list(self._listing.refs)
 
     def __len__(self):
         """
 
         :return:
         """
-        return len(self.keys())
+        return len(self._listing.refs)
 
     def __contains__(self, ref):
         """
         True if ref exists in project
         """
-        return ref in self.keys()
+        return ref in self._listing.refs
 
     def __getitem__(self, ref):
         """
@@ -95,14 +115,19 @@ class Tags(object):
         if not ref.startswith(self.tag_prefix):
             raise KeyError("tag ref should start with {}".format(self.tag_prefix))
 
-        if not self._data:
-            self._data = self.poll()
-
-        result = [row for row in self._data if row["ref"] == ref]
-        if result:
-            return Tag.parse(result[0], project=self.project, gerrit=self.gerrit)
+        # the listing decides, as in __contains__, the negative cache only records the misses
+        negative_cache = self.gerrit.negative_cache
+        row = self._listing.refs.get(ref)
+        if row is not None:
+            if negative_cache is not None:
+                # created since the miss was recorded
+                negative_cache.discard("tags", self.project, ref)
+            return Tag.parse(row, project=self.project, gerrit=self.gerrit)
         else:
-            raise UnknownTag(ref)
+            error = UnknownTag(ref)
+            if negative_cache is not None:
+                negative_cache.add(error, "tags", self.project, ref)
+            raise error
 
     def __setitem__(self, key, value):
         """
@@ -123,20 +148,14 @@ class Tags(object):
         :param key:
         :return:
         """
-        self[key].delete()
-
-        # Reset to get it refreshed from Gerrit
-        self._data = []
+        self.delete(key)
 
     def __iter__(self):
         """
 
         :return:
         """
-        if not self._data:
-            self._data = self.poll()
-
-        for row in self._data:
+        for row in list(self._listing.refs.values()):
             yield Tag.parse(row, project=self.project, gerrit=self.gerrit)
 
     def get(self, name):
@@ -177,9 +196,9 @@ class Tags(object):
             base_url, json=input_, headers=self.gerrit.default_headers
         )
         result = self.gerrit.decode_response(response)
-
-        # Reset to get it refreshed from Gerrit
-        self._data = []
+        self._listing.add(result)
+        if self.gerrit.negative_cache is not None:
+            self.gerrit.negative_cache.discard("tags", self.project, ref)
 
         return Tag.parse(result, project=self.project, gerrit=self.gerrit)
 
@@ -191,6 +210,4 @@ class Tags(object):
         :return:
         """
         self[name].delete()
-
-        # Reset to get it refreshed from Gerrit
-        self._data = []
+        self._listing.remove(name)
@@ -6,20 +6,19 @@ from gerrit.utils.models import BaseModel
 
 
 class Webhook(BaseModel):
-    def __init__(self, **kwargs):
-        super(Webhook, self).__init__(**kwargs)
-        self.attributes = [
-            "name",
-            "url",
-            "maxTries",
-            "sslVerify",
-            "retryInterval",
-            "socketTimeout",
-            "connectionTimeout",
-            "events",
-            "project",
-            "gerrit",
-        ]
+    attributes = (
+        "name",
+        "url",
+        "maxTries",
+        "sslVerify",
+        "retryInterval",
+        "socketTimeout",
+        "connectionTimeout",
+        "events",
+        "project",
+        "gerrit",
+    )
+    __slots__ = attributes
 
     def delete(self):
         """
@@ -0,0 +1,964 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+import os
+import re
+import json
+import time
+import shutil
+import sqlite3
+import hashlib
+import threading
+from collections import OrderedDict
+from requests.structures import CaseInsensitiveDict
+from gerrit.utils.common import logger
+from gerrit.utils.exceptions import ClientError
+
+
+def make_request_key(url, params=None):
+    """
+    Build a hashable cache key for a request.
+
+    :param url: request url
+    :param params: request query parameters
+    :return:
+    """
+    if not params:
+        return url, ()
+    return url, tuple(sorted((str(k), str(v)) for k, v in params.items()))
+
+
+class ETagCache(object):
+    """
+    Size bounded store of the last response returned with an ETag for a request.
+    The Requester sends the ETag back as If-None-Match, and on '304 Not Modified'
+    hands out the stored response again. Since GerritClient.decode_response
+    memoizes the decoded content on the response, the JSON is not decoded again.
+
+    The decoded values are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(self, max_entries=1024):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """
+        :param key: request key, see make_request_key()
+        :return: the cached response or None
+        """
+        with self._lock:
+            response = self._entries.get(key)
+            if response is not None:
+                self._entries.move_to_end(key)
+            return response
+
+    def set(self, key, response):
+        """
+        :param key: request key, see make_request_key()
+        :param response: a response with an ETag header
+        :return:
+        """
+        with self._lock:
+            self._entries[key] = response
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        """
+        :param key: request key, see make_request_key()
+        :return:
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        """
+        Drop all the cached responses.
+
+        :return:
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+#: Declarative map from the mutating endpoints to the cached read endpoints they make stale.
+#: The first rule whose pattern matches the endpoint of a POST, PUT or DELETE request applies.
+#: In the read endpoints {0}, {1}... are the groups of the pattern, and a trailing '*' matches
+#: any suffix. Without a trailing '*' the endpoint is evicted with any query string.
+INVALIDATION_RULES = (
+    # projects
+    (r"/projects/([^/]+)/branches(?:/|:delete)", ("/projects/{0}/branches/*",)),
+    (r"/projects/([^/]+)/tags(?:/|:delete)", ("/projects/{0}/tags/*",)),
+    (r"/projects/([^/]+)/labels/", ("/projects/{0}/labels/*",)),
+    (r"/projects/([^/]+)/dashboards/", ("/projects/{0}/dashboards/*",)),
+    (
+        r"/projects/([^/]+)/(?:config|description)$",
+        (
+            "/projects/{0}",
+            "/projects/{0}/config",
+            "/projects/{0}/description",
+            "/projects/?*",
+        ),
+    ),
+    (r"/projects/([^/]+)/parent$", ("/projects/{0}", "/projects/{0}/parent")),
+    (r"/projects/([^/]+)/HEAD$", ("/projects/{0}/HEAD", "/projects/{0}/branches/*")),
+    (r"/projects/([^/]+)/access", ("/projects/{0}/access*",)),
+    (r"/projects/([^/]+)/(?:create\.change|commits/[^/]+/cherrypick)$", ("/changes/?*",)),
+    (r"/projects/([^/]+)/(?:ban|gc|index|index\.changes|check)$", ()),
+    (
+        r"/projects/([^/]+)(?:/delete-project~delete)?$",
+        ("/projects/{0}", "/projects/{0}/*", "/projects/?*"),
+    ),
+    (r"/projects/([^/]+)", ("/projects/{0}", "/projects/{0}/*")),
+    # changes
+    (r"/changes/$", ("/changes/?*",)),
+    (r"/changes/([^/]+)", ("/changes/{0}", "/changes/{0}/*", "/changes/?*")),
+    # accounts
+    (r"/accounts/([^/]+)$", ("/accounts/{0}", "/accounts/{0}/*", "/accounts/?*")),
+    (
+        r"/accounts/([^/]+)/(name|username|displayname|status|active)$",
+        (
+            "/accounts/{0}",
+            "/accounts/{0}/detail",
+            "/accounts/{0}/{1}",
+            "/accounts/?*",
+        ),
+    ),
+    (
+        r"/accounts/([^/]+)/emails/",
+        ("/accounts/{0}", "/accounts/{0}/detail", "/accounts/{0}/emails*"),
+    ),
+    (r"/accounts/([^/]+)/([^/:]+)", ("/accounts/{0}/{1}*",)),
+    # groups
+    (r"/groups/([^/]+)/members", ("/groups/{0}/members*",)),
+    (r"/groups/([^/]+)/groups", ("/groups/{0}/groups*",)),
+    (
+        r"/groups/([^/]+)(?:/name|/description|/options|/owner)?$",
+        ("/groups/{0}", "/groups/{0}/*", "/groups/", "/groups/?*"),
+    ),
+    (r"/groups/([^/]+)", ("/groups/{0}", "/groups/{0}/*")),
+    # config
+    (r"/config/server/caches/", ("/config/server/caches/*",)),
+    (r"/config/server/tasks/", ("/config/server/tasks/*",)),
+    (r"/config/server/(preferences[^/]*)$", ("/config/server/{0}",)),
+    (
+        r"/config/server/webhooks~projects/([^/]+)/",
+        ("/config/server/webhooks~projects/{0}/*",),
+    ),
+    (r"/config/server/reload$", ("/config/*",)),
+)
+
+
+#: Endpoints addressed by a full commit SHA, whose responses never change
+IMMUTABLE_ENDPOINTS = (
+    r"/projects/[^/]+/commits/[0-9a-f]{40}(?:/files/(?:[^/]+/content)?)?$",
+    r"/changes/[^/]+/revisions/[0-9a-f]{40}/(?:commit|files/[^/]+/(?:content|diff))$",
+)
+
+
+#: Endpoints whose responses are about the authenticated account itself,
+#: never kept in a store outside of the process (see CacheBackend.shared)
+PRIVATE_ENDPOINTS = (r"/accounts/self(?:[/?]|$)",)
+
+
+def make_principal(username):
+    """
+    Build the opaque id of the account the responses are cached for, so that the
+    clients of different accounts sharing a store don't see the responses of each other.
+
+    :param username:
+    :return:
+    """
+    return hashlib.sha256((username or "").encode("utf-8")).hexdigest()[:16]
+
+
+def make_cache_key(url, params=None, principal=None):
+    """
+    Build the string key of a request in the response cache.
+    The principal is appended after a '#', which never appears in a request url,
+    so the keys of all the accounts still start with the url.
+
+    :param url: request url
+    :param params: request query parameters
+    :param principal: id of the authenticated account, see make_principal()
+    :return:
+    """
+    key = url
+    if params:
+        query = "&".join("%s=%s" % (k, v) for k, v in make_request_key(url, params)[1])
+        key = "%s%s%s" % (url, "&" if "?" in url else "?", query)
+    if principal is not None:
+        key = "%s#%s" % (key, principal)
+    return key
+
+
+class CachedResponse(object):
+    """
+    A response served by the response cache. It has the attributes of a requests.Response
+    used by the library: status_code, reason, url, headers, content, encoding, text and ok.
+    """
+
+    from_cache = True
+
+    def __init__(
+        self,
+        status_code,
+        headers,
+        content,
+        encoding=None,
+        url=None,
+        reason="OK",
+        fresh_until=None,
+    ):
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(headers)
+        self.content = content
+        self.encoding = encoding
+        self.url = url
+        self.reason = reason
+        # time after which the response is served stale while it is revalidated
+        self.fresh_until = fresh_until
+        # a response held in memory may be handed out to concurrent callers, decode it only once
+        self.gerrit_decode_lock = threading.Lock()
+
+    @classmethod
+    def from_response(cls, response):
+        """
+        :param response: a requests.Response, read entirely
+        :return:
+        """
+        return cls(
+            response.status_code,
+            dict(response.headers),
+            response.content,
+            encoding=response.encoding,
+            url=response.url,
+            reason=response.reason,
+        )
+
+    @property
+    def ok(self):
+        return self.status_code < 400
+
+    @property
+    def stale(self):
+        return self.fresh_until is not None and self.fresh_until < time.time()
+
+    @property
+    def text(self):
+        return self.content.decode(self.encoding or "utf-8", "replace")
+
+    def json(self, **kwargs):
+        return json.loads(self.text, **kwargs)
+
+    def iter_content(self, chunk_size=1, decode_unicode=False):
+        for i in range(0, len(self.content), chunk_size):
+            yield self.content[i:i + chunk_size]
+
+    def close(self):
+        pass
+
+    def to_bytes(self):
+        """
+        Serialize the response, for the stores outside of the process.
+
+        :return:
+        """
+        header = {
+            "status_code": self.status_code,
+            "headers": dict(self.headers),
+            "encoding": self.encoding,
+            "url": self.url,
+            "reason": self.reason,
+            "fresh_until": self.fresh_until,
+        }
+        return json.dumps(header).encode("utf-8") + b"\n" + self.content
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        :param data: bytes returned by to_bytes()
+        :return:
+        """
+        header, _, content = bytes(data).partition(b"\n")
+        header = json.loads(header.decode("utf-8"))
+        return cls(
+            header["status_code"],
+            header["headers"],
+            content,
+            encoding=header["encoding"],
+            url=header["url"],
+            reason=header["reason"],
+            fresh_until=header.get("fresh_until"),
+        )
+
+
+class CacheBackend(object):
+    """
+    Interface of the stores of the response cache.
+    The keys are strings (see make_cache_key()), the values are CachedResponse.
+    The stores are shared unless they set shared = False: the responses of the
+    PRIVATE_ENDPOINTS are only kept by the stores private to the process.
+
+    A store outside of the process, e.g. Redis or memcached, keeps the bytes of
+    CachedResponse.to_bytes() and relies on the expiration of the store:
+
+    .. code-block:: python
+
+        class RedisCache(CacheBackend):
+            def __init__(self, client):
+                self.client = client
+
+            def get(self, key):
+                data = self.client.get(key)
+                return CachedResponse.from_bytes(data) if data is not None else None
+
+            def set(self, key, response, ttl):
+                self.client.set(key, response.to_bytes(), ex=int(ttl))
+
+            def delete(self, key):
+                self.client.delete(key)
+
+            def delete_prefix(self, prefix):
+                pattern = re.sub(r"([*?\\[\\]\\\\])", r"\\\\\\1", prefix) + "*"
+                for key in self.client.scan_iter(match=pattern):
+                    self.client.delete(key)
+
+            def clear(self):
+                self.client.flushdb()
+    """
+
+    #: whether the store is seen by other processes or machines
+    shared = True
+
+    def get(self, key):
+        """
+        :param key:
+        :return: the cached response, None if missing or expired
+        """
+        raise NotImplementedError
+
+    def set(self, key, response, ttl):
+        """
+        :param key:
+        :param response: a CachedResponse
+        :param ttl: seconds the response is valid
+        :return:
+        """
+        raise NotImplementedError
+
+    def delete(self, key):
+        """
+        :param key:
+        :return:
+        """
+        raise NotImplementedError
+
+    def delete_prefix(self, prefix):
+        """
+        Delete the responses whose key starts with prefix.
+
+        :param prefix:
+        :return:
+        """
+        raise NotImplementedError
+
+    def clear(self):
+        """
+        Drop all the cached responses.
+
+        :return:
+        """
+        raise NotImplementedError
+
+
+class MemoryCache(CacheBackend):
+    """
+    In-process store, size bounded with LRU eviction.
+    """
+
+    shared = False
+
+    def __init__(self, max_entries=1024):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, response = entry
+            if expires < time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return response
+
+    def set(self, key, response, ttl):
+        with self._lock:
+            self._entries[key] = (time.time() + ttl, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def delete_prefix(self, prefix):
+        with self._lock:
+            for key in [k for k in self._entries if k.startswith(prefix)]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class SQLiteCache(CacheBackend):
+    """
+    On-disk store in a SQLite database, size bounded with LRU eviction.
+    The database can be shared by the processes of a machine, e.g. CI jobs.
+    """
+
+    def __init__(self, path, max_entries=10000):
+        """
+        :param path: database file, ':memory:' for a private in-memory database
+        :param max_entries: maximum number of cached responses
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.shared = path != ":memory:"
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, value BLOB, expires REAL, accessed REAL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)"
+            )
+
+    def get(self, key):
+        now = time.time()
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                "SELECT value, expires FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] < now:
+                self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+            self._connection.execute(
+                "UPDATE responses SET accessed = ? WHERE key = ?", (now, key)
+            )
+        return CachedResponse.from_bytes(row[0])
+
+    def set(self, key, response, ttl):
+        now = time.time()
+        value = sqlite3.Binary(response.to_bytes())
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses (key, value, expires, accessed) "
+                "VALUES (?, ?, ?, ?)",
+                (key, value, now + ttl, now),
+            )
+            count = self._connection.execute(
+                "SELECT COUNT(*) FROM responses"
+            ).fetchone()[0]
+            if count > self.max_entries:
+                self._connection.execute(
+                    "DELETE FROM responses WHERE key IN "
+                    "(SELECT key FROM responses ORDER BY accessed LIMIT ?)",
+                    (count - self.max_entries,),
+                )
+
+    def delete(self, key):
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def delete_prefix(self, prefix):
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM responses WHERE substr(key, 1, ?) = ?", (len(prefix), prefix)
+            )
+
+    def clear(self):
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses")
+
+    def close(self):
+        self._connection.close()
+
+    def __len__(self):
+        with self._lock:
+            return self._connection.execute(
+                "SELECT COUNT(*) FROM responses"
+            ).fetchone()[0]
+
+
+class ResponseCache(object):
+    """
+    Cache of the GET responses of the endpoint families which rarely change,
+    each family with its own TTL.
+
+    .. code-block:: python
+
+        cache = ResponseCache(SQLiteCache("/var/cache/gerrit.sqlite"), ttls={"projects": 600})
+        gerrit = GerritClient(base_url=url, username=username, password=password, response_cache=cache)
+
+    The family of an endpoint is its first path segment, e.g. 'projects' for
+    '/projects/X/config'. The responses of the families without a TTL are not cached.
+    The keys are the urls of the primary server, the requests routed to replicas share them,
+    followed by the principal, an opaque id of the account of the client: the responses
+    filtered by the permissions of an account are not served to the other accounts
+    sharing the backend. A ResponseCache serves a single account, and the responses
+    about the account itself (see PRIVATE_ENDPOINTS) are only kept by the in-process backends.
+
+    The POST, PUT and DELETE requests sent by the client evict the responses they make
+    stale, as described by the rules (see INVALIDATION_RULES), e.g. creating a branch
+    evicts the branches of the project but not its configuration.
+
+    A family with a stale TTL is served stale-while-revalidate: for stale_ttl seconds
+    after its TTL, a response is still returned at once while a background thread
+    fetches it again, once per key. E.g. for a dashboard:
+
+    .. code-block:: python
+
+        cache = ResponseCache(ttls={"changes": 10}, stale_ttls={"changes": 600})
+
+    caches the change searches, reviewers and reviews, and only waits for the server
+    on the first load of a page or after 10 minutes without a load.
+    """
+
+    DEFAULT_TTLS = {"projects": 300, "accounts": 300, "groups": 300, "config": 3600}
+
+    def __init__(
+        self,
+        backend=None,
+        ttls=None,
+        prefix=None,
+        rules=INVALIDATION_RULES,
+        stale_ttls=None,
+        principal=None,
+        private_patterns=PRIVATE_ENDPOINTS,
+    ):
+        """
+        :param backend: a CacheBackend, a MemoryCache by default
+        :param ttls: TTL in seconds by endpoint family, merged into DEFAULT_TTLS
+        :param prefix: url prefix of the endpoints, e.g. 'https://review.example.com/a',
+          set by the GerritClient
+        :param rules: invalidation rules, see INVALIDATION_RULES
+        :param stale_ttls: seconds by endpoint family an expired response is served
+          while it is revalidated
+        :param principal: id of the account the responses are cached for, see make_principal(),
+          set by the GerritClient
+        :param private_patterns: regular expressions of the endpoints not kept by shared backends
+        """
+        self.backend = backend if backend is not None else MemoryCache()
+        self.ttls = dict(self.DEFAULT_TTLS)
+        self.ttls.update(ttls or {})
+        self.stale_ttls = dict(stale_ttls or {})
+        self.prefix = prefix
+        self.principal = principal
+        self.rules = [(re.compile(pattern), targets) for pattern, targets in rules]
+        self.private_patterns = [re.compile(pattern) for pattern in private_patterns]
+        self._revalidating = set()
+        self._lock = threading.Lock()
+
+    def get_endpoint(self, url):
+        """
+        :param url:
+        :return: the endpoint path of a url, e.g. '/projects/X/config', None if unknown
+        """
+        if self.prefix is None or not url.startswith(self.prefix):
+            return None
+        return url[len(self.prefix):]
+
+    def get_family(self, url):
+        """
+        :param url:
+        :return: the endpoint family of a url, e.g. 'projects', None if unknown
+        """
+        endpoint = self.get_endpoint(url)
+        if not endpoint:
+            return None
+        return endpoint.split("?", 1)[0].split("/")[1]
+
+    def get_ttl(self, url):
+        """
+        :param url:
+        :return: the TTL of the endpoint family of a url, None if it is not cached
+        """
+        if getattr(self.backend, "shared", True) and self.is_private(url):
+            return None
+        return self.ttls.get(self.get_family(url)) or None
+
+    def is_private(self, url):
+        """
+        :param url:
+        :return: True if the response of the url is about the account of the client
+        """
+        endpoint = self.get_endpoint(url)
+        if endpoint is None:
+            return False
+        return any(pattern.match(endpoint) for pattern in self.private_patterns)
+
+    def make_key(self, url, params=None):
+        """
+        :param url:
+        :param params:
+        :return: the key of a request in the backend
+        """
+        return make_cache_key(url, params, self.principal)
+
+    def get(self, url, params=None):
+        """
+        :param url:
+        :param params:
+        :return: the cached response, None on a miss
+        """
+        if self.get_ttl(url) is None:
+            return None
+        return self.backend.get(self.make_key(url, params))
+
+    def set(self, url, params, response):
+        """
+        Cache a successful response.
+
+        :param url:
+        :param params:
+        :param response:
+        :return:
+        """
+        ttl = self.get_ttl(url)
+        if ttl is None or response.status_code != 200:
+            return
+        cached = CachedResponse.from_response(response)
+        stale_ttl = self.stale_ttls.get(self.get_family(url))
+        if stale_ttl:
+            # kept by the backend until the end of the stale window
+            cached.fresh_until = time.time() + ttl
+            ttl += stale_ttl
+        self.backend.set(self.make_key(url, params), cached, ttl)
+
+    def revalidate(self, url, params, fetch):
+        """
+        Fetch a stale response again in a background thread, unless it is being fetched.
+
+        :param url:
+        :param params:
+        :param fetch: function sending the request
+        :return:
+        """
+        key = self.make_key(url, params)
+        with self._lock:
+            if key in self._revalidating:
+                return
+            self._revalidating.add(key)
+
+        def run():
+            try:
+                self.set(url, params, fetch())
+            except ClientError as error:
+                # e.g. the resource was deleted, don't serve it any longer
+                logger.warning("Failed to revalidate %s: %s" % (key, error))
+                self.backend.delete(key)
+            except Exception as error:
+                logger.warning("Failed to revalidate %s: %s" % (key, error))
+            finally:
+                with self._lock:
+                    self._revalidating.discard(key)
+
+        thread = threading.Thread(target=run, name="gerrit-revalidate")
+        thread.daemon = True
+        thread.start()
+
+    def delete(self, url, params=None):
+        self.backend.delete(self.make_key(url, params))
+
+    def get_stale_endpoints(self, endpoint):
+        """
+        :param endpoint: the endpoint of a mutation, e.g. '/projects/foo/branches/stable'
+        :return: the read endpoints made stale, e.g. ['/projects/foo/branches/*']
+        """
+        path = endpoint.split("?", 1)[0]
+        for pattern, targets in self.rules:
+            match = pattern.match(path)
+            if match is not None:
+                return [target.format(*match.groups()) for target in targets]
+        return []
+
+    def invalidate(self, method, url):
+        """
+        Evict the responses made stale by a request, those of all the accounts sharing the backend.
+
+        :param method: http method
+        :param url:
+        :return:
+        """
+        if method.upper() in ("GET", "HEAD"):
+            return
+        endpoint = self.get_endpoint(url)
+        if endpoint is None:
+            return
+        for target in self.get_stale_endpoints(endpoint):
+            if target.endswith("*"):
+                self.backend.delete_prefix(self.prefix + target[:-1])
+            else:
+                self.backend.delete(self.prefix + target)
+                self.backend.delete_prefix(self.prefix + target + "#")
+                self.backend.delete_prefix(self.prefix + target + "?")
+
+    def clear(self):
+        self.backend.clear()
+
+
+class ImmutableCache(object):
+    """
+    Permanent on-disk cache of the GET responses addressed by a full commit SHA
+    (see IMMUTABLE_ENDPOINTS), e.g. the content of a file at a commit or the diff
+    of a file in a patch set given by its SHA. The responses never expire, the
+    least recently used contents are evicted when the cache exceeds max_size.
+
+    .. code-block:: python
+
+        gerrit = GerritClient(base_url=url, username=username, password=password, immutable_cache=True)
+
+    The contents are stored once by SHA-256, whatever the number of endpoints
+    returning them::
+
+        <path>/keys/<ab>/<sha1 of the request>  status, headers and content digest
+        <path>/objects/<ab>/<sha256 of the content>
+
+    The directory can be shared by the processes of a machine, e.g. CI jobs.
+    The request keys include the principal of the client (see make_principal()),
+    a content is only served to the accounts which fetched it from the server.
+    """
+
+    def __init__(
+        self,
+        path=None,
+        max_size=1 << 30,
+        prefix=None,
+        patterns=IMMUTABLE_ENDPOINTS,
+        principal=None,
+    ):
+        """
+        :param path: cache directory, defaults to ~/.cache/python-gerrit-api
+        :param max_size: maximum size of the keys and contents in bytes
+        :param prefix: url prefix of the endpoints, set by the GerritClient
+        :param patterns: regular expressions of the immutable endpoints
+        :param principal: id of the account the responses are cached for, set by the GerritClient
+        """
+        if path is None:
+            path = os.path.join(os.path.expanduser("~"), ".cache", "python-gerrit-api")
+        self.path = path
+        self.max_size = max_size
+        self.prefix = prefix
+        self.principal = principal
+        self.patterns = [re.compile(pattern) for pattern in patterns]
+        self._size = None
+        self._lock = threading.Lock()
+
+    def is_immutable(self, url):
+        """
+        :param url:
+        :return: True if the response of the url never changes
+        """
+        if self.prefix is None or not url.startswith(self.prefix):
+            return False
+        path = url[len(self.prefix):].split("?", 1)[0]
+        return any(pattern.match(path) for pattern in self.patterns)
+
+    def get(self, url, params=None):
+        """
+        :param url:
+        :param params:
+        :return: the cached response, None on a miss
+        """
+        if not self.is_immutable(url):
+            return None
+        key_path = self._key_path(make_cache_key(url, params, self.principal))
+        try:
+            with open(key_path, "rb") as f:
+                header = json.loads(f.read().decode("utf-8"))
+            object_path = self._object_path(header["digest"])
+        except (IOError, OSError, ValueError, KeyError):
+            return None
+        try:
+            with open(object_path, "rb") as f:
+                content = f.read()
+            # the modification time of the keys and objects orders the eviction
+            os.utime(object_path, None)
+            os.utime(key_path, None)
+        except (IOError, OSError):
+            # the content was evicted, drop its key
+            self._remove(key_path)
+            return None
+        return CachedResponse(
+            header["status_code"],
+            header["headers"],
+            content,
+            encoding=header["encoding"],
+            url=header["url"],
+            reason=header["reason"],
+        )
+
+    def set(self, url, params, response):
+        """
+        Cache a successful response of an immutable endpoint.
+
+        :param url:
+        :param params:
+        :param response:
+        :return:
+        """
+        if not self.is_immutable(url) or response.status_code != 200:
+            return
+        content = response.content
+        digest = hashlib.sha256(content).hexdigest()
+        header = {
+            "status_code": response.status_code,
+            "headers": dict(response.headers),
+            "encoding": response.encoding,
+            "url": response.url,
+            "reason": response.reason,
+            "digest": digest,
+        }
+        size = self.size
+        object_path = self._object_path(digest)
+        if not os.path.exists(object_path):
+            self._write(object_path, content)
+            size += len(content)
+        key_path = self._key_path(make_cache_key(url, params, self.principal))
+        data = json.dumps(header).encode("utf-8")
+        try:
+            size -= os.path.getsize(key_path)
+        except OSError:
+            pass
+        self._write(key_path, data)
+        with self._lock:
+            self._size = size + len(data)
+        if self.size > self.max_size:
+            self.evict()
+
+    @property
+    def size(self):
+        """
+        :return: size of the keys and contents in bytes
+        """
+        if self._size is None:
+            self._size = sum(size for _, size, _ in self._scan("keys") + self._scan("objects"))
+        return self._size
+
+    def evict(self):
+        """
+        Delete the least recently used contents until the cache fits in max_size,
+        with the keys of the deleted contents, then the least recently used keys
+        if they don't fit on their own.
+
+        :return:
+        """
+        with self._lock:
+            objects = sorted(self._scan("objects"))
+            size = sum(size for _, size, _ in objects)
+            existing = set(path for _, _, path in objects)
+            keys = {}
+            for key in self._scan("keys"):
+                try:
+                    with open(key[2], "rb") as f:
+                        object_path = self._object_path(
+                            json.loads(f.read().decode("utf-8"))["digest"]
+                        )
+                except (IOError, OSError, ValueError, KeyError):
+                    object_path = None
+                if object_path in existing:
+                    keys.setdefault(object_path, []).append(key)
+                    size += key[1]
+                else:
+                    # the content was evicted
+                    self._remove(key[2])
+
+            for _, object_size, object_path in objects:
+                if size <= self.max_size:
+                    break
+                if self._remove(object_path):
+                    size -= object_size
+                    for _, key_size, key_path in keys.pop(object_path, []):
+                        self._remove(key_path)
+                        size -= key_size
+
+            remaining = sorted(key for entries in keys.values() for key in entries)
+            for _, key_size, key_path in remaining:
+                if size <= self.max_size:
+                    break
+                if self._remove(key_path):
+                    size -= key_size
+            self._size = size
+
+    def clear(self):
+        with self._lock:
+            for name in ("keys", "objects"):
+                shutil.rmtree(os.path.join(self.path, name), ignore_errors=True)
+            self._size = 0
+
+    def _key_path(self, key):
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.path, "keys", digest[:2], digest)
+
+    def _object_path(self, digest):
+        return os.path.join(self.path, "objects", digest[:2], digest)
+
+    def _scan(self, name):
+        entries = []
+        root = os.path.join(self.path, name)
+        for directory, _, names in os.walk(root):
+            for name_ in names:
+                path = os.path.join(directory, name_)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+            return True
+        except OSError:
+            # removed by another thread or process
+            return False
+
+    @staticmethod
+    def _write(path, data):
+        directory = os.path.dirname(path)
+        if not os.path.isdir(directory):
+            try:
+                os.makedirs(directory)
+            except OSError:
+                # created by another thread or process
+                pass
+        # written aside and renamed, the readers never see a partial file
+        temp = "%s.%s.%s.tmp" % (path, os.getpid(), threading.current_thread().ident)
+        with open(temp, "wb") as f:
+            f.write(data)
+        try:
+            os.rename(temp, path)
+        except OSError:
+            os.remove(temp)
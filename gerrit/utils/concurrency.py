@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Default number of threads fetching the details of the items of a listing
+DEFAULT_MAX_WORKERS = 8
+
+
+def bounded_map(fn, items, max_workers=DEFAULT_MAX_WORKERS):
+    """
+    Apply a function to items with at most max_workers threads.
+
+    :param fn: function of one item
+    :param items:
+    :param max_workers: maximum number of threads, 1 to run in the calling thread
+    :return: the list of the results, in the order of the items
+    """
+    items = list(items)
+    if max_workers <= 1 or len(items) <= 1:
+        return [fn(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(fn, items))
+
+
+class _Call(object):
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight(object):
+    """
+    Coalesce concurrent calls sharing the same key: the first caller runs the
+    function, the callers arriving while it is in flight wait for it and get
+    the same result (or the same exception).
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, fn):
+        """
+        :param key: hashable key identifying the call
+        :param fn: function without arguments
+        :return: the result of fn
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except Exception as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def __len__(self):
+        return len(self._calls)
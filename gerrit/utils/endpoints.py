@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+"""
+Endpoints of the top level collections, shared by GerritClient and AsyncGerritClient
+so that both clients send the same requests. The '%s' are filled with the ids, e.g.
+``ACCOUNT_DETAIL % username``.
+"""
+
+# config
+CONFIG_VERSION = "/config/server/version"
+CONFIG_INFO = "/config/server/info"
+CONFIG_CHECK_CONSISTENCY = "/config/server/check.consistency"
+CONFIG_RELOAD = "/config/server/reload"
+CONFIG_CONFIRM_EMAIL = "/config/server/email.confirm"
+CONFIG_SUMMARY = "/config/server/summary"
+CONFIG_CAPABILITIES = "/config/server/capabilities"
+CONFIG_TOP_MENUS = "/config/server/top-menus"
+CONFIG_USER_PREFERENCES = "/config/server/preferences"
+CONFIG_DIFF_PREFERENCES = "/config/server/preferences.diff"
+CONFIG_EDIT_PREFERENCES = "/config/server/preferences.edit"
+CONFIG_INDEX_CHANGES = "/config/server/index.changes"
+
+# projects
+PROJECTS_ALL = "/projects/?all"
+PROJECTS_QUERY = "/projects/?query=%s"
+PROJECT = "/projects/%s"
+PROJECT_DELETE = "/projects/%s/delete-project~delete"
+
+# changes
+CHANGES = "/changes/"
+CHANGES_QUERY = "/changes/?%s"
+CHANGE = "/changes/%s"
+
+# accounts
+ACCOUNTS = "/accounts/"
+ACCOUNTS_SUGGEST = "/accounts/?suggest&q=%s"
+ACCOUNT = "/accounts/%s"
+ACCOUNT_DETAIL = "/accounts/%s/detail"
+ACCOUNT_SELF_DETAIL = ACCOUNT_DETAIL % "self"
+
+# groups
+GROUPS = "/groups/"
+GROUPS_QUERY = "/groups/?query=inname:%s"
+GROUPS_QUERY2 = "/groups/?query2=inname:%s"
+GROUP = "/groups/%s"
+
+# plugins
+PLUGINS_ALL = "/plugins/?all"
+PLUGIN_STATUS = "/plugins/%s/gerrit~status"
+PLUGIN_JAR = "/plugins/%s.jar"
@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+import re
+import time
+import threading
+from packaging.version import parse
+
+
+# The minimum Gerrit server version of the version dependent REST APIs.
+FEATURES = {
+    "attention_set": "3.3.0",
+    "revert_submission": "3.2.0",
+    "project_create_change": "3.3.0",
+    "project_labels": "3.2.0",
+    "groups_query": "3.2.0",
+    "account_display_name": "3.2.0",
+}
+
+_FEATURE_VERSIONS = dict((key, parse(value)) for key, value in FEATURES.items())
+
+
+class ServerFeatures(object):
+    """
+    Client level cache of the Gerrit server version.
+
+    The version is fetched once from '/config/server/version' and parsed once,
+    then it is kept for ttl seconds (or forever if ttl is None). Version dependent
+    methods check the FEATURES table through supports() without any network I/O.
+    """
+
+    def __init__(self, gerrit, ttl=3600):
+        self.gerrit = gerrit
+        self.ttl = ttl
+        self._version = None
+        self._parsed_version = None
+        self._fetched_at = None
+        self._lock = threading.Lock()
+
+    def is_stale(self):
+        """
+        True if the version has never been fetched or has expired.
+
+        :return:
+        """
+        if self._version is None:
+            return True
+        if self.ttl is None:
+            return False
+        return time.time() - self._fetched_at >= self.ttl
+
+    def update(self, version, fetched_at=None):
+        """
+        Store a server version, e.g. one fetched by the async client.
+
+        :param version: the version string returned by the server
+        :param fetched_at: timestamp of the fetch, defaults to now
+        :return:
+        """
+        # Development builds report versions like '3.4.1-12-g0123abcd'
+        match = re.match(r"\d+(\.\d+)*", version or "")
+        parsed_version = parse(match.group(0) if match else "0")
+        with self._lock:
+            self._version = version
+            self._parsed_version = parsed_version
+            self._fetched_at = fetched_at if fetched_at is not None else time.time()
+
+    def refresh(self):
+        """
+        Fetch the server version again.
+
+        :return:
+        """
+        self.update(self.gerrit.config.get_version())
+        return self._version
+
+    @property
+    def version(self):
+        """
+        The version string of the Gerrit server.
+
+        :return:
+        """
+        if self.is_stale():
+            self.refresh()
+        return self._version
+
+    @property
+    def parsed_version(self):
+        """
+        The parsed version of the Gerrit server.
+
+        :return:
+        """
+        if self.is_stale():
+            self.refresh()
+        return self._parsed_version
+
+    def supports(self, feature):
+        """
+        Check whether the Gerrit server supports a feature of the FEATURES table.
+
+        :param feature: feature name
+        :return:
+        """
+        if feature not in _FEATURE_VERSIONS:
+            raise ValueError("Unknown feature: %s" % feature)
+        return self.parsed_version >= _FEATURE_VERSIONS[feature]
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+def _orjson_loads(data):
+    # orjson parses bytes, bytearray and memoryview without copying them
+    return orjson.loads(data)
+
+
+def _ujson_loads(data):
+    if not isinstance(data, str):
+        # decoded straight from the buffer, bytes(data) would copy it first
+        data = str(data, "utf-8")
+    return ujson.loads(data)
+
+
+def _json_loads(data):
+    if not isinstance(data, str):
+        data = str(data, "utf-8")
+    return json.loads(data)
+
+
+BACKENDS = {"json": _json_loads}
+if ujson is not None:
+    BACKENDS["ujson"] = _ujson_loads
+if orjson is not None:
+    BACKENDS["orjson"] = _orjson_loads
+
+backend = "orjson" if orjson is not None else "ujson" if ujson is not None else "json"
+_loads = BACKENDS[backend]
+
+
+def use_backend(name):
+    """
+    Select the JSON parser used to decode the responses.
+    By default the fastest installed one is used: orjson, then ujson, then the json module.
+
+    :param name: 'orjson', 'ujson' or 'json'
+    :return:
+    """
+    global backend, _loads
+    if name not in BACKENDS:
+        raise ValueError("JSON backend %s is not installed" % name)
+    backend = name
+    _loads = BACKENDS[name]
+
+
+def loads(data):
+    """
+    Parse UTF-8 JSON from bytes, a memoryview or a str.
+
+    :param data:
+    :return:
+    """
+    return _loads(data)
@@ -3,35 +3,348 @@
 # @Author: Jialiang Shi
 
 
+import importlib
+from collections import OrderedDict
+
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+def _import_optional(name):
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        raise ImportError(
+            "%s is required for this conversion, "
+            "install it with 'pip install python-gerrit-api[columnar]'" % name
+        )
+
+
 class ResultSet(list):
     """A list like object that holds results from a Gerrit API query."""
 
 
+class ColumnarResultSet(object):
+    """
+    Results of a Gerrit API query stored field by field, one list per field.
+
+    .. code-block:: python
+
+        changes = gerrit.changes.search("q=status:open", columnar=True)
+        mine = changes.filter(owner___account_id=1000096, project=("foo", "bar"))
+        by_project = changes.groupby("project")
+        frame = changes.to_pandas(["_number", "project", "status", "owner._account_id"])
+
+    A field name may be a path into the JSON objects, e.g. 'owner._account_id'.
+    In keyword arguments the path separator is '__' instead.
+    """
+
+    def __init__(self, model, columns, length, constants=None):
+        """
+        :param model: the model class of the results
+        :param columns: lists of values by field name
+        :param length: the number of results
+        :param constants: values shared by all the results, e.g. gerrit
+        """
+        self.model = model
+        self.columns = columns
+        self.length = length
+        self.constants = constants or {}
+
+    @classmethod
+    def from_json(cls, model, data, **kwargs):
+        """
+        Store a list of JSON objects column by column.
+
+        :param model: the model class of the results
+        :param data: list of JSON objects
+        :param kwargs: values shared by all the results
+        :return:
+        """
+        data = [obj for obj in data or [] if obj]
+        constants = dict((k, v) for k, v in kwargs.items() if k in model.fields)
+        columns = OrderedDict()
+        for key in model.attributes:
+            if key not in constants:
+                raw_key = model.aliases.get(key, key)
+                columns[key] = [obj.get(raw_key) for obj in data]
+        return cls(model, columns, len(data), constants)
+
+    @property
+    def fields(self):
+        return list(self.columns)
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        for i in range(self.length):
+            yield self.row(i)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.take(range(*index.indices(self.length)))
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError(index)
+        return self.row(index)
+
+    def __repr__(self):
+        return "%s(%s, %s results)" % (
+            self.__class__.__name__,
+            self.model.__name__,
+            self.length,
+        )
+
+    def row(self, index):
+        """
+        Build the model instance of a result.
+
+        :param index:
+        :return:
+        """
+        model = self.model
+        data = {}
+        for key, values in self.columns.items():
+            if values[index] is not None:
+                data[model.aliases.get(key, key)] = values[index]
+        return model.parse(data, **self.constants)
+
+    def to_list(self):
+        """
+        :return: a ResultSet of model instances
+        """
+        return ResultSet(self)
+
+    def column(self, name):
+        """
+        The values of a field, e.g. 'status' or 'owner._account_id'.
+
+        :param name:
+        :return: a list
+        """
+        field, _, path = name.partition(".")
+        if field in self.constants:
+            return [self.constants[field]] * self.length
+        values = self.columns[field]
+        if path:
+            for part in path.split("."):
+                values = [v.get(part) if isinstance(v, dict) else None for v in values]
+        return values
+
+    def mask(self, name, condition):
+        """
+        Evaluate a condition on every value of a field.
+
+        :param name: field name
+        :param condition: a value, a list/tuple/set of values or a function
+        :return: a list of booleans
+        """
+        values = self.column(name)
+        if callable(condition):
+            return [bool(condition(v)) for v in values]
+        if isinstance(condition, (list, tuple, set, frozenset)):
+            condition = set(condition)
+            return [v in condition for v in values]
+        return [v == condition for v in values]
+
+    def take(self, indices):
+        """
+        :param indices: the indices of the results to keep
+        :return: a new ColumnarResultSet
+        """
+        indices = list(indices)
+        columns = OrderedDict(
+            (key, [values[i] for i in indices]) for key, values in self.columns.items()
+        )
+        return self.__class__(self.model, columns, len(indices), self.constants)
+
+    def filter(self, mask=None, **conditions):
+        """
+        Keep the results matching all the conditions.
+
+        .. code-block:: python
+
+            changes.filter(status="NEW")
+            changes.filter(project=("foo", "bar"), owner___account_id=1000096)
+            changes.filter(insertions=lambda n: n > 1000)
+
+        :param mask: a list of booleans, e.g. returned by mask()
+        :param conditions: conditions by field name, see mask()
+        :return: a new ColumnarResultSet
+        """
+        selected = list(mask) if mask is not None else [True] * self.length
+        for name, condition in conditions.items():
+            matches = self.mask(name.replace("__", "."), condition)
+            selected = [a and b for a, b in zip(selected, matches)]
+        return self.take(i for i, keep in enumerate(selected) if keep)
+
+    def groupby(self, name):
+        """
+        Split the results by the values of a field.
+
+        :param name: field name, e.g. 'project' or 'owner._account_id'
+        :return: an OrderedDict of ColumnarResultSet by value
+        """
+        groups = OrderedDict()
+        for i, value in enumerate(self.column(name)):
+            groups.setdefault(value, []).append(i)
+        return OrderedDict(
+            (value, self.take(indices)) for value, indices in groups.items()
+        )
+
+    def to_dict(self, fields=None):
+        """
+        :param fields: field names, defaults to all the fields
+        :return: an OrderedDict of lists by field name
+        """
+        fields = fields or self.fields
+        return OrderedDict((name, self.column(name)) for name in fields)
+
+    def to_numpy(self, fields=None):
+        """
+        Convert the fields to NumPy arrays. Fields of JSON objects or lists become object arrays.
+
+        :param fields: field names, defaults to all the fields
+        :return: an OrderedDict of arrays by field name
+        """
+        np = _import_optional("numpy")
+        arrays = OrderedDict()
+        for name, values in self.to_dict(fields).items():
+            if all(isinstance(v, _SCALAR_TYPES) for v in values):
+                arrays[name] = np.asarray(values)
+            else:
+                array = np.empty(len(values), dtype=object)
+                array[:] = values
+                arrays[name] = array
+        return arrays
+
+    def to_arrow(self, fields=None):
+        """
+        Convert the fields to an Arrow table, JSON objects becoming structs.
+
+        :param fields: field names, defaults to all the fields
+        :return: a pyarrow.Table
+        """
+        pa = _import_optional("pyarrow")
+        return pa.table(self.to_dict(fields))
+
+    def to_pandas(self, fields=None):
+        """
+        Convert the fields to a pandas DataFrame.
+
+        :param fields: field names, defaults to all the fields
+        :return: a pandas.DataFrame
+        """
+        pd = _import_optional("pandas")
+        return pd.DataFrame(self.to_dict(fields))
+
+
 class BaseModel(object):
+    """
+    Base class of the models. The fields of a model are declared at class level:
+
+    .. code-block:: python
+
+        class Branch(BaseModel):
+            attributes = ("ref", "web_links", "revision", "can_delete", "project", "gerrit")
+            __slots__ = attributes
+
+    The instances have no __dict__, a field not set reads as None.
+    The fields frozenset, used for the membership tests, is derived from attributes.
+
+    .. note::
+
+        Before the fields were declared with __slots__, the models had a __dict__ and a
+        list of attributes per instance. Assigning a name which is not a field, e.g.
+        ``change.note = "..."``, now raises AttributeError; keep such data aside or in a
+        subclass declaring its own __slots__ (or none, to get a __dict__ back).
+    """
+
+    attributes = ("id",)
+    __slots__ = ("_raw", "__weakref__")
+    fields = frozenset(attributes)
+    #: payload keys read under another attribute name, e.g. a key shadowed by a property
+    aliases = {}
+    #: functions building the models of a nested field: attribute -> function(item, value)
+    nested = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.fields = frozenset(cls.attributes)
+
     def __init__(self, **kwargs):
-        self.attributes = ["id"]
+        self._raw = None
 
     def __getattr__(self, key):
-        if key in self.attributes:
-            return self.__dict__.get(key)
+        # only called for the fields not set yet and the unknown names
+        if key in self.fields:
+            raw = self._raw
+            if raw is not None:
+                raw_key = self.aliases.get(key, key)
+                if raw_key in raw:
+                    value = self.materialize(key, raw[raw_key])
+                    setattr(self, key, value)
+                    return value
+            return None
         else:
             raise AttributeError(key)
 
+    def materialize(self, key, value):
+        """
+        Build the value of an attribute from its JSON value.
+
+        :param key: attribute name
+        :param value: JSON value
+        :return:
+        """
+        parser = self.nested.get(key)
+        if parser is None or value is None:
+            return value
+        return parser(self, value)
+
     @classmethod
-    def parse(cls, data, **kwargs):
-        """Parse a JSON object into a model instance."""
+    def parse(cls, data, lazy=False, **kwargs):
+        """
+        Parse a JSON object into a model instance.
+
+        The nested fields are built on first access. With lazy=True the JSON object is kept
+        as is and every attribute is read from it on first access, which makes parsing large
+        payloads of which only a few fields are read much cheaper.
+        """
         data = data or {}
         item = cls() if data else None
+        if item is None:
+            return item
         # setattr(item, "json", data)
-        data.update(kwargs)
-        for key, value in data.items():
-            if key in item.attributes:
+        # the decoded data may be shared by cached responses, don't modify it
+        if lazy:
+            item._raw = data
+        else:
+            # nested fields are only built on first access
+            pending = {}
+            for key in cls.attributes:
+                raw_key = cls.aliases.get(key, key)
+                if raw_key in data:
+                    if key in cls.nested:
+                        pending[raw_key] = data[raw_key]
+                    else:
+                        setattr(item, key, data[raw_key])
+            if pending:
+                item._raw = pending
+        for key, value in kwargs.items():
+            if key in cls.fields:
                 setattr(item, key, value)
         return item
 
     @classmethod
-    def parse_list(cls, data, **kwargs):
-        """Parse a list of JSON objects into a result set of model instances."""
+    def parse_list(cls, data, columnar=False, **kwargs):
+        """
+        Parse a list of JSON objects into a result set of model instances.
+        With columnar=True a ColumnarResultSet is returned instead.
+        """
+        if columnar:
+            return ColumnarResultSet.from_json(cls, data, **kwargs)
         results = ResultSet()
         data = data or []
         for obj in data:
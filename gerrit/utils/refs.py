@@ -0,0 +1,232 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+import time
+import threading
+from collections import OrderedDict
+
+try:
+    from urllib.parse import unquote
+except ImportError:
+    from urllib import unquote
+
+
+class RefListing(object):
+    """
+    The refs of one kind (branches or tags) of a project, indexed by ref name
+    in the order returned by the server.
+    """
+
+    def __init__(self, loader, ttl=None):
+        """
+        :param loader: function returning the list of ref info entities, called with
+          refresh=True to bypass the caches of the client
+        :param ttl: seconds the listing is kept before it is fetched again, None for ever
+        """
+        self.loader = loader
+        self.ttl = ttl
+        self.fetched = None
+        self._refs = None
+        # the next load was asked for by refresh()
+        self._invalidated = False
+        self._lock = threading.Lock()
+
+    @property
+    def expired(self):
+        if self._refs is None:
+            return True
+        return self.ttl is not None and self.fetched + self.ttl < time.time()
+
+    @property
+    def refs(self):
+        """
+        :return: an OrderedDict of ref info entities by ref name, fetched if missing or expired
+        """
+        refs = self._refs
+        if refs is None or self.expired:
+            refs = self.load(refresh=self._invalidated)
+        return refs
+
+    def refresh(self):
+        """
+        Fetch the listing again from the server.
+
+        :return:
+        """
+        return self.load(refresh=True)
+
+    def load(self, refresh=False):
+        """
+        Fetch the listing.
+
+        :param refresh: bypass the caches of the client, e.g. the response cache
+        :return:
+        """
+        with self._lock:
+            rows = self.loader(refresh=refresh)
+            self._refs = OrderedDict((row["ref"], row) for row in rows)
+            self.fetched = time.time()
+            self._invalidated = False
+            return self._refs
+
+    def seed(self, rows, fetched):
+        """
+        Store refs fetched earlier, unless the listing is more recent.
+
+        :param rows: the list of ref info entities
+        :param fetched: timestamp of the fetch
+        :return:
+        """
+        with self._lock:
+            if self._refs is None or self.fetched < fetched:
+                self._refs = OrderedDict((row["ref"], row) for row in rows)
+                self.fetched = fetched
+
+    def add(self, row):
+        """
+        Record a ref created by the client, if the listing was fetched.
+
+        :param row: the ref info entity
+        :return:
+        """
+        with self._lock:
+            if self._refs is not None and row and "ref" in row:
+                self._refs[row["ref"]] = row
+
+    def remove(self, ref):
+        """
+        Forget a ref deleted by the client.
+
+        :param ref: ref name, e.g. 'refs/heads/stable'
+        :return:
+        """
+        with self._lock:
+            if self._refs is not None:
+                self._refs.pop(ref, None)
+
+    def invalidate(self):
+        """
+        Forget the listing, fetched again from the server on next access.
+
+        :return:
+        """
+        with self._lock:
+            self._refs = None
+            self._invalidated = True
+
+
+class RefCache(object):
+    """
+    Branch and tag listings of the projects, kept by a GerritClient across
+    accesses to project.branches and project.tags.
+
+    .. code-block:: python
+
+        gerrit = GerritClient(base_url=url, username=username, password=password, ref_cache=True)
+        for name in names:
+            # one request per project every ttl seconds
+            if "refs/heads/stable" in gerrit.projects.get(name).branches:
+                ...
+
+    The branches and tags created or deleted through the client are applied
+    to the listings; use refresh() to see the changes made by others before
+    the listings expire.
+    """
+
+    def __init__(self, ttl=300.0):
+        """
+        :param ttl: seconds a listing is kept, None for ever
+        """
+        self.ttl = ttl
+        self._listings = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(kind, project):
+        """
+        :param kind: 'branches' or 'tags'
+        :param project: project name, url-encoded or not
+        :return:
+        """
+        return kind, unquote(str(project))
+
+    def get_listing(self, kind, project, loader):
+        """
+        :param kind: 'branches' or 'tags'
+        :param project: project name
+        :param loader: function fetching the refs, used when the listing is created
+        :return: the RefListing of the project
+        """
+        key = self.make_key(kind, project)
+        with self._lock:
+            listing = self._listings.get(key)
+            if listing is None:
+                listing = self._listings[key] = RefListing(loader, ttl=self.ttl)
+            elif listing.loader is None:
+                # seeded, e.g. from a snapshot
+                listing.loader = loader
+            return listing
+
+    def seed(self, kind, project, rows, fetched):
+        """
+        Store a listing fetched earlier, e.g. by another process.
+        It expires ttl seconds after it was fetched.
+
+        :param kind: 'branches' or 'tags'
+        :param project: project name
+        :param rows: the list of ref info entities
+        :param fetched: timestamp of the fetch
+        :return:
+        """
+        key = self.make_key(kind, project)
+        with self._lock:
+            listing = self._listings.get(key)
+            if listing is None:
+                listing = self._listings[key] = RefListing(None, ttl=self.ttl)
+        listing.seed(rows, fetched)
+
+    def export(self):
+        """
+        :return: the fetched listings, as a list of (kind, project, rows, fetched)
+        """
+        with self._lock:
+            listings = list(self._listings.items())
+        return [
+            (kind, project, list(listing._refs.values()), listing.fetched)
+            for (kind, project), listing in listings
+            if listing._refs is not None and not listing.expired
+        ]
+
+    def add(self, kind, project, row):
+        listing = self._listings.get(self.make_key(kind, project))
+        if listing is not None:
+            listing.add(row)
+
+    def remove(self, kind, project, ref):
+        listing = self._listings.get(self.make_key(kind, project))
+        if listing is not None:
+            listing.remove(ref)
+
+    def refresh(self, kind=None, project=None):
+        """
+        Forget the listings, fetched again from the server on next access.
+
+        :param kind: 'branches' or 'tags', None for both
+        :param project: project name, None for all the projects
+        :return:
+        """
+        with self._lock:
+            listings = list(self._listings.items())
+        for (kind_, project_), listing in listings:
+            if kind is not None and kind != kind_:
+                continue
+            if project is not None and unquote(str(project)) != project_:
+                continue
+            listing.invalidate()
+
+    def clear(self):
+        with self._lock:
+            self._listings.clear()
+
+    def __len__(self):
+        return len(self._listings)
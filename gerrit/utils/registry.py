@@ -0,0 +1,283 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+import time
+import weakref
+import threading
+from collections import OrderedDict
+
+try:
+    from urllib.parse import urlparse, unquote
+except ImportError:
+    from urlparse import urlparse
+    from urllib import unquote
+
+KINDS = frozenset(["projects", "changes", "accounts", "groups"])
+
+
+def get_resource(url):
+    """
+    The entity a url refers to, e.g. ('changes', 'myProject~master~I8473b95')
+    for '<base url>/a/changes/myProject~master~I8473b95/revisions/current/review'.
+
+    :param url:
+    :return: (kind, id), None if the url is not about an entity
+    """
+    segments = urlparse(url).path.split("/")
+    for i in range(len(segments) - 2):
+        if segments[i] == "a" and segments[i + 1] in KINDS:
+            if segments[i + 2]:
+                return segments[i + 1], segments[i + 2]
+            return None
+    return None
+
+
+class EntityRegistry(object):
+    """
+    Identity map of the entities fetched by a GerritClient, keyed by resource kind and id.
+
+    .. code-block:: python
+
+        gerrit = GerritClient(base_url=url, username=username, password=password, entity_registry=True)
+        project = gerrit.projects.get("foo")
+        assert gerrit.projects.get("foo") is project  # no request
+
+    * The entities are held by weak references: an entity is forgotten once the
+      caller drops it, and after ttl seconds.
+    * An entity can be registered under several ids (e.g. a change under its
+      triplet id and its number); forgetting one id forgets all of them.
+    * A mutation sent by the client (any method but GET and HEAD) to a resource,
+      e.g. 'POST /changes/<id>/abandon', forgets the entity of that resource.
+    """
+
+    KINDS = KINDS
+
+    def __init__(self, ttl=300.0):
+        """
+        :param ttl: seconds an entity is kept, None for as long as it is referenced
+        """
+        self.ttl = ttl
+        self._entries = {}
+        self._keys = {}
+        # reentrant: an entity may be garbage collected while the lock is held
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def make_key(kind, id_):
+        """
+        :param kind: 'projects', 'changes', 'accounts' or 'groups'
+        :param id_: the id of the entity, url-encoded or not
+        :return:
+        """
+        return kind, unquote(str(id_))
+
+    def get(self, kind, id_):
+        """
+        :param kind:
+        :param id_:
+        :return: the registered entity, None if unknown, expired or garbage collected
+        """
+        key = self.make_key(kind, id_)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            ref, expires = entry
+            entity = ref()
+            if entity is None or (expires is not None and expires < time.time()):
+                self._forget(ref)
+                return None
+            return entity
+
+    def register(self, kind, entity, *ids):
+        """
+        Register an entity under one or more ids.
+
+        :param kind:
+        :param entity: a model instance
+        :param ids: the ids of the entity, None values are skipped
+        :return: the entity
+        """
+        if entity is None:
+            return entity
+
+        expires = time.time() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            ref = weakref.ref(entity, self._on_collected)
+            keys = set(self.make_key(kind, id_) for id_ in ids if id_ is not None)
+            for key in list(keys):
+                old = self._entries.get(key)
+                if old is not None:
+                    if old[0]() is entity:
+                        keys.update(self._keys.get(old[0], ()))
+                    self._forget(old[0])
+            for key in keys:
+                self._entries[key] = (ref, expires)
+            self._keys[ref] = keys
+        return entity
+
+    def discard(self, kind, id_):
+        """
+        Forget an entity, under all its ids.
+
+        :param kind:
+        :param id_:
+        :return:
+        """
+        with self._lock:
+            entry = self._entries.get(self.make_key(kind, id_))
+            if entry is not None:
+                self._forget(entry[0])
+
+    def get_resource(self, url):
+        """
+        The entity a url refers to, e.g. ('changes', 'myProject~master~I8473b95')
+        for '<base url>/a/changes/myProject~master~I8473b95/revisions/current/review'.
+
+        :param url:
+        :return: (kind, id), None if the url is not about an entity
+        """
+        return get_resource(url)
+
+    def invalidate_url(self, method, url):
+        """
+        Forget the entity mutated by a request.
+
+        :param method: http method
+        :param url:
+        :return:
+        """
+        if method.upper() in ("GET", "HEAD"):
+            return
+        resource = self.get_resource(url)
+        if resource is not None:
+            self.discard(*resource)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._keys.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _forget(self, ref):
+        for key in self._keys.pop(ref, ()):
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] is ref:
+                del self._entries[key]
+
+    def _on_collected(self, ref):
+        with self._lock:
+            self._forget(ref)
+
+
+class NegativeCache(object):
+    """
+    Short-lived record of the lookups which found nothing, keyed by resource identity,
+    so that probing the same missing project, account, branch or tag again raises
+    at once instead of sending a request.
+
+    .. code-block:: python
+
+        gerrit = GerritClient(base_url=url, username=username, password=password, negative_cache=True)
+
+    The record of a resource is dropped when the client creates it, e.g. through
+    gerrit.projects.create() or project.branches.create().
+    """
+
+    def __init__(self, ttl=30.0, max_entries=10000):
+        """
+        :param ttl: seconds a lookup is known to find nothing
+        :param max_entries: maximum number of records, the oldest are dropped first
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(kind, *ids):
+        """
+        :param kind: e.g. 'projects', 'accounts', 'branches' or 'tags'
+        :param ids: the identity of the resource, e.g. project name and ref for a branch
+        :return:
+        """
+        return (kind,) + tuple(unquote(str(id_)) for id_ in ids)
+
+    def add(self, error, kind, *ids):
+        """
+        Record a lookup which found nothing.
+
+        :param error: the exception raised by the lookup, e.g. a NotFoundError
+        :param kind:
+        :param ids:
+        :return:
+        """
+        key = self.make_key(kind, *ids)
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (error.__class__, error.args, time.time() + self.ttl)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get(self, kind, *ids):
+        """
+        :param kind:
+        :param ids:
+        :return: a new instance of the exception raised by the lookup, None if it is not known to fail
+        """
+        key = self.make_key(kind, *ids)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            error_class, args, expires = entry
+            if expires < time.time():
+                del self._entries[key]
+                return None
+        return error_class(*args)
+
+    def check(self, kind, *ids):
+        """
+        Raise the exception of a lookup known to find nothing.
+
+        :param kind:
+        :param ids:
+        :return:
+        """
+        error = self.get(kind, *ids)
+        if error is not None:
+            raise error
+
+    def discard(self, kind, *ids):
+        """
+        Forget a lookup, e.g. after the resource was created.
+
+        :param kind:
+        :param ids:
+        :return:
+        """
+        with self._lock:
+            self._entries.pop(self.make_key(kind, *ids), None)
+
+    def discard_all(self, kind, *ids):
+        """
+        Forget the lookups of the resources under an identity, e.g. all the branches
+        of a project after its listing was fetched again.
+
+        :param kind:
+        :param ids:
+        :return:
+        """
+        prefix = self.make_key(kind, *ids)
+        with self._lock:
+            for key in [k for k in self._entries if k[:len(prefix)] == prefix]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
@@ -1,8 +1,20 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 # @Author: Jialiang Shi
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from requests import Session
-from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError, Timeout
+from requests.adapters import (
+    HTTPAdapter,
+    DEFAULT_POOLSIZE,
+    DEFAULT_POOLBLOCK,
+    DEFAULT_RETRIES,
+)
+from gerrit.utils.common import logger
+from gerrit.utils.cache import make_request_key
+from gerrit.utils.concurrency import SingleFlight
 from gerrit.utils.exceptions import (
     NotAllowedError,
     ValidationError,
@@ -41,10 +53,87 @@ class Requester(object):
         self.session = Session()
 
         self.max_retries = kwargs.get("max_retries")
-        if self.max_retries is not None:
-            retry_adapter = HTTPAdapter(max_retries=self.max_retries)
-            self.session.mount("http://", retry_adapter)
-            self.session.mount("https://", retry_adapter)
+        self.pool_connections = kwargs.get("pool_connections") or DEFAULT_POOLSIZE
+        self.pool_maxsize = kwargs.get("pool_maxsize") or DEFAULT_POOLSIZE
+        self.pool_block = kwargs.get("pool_block", DEFAULT_POOLBLOCK)
+        self.keep_alive = kwargs.get("keep_alive", True)
+
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+            max_retries=DEFAULT_RETRIES
+            if self.max_retries is None
+            else self.max_retries,
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        if not self.keep_alive:
+            self.session.headers["Connection"] = "close"
+
+        # Opt-in conditional GET support, see gerrit.utils.cache.ETagCache
+        self.etag_cache = kwargs.get("etag_cache")
+
+        # Opt-in retries of failed requests, see gerrit.utils.retry.RetryPolicy
+        self.retry_policy = kwargs.get("retry_policy")
+
+        # Opt-in coalescing of concurrent identical GETs
+        self.single_flight = SingleFlight() if kwargs.get("single_flight") else None
+
+        # Opt-in throttling, see gerrit.utils.throttle
+        self.rate_limiter = kwargs.get("rate_limiter")
+        self.governor = kwargs.get("governor")
+
+        # Opt-in read replicas, see gerrit.utils.router.ReplicaRouter
+        self.router = kwargs.get("router")
+
+        # Opt-in identity map, see gerrit.utils.registry.EntityRegistry
+        self.registry = kwargs.get("registry")
+
+        # Opt-in response cache, see gerrit.utils.cache.ResponseCache
+        self.response_cache = kwargs.get("response_cache")
+
+        # Opt-in permanent cache of the immutable responses, see gerrit.utils.cache.ImmutableCache
+        self.immutable_cache = kwargs.get("immutable_cache")
+
+        # Opt-in snapshot of the fetched entities, see gerrit.utils.snapshot.Snapshot
+        self.snapshot = kwargs.get("snapshot")
+
+        # Opt-in account resolver, see gerrit.accounts.resolver.AccountResolver
+        self.account_resolver = kwargs.get("account_resolver")
+
+    def prewarm(self, url, connections):
+        """
+        Open connections to the server ahead of time, so that the first
+        concurrent requests reuse them instead of paying the TCP/TLS handshake.
+        The requests are streamed, which keeps every connection checked out
+        until all of them are open, and then read to give them back to the pool.
+
+        :param url: a cheap endpoint to request
+        :param connections: number of connections to open, at most pool_maxsize
+        :return: number of connections opened
+        """
+        connections = min(connections, self.pool_maxsize)
+        if connections <= 0:
+            return 0
+
+        def open_connection(_):
+            try:
+                return self.get(url, stream=True)
+            except Exception as error:
+                logger.warning("Failed to pre-warm a connection: %s" % error)
+
+        with ThreadPoolExecutor(max_workers=connections) as executor:
+            responses = list(executor.map(open_connection, range(connections)))
+
+        opened = 0
+        for response in responses:
+            if response is not None:
+                # Consuming the body releases the connection back to the pool
+                response.content
+                opened += 1
+        return opened
 
     def get_request_dict(
         self, params=None, data=None, json=None, headers=None, **kwargs
@@ -94,6 +183,114 @@ class Requester(object):
 
         return request_kwargs
 
+    def send(self, method, url, **request_kwargs):
+        """
+        Send a request through the session, retrying it as described by the retry policy.
+
+        :param method: http method
+        :param url:
+        :param request_kwargs: see get_request_dict()
+        :return: the last response, its status is not checked
+        """
+        policy = self.retry_policy
+        attempt = 0
+        while True:
+            try:
+                response = self.send_once(method, url, **request_kwargs)
+            except (ConnectionError, Timeout) as error:
+                if policy is None or not policy.should_retry(method, attempt):
+                    raise
+                delay = policy.get_backoff(attempt)
+                logger.warning(
+                    "Retrying %s %s in %.1fs after error: %s" % (method, url, delay, error)
+                )
+            else:
+                if policy is None or not policy.should_retry(
+                    method, attempt, response.status_code
+                ):
+                    return response
+                delay = policy.get_backoff(attempt, response)
+                logger.warning(
+                    "Retrying %s %s in %.1fs after status %s"
+                    % (method, url, delay, response.status_code)
+                )
+                response.close()
+
+            time.sleep(delay)
+            attempt += 1
+
+    def mutate(self, method, url, **request_kwargs):
+        """
+        Send a mutation, then forget what is cached about the mutated resource.
+
+        :param method: http method
+        :param url:
+        :param request_kwargs: see get_request_dict()
+        :return:
+        """
+        try:
+            return self.send(method, url, **request_kwargs)
+        finally:
+            if self.registry is not None:
+                self.registry.invalidate_url(method, url)
+            if self.response_cache is not None:
+                self.response_cache.invalidate(method, url)
+            if self.snapshot is not None:
+                self.snapshot.invalidate_url(method, url)
+            if self.account_resolver is not None:
+                self.account_resolver.invalidate_url(method, url)
+
+    def send_once(self, method, url, **request_kwargs):
+        """
+        Send one request, to a read replica if the router picks one.
+        A read failing to connect to a replica falls back on the primary.
+
+        :param method: http method
+        :param url: url of the primary
+        :param request_kwargs: see get_request_dict()
+        :return:
+        """
+        if self.router is None:
+            return self.send_to(method, url, **request_kwargs)
+
+        target = self.router.route(method, url)
+        try:
+            response = self.send_to(method, target, **request_kwargs)
+        except (ConnectionError, Timeout):
+            self.router.report(target, False)
+            if target == url:
+                raise
+            return self.send_to(method, url, **request_kwargs)
+
+        self.router.report(target, response.status_code < 500)
+        return response
+
+    def send_to(self, method, url, **request_kwargs):
+        """
+        Send one request through the session, after the rate limiter and the
+        concurrency governor allowed it.
+
+        :param method: http method
+        :param url:
+        :param request_kwargs: see get_request_dict()
+        :return:
+        """
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(method, url)
+
+        if self.governor is None:
+            return self.session.request(method, url, **request_kwargs)
+
+        self.governor.acquire()
+        start = time.time()
+        success = False
+        try:
+            response = self.session.request(method, url, **request_kwargs)
+            success = response.status_code < 500 and response.status_code != 429
+            return response
+        finally:
+            self.governor.release(success, time.time() - start)
+
     def get(self, url, params=None, headers=None, allow_redirects=True, stream=False):
         """
         :param url:
@@ -103,13 +300,104 @@ class Requester(object):
         :param stream:
         :return:
         """
+        cache = self.get_cache(url) if not (stream or headers) else None
+        if cache is None:
+            return self.share(url, params, headers, allow_redirects, stream)
+
+        response = cache.get(url, params)
+        if response is None:
+            response = self.share(url, params, headers, allow_redirects, stream)
+            cache.set(url, params, response)
+        elif getattr(response, "stale", False):
+            # served stale while it is fetched again
+            cache.revalidate(
+                url,
+                params,
+                lambda: self.share(url, params, headers, allow_redirects, stream),
+            )
+        return response
+
+    def get_cache(self, url):
+        """
+        :param url:
+        :return: the cache of the GET responses of the url, None if they are not cached
+        """
+        immutable_cache = self.immutable_cache
+        if immutable_cache is not None and immutable_cache.is_immutable(url):
+            return immutable_cache
+        response_cache = self.response_cache
+        if response_cache is not None and response_cache.get_ttl(url) is not None:
+            return response_cache
+        return None
+
+    def share(self, url, params=None, headers=None, allow_redirects=True, stream=False):
+        """
+        Send a GET request, shared with the identical GETs in flight if single-flight is enabled.
+
+        :param url:
+        :param params:
+        :param headers:
+        :param allow_redirects:
+        :param stream:
+        :return:
+        """
+        if self.single_flight is None or stream:
+            return self.fetch(url, params, headers, allow_redirects, stream)
+
+        def fetch():
+            response = self.fetch(url, params, headers, allow_redirects, stream)
+            if not hasattr(response, "gerrit_decode_lock"):
+                # The coalesced callers share the response, decode it only once
+                response.gerrit_decode_lock = threading.Lock()
+            return response
+
+        key = (
+            make_request_key(url, params),
+            allow_redirects,
+            tuple(sorted(headers.items())) if headers else (),
+        )
+        return self.single_flight.do(key, fetch)
+
+    def fetch(self, url, params=None, headers=None, allow_redirects=True, stream=False):
+        """
+        Send a GET request, as a conditional request if there is an ETag cache.
+
+        :param url:
+        :param params:
+        :param headers:
+        :param allow_redirects:
+        :param stream:
+        :return:
+        """
+        cache_key = cached = None
+        if self.etag_cache is not None and not stream:
+            cache_key = make_request_key(url, params)
+            cached = self.etag_cache.get(cache_key)
+            if cached is not None:
+                headers = dict(headers or {})
+                headers["If-None-Match"] = cached.headers["ETag"]
+
         request_kwargs = self.get_request_dict(
             params=params,
             headers=headers,
             allow_redirects=allow_redirects,
             stream=stream,
         )
-        return self.confirm_status(self.session.get(url, **request_kwargs))
+        response = self.send("GET", url, **request_kwargs)
+
+        if cache_key is None:
+            return self.confirm_status(response)
+
+        if response.status_code == 304 and cached is not None:
+            # Not Modified, hand out the response whose content is already decoded
+            return cached
+
+        response = self.confirm_status(response)
+        if response.headers.get("ETag"):
+            self.etag_cache.set(cache_key, response)
+        else:
+            self.etag_cache.delete(cache_key)
+        return response
 
     def post(
         self,
@@ -142,7 +430,7 @@ class Requester(object):
             allow_redirects=allow_redirects,
             **kwargs
         )
-        return self.confirm_status(self.session.post(url, **request_kwargs))
+        return self.confirm_status(self.mutate("POST", url, **request_kwargs))
 
     def put(
         self,
@@ -175,7 +463,7 @@ class Requester(object):
             allow_redirects=allow_redirects,
             **kwargs
         )
-        return self.confirm_status(self.session.put(url, **request_kwargs))
+        return self.confirm_status(self.mutate("PUT", url, **request_kwargs))
 
     def delete(self, url, headers=None, allow_redirects=True, **kwargs):
         """
@@ -188,7 +476,7 @@ class Requester(object):
         request_kwargs = self.get_request_dict(
             headers=headers, allow_redirects=allow_redirects, **kwargs
         )
-        return self.confirm_status(self.session.delete(url, **request_kwargs))
+        return self.confirm_status(self.mutate("DELETE", url, **request_kwargs))
 
     @staticmethod
     def confirm_status(res):
@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+import time
+import random
+from email.utils import parsedate_tz, mktime_tz
+
+
+class RetryPolicy(object):
+    """
+    Describes when and how the Requester retries a request.
+
+    * statuses are retried for idempotent methods only (GET, HEAD, PUT, DELETE, OPTIONS).
+    * unsafe_statuses are retried for every method, including POST. They should only contain
+      statuses returned before the request is processed, e.g. '429 Too Many Requests'.
+    * connection errors and timeouts are retried for idempotent methods only.
+
+    The delay between two attempts grows exponentially (backoff_factor * 2 ** attempt),
+    capped to max_backoff, with "full jitter" if enabled. A Retry-After header sent by the
+    server takes precedence when respect_retry_after is set.
+
+    .. code-block:: python
+
+        policy = RetryPolicy(total=5, statuses=(500, 502, 503, 504), backoff_factor=1)
+        gerrit = GerritClient(base_url=url, username=username, password=password, retry_policy=policy)
+
+    """
+
+    IDEMPOTENT_METHODS = frozenset(["GET", "HEAD", "PUT", "DELETE", "OPTIONS"])
+
+    def __init__(
+        self,
+        total=3,
+        statuses=(429, 500, 502, 503, 504),
+        unsafe_statuses=(429,),
+        backoff_factor=0.5,
+        max_backoff=60,
+        jitter=True,
+        respect_retry_after=True,
+        methods=IDEMPOTENT_METHODS,
+    ):
+        """
+        :param total: maximum number of retries of one request
+        :param statuses: status codes retried for idempotent methods
+        :param unsafe_statuses: status codes retried for all methods
+        :param backoff_factor: base delay in seconds
+        :param max_backoff: maximum delay in seconds
+        :param jitter: randomize the delay between 0 and the computed backoff
+        :param respect_retry_after: honour the Retry-After header of the response
+        :param methods: the methods considered idempotent
+        """
+        self.total = total
+        self.statuses = frozenset(statuses)
+        self.unsafe_statuses = frozenset(unsafe_statuses)
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.respect_retry_after = respect_retry_after
+        self.methods = frozenset(method.upper() for method in methods)
+
+    def is_idempotent(self, method):
+        """
+        :param method: http method
+        :return:
+        """
+        return method.upper() in self.methods
+
+    def should_retry(self, method, attempt, status_code=None):
+        """
+        Whether the attempt'th retry of a request may be sent.
+
+        :param method: http method
+        :param attempt: number of retries already sent
+        :param status_code: status code of the response, None for a connection error
+        :return:
+        """
+        if attempt >= self.total:
+            return False
+        if status_code is None:
+            return self.is_idempotent(method)
+        if status_code in self.unsafe_statuses:
+            return True
+        return status_code in self.statuses and self.is_idempotent(method)
+
+    def get_retry_after(self, response):
+        """
+        Parse the Retry-After header, either delay-seconds or an HTTP-date.
+
+        :param response:
+        :return: seconds to wait or None
+        """
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+
+        date = parsedate_tz(value)
+        if date is None:
+            return None
+        return max(0.0, mktime_tz(date) - time.time())
+
+    def get_backoff(self, attempt, response=None):
+        """
+        Seconds to wait before sending the next attempt.
+
+        :param attempt: number of retries already sent
+        :param response: the response which triggered the retry, if any
+        :return:
+        """
+        if response is not None and self.respect_retry_after:
+            retry_after = self.get_retry_after(response)
+            if retry_after is not None:
+                return min(retry_after, self.max_backoff)
+
+        backoff = min(self.backoff_factor * (2 ** attempt), self.max_backoff)
+        if self.jitter:
+            backoff = random.uniform(0, backoff)
+        return backoff
@@ -0,0 +1,153 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+import time
+import threading
+
+
+class Replica(object):
+    """
+    A read replica and its health.
+    """
+
+    def __init__(self, url):
+        self.url = url
+        self.weight = 1.0
+        self.current_weight = 0.0
+        self.failures = 0
+        self.down_until = 0.0
+
+    def is_available(self, now):
+        return now >= self.down_until
+
+
+class ReplicaRouter(object):
+    """
+    Route read requests to replicas and mutations to the primary.
+
+    * GET and HEAD requests go to the replicas by smooth weighted round robin,
+      each replica weight shrinking on failures and recovering on successes.
+      A replica failing max_failures times in a row is skipped for down_time seconds.
+    * Other requests go to the primary.
+    * After a mutation of a resource (e.g. '/changes/<id>' or '/projects/<name>'), the reads of
+      that resource go to the primary for sticky_ttl seconds (read-your-writes).
+
+    The urls are built for the primary by GerritClient.get_endpoint_url(), the router only swaps the base url.
+    """
+
+    READ_METHODS = frozenset(["GET", "HEAD"])
+
+    def __init__(
+        self, primary_url, replica_urls, sticky_ttl=10.0, max_failures=3, down_time=30.0
+    ):
+        """
+        :param primary_url: base url of the primary
+        :param replica_urls: base urls of the replicas
+        :param sticky_ttl: seconds the reads of a mutated resource go to the primary
+        :param max_failures: consecutive failures before a replica is skipped
+        :param down_time: seconds a failing replica is skipped
+        """
+        self.primary_url = primary_url
+        self.replicas = [Replica(url) for url in replica_urls]
+        self.sticky_ttl = sticky_ttl
+        self.max_failures = max_failures
+        self.down_time = down_time
+        self._sticky = {}
+        self._lock = threading.Lock()
+
+    def get_resource_key(self, url):
+        """
+        The resource a url refers to, e.g. ('changes', 'myProject~master~I8473b95') for
+        '<primary>/a/changes/myProject~master~I8473b95/revisions/current/review'.
+
+        :param url:
+        :return:
+        """
+        path = url[len(self.primary_url):].split("?", 1)[0]
+        segments = path.split("/")
+        if len(segments) > 1 and segments[1] == "a":
+            segments = segments[1:]
+        return tuple(segments[1:3])
+
+    def choose_replica(self):
+        """
+        Smooth weighted round robin among the available replicas.
+
+        :return: the chosen replica, or None if none is available
+        """
+        now = time.time()
+        with self._lock:
+            available = [r for r in self.replicas if r.is_available(now)]
+            if not available:
+                return None
+
+            total = 0.0
+            best = None
+            for replica in available:
+                replica.current_weight += replica.weight
+                total += replica.weight
+                if best is None or replica.current_weight > best.current_weight:
+                    best = replica
+            best.current_weight -= total
+            return best
+
+    def route(self, method, url):
+        """
+        :param method: http method
+        :param url: url built for the primary
+        :return: the url to send the request to
+        """
+        if not self.replicas or not url.startswith(self.primary_url):
+            return url
+
+        key = self.get_resource_key(url)
+        now = time.time()
+        if method.upper() not in self.READ_METHODS:
+            with self._lock:
+                self._sticky[key] = now + self.sticky_ttl
+                if len(self._sticky) > 1024:
+                    self._sticky = dict(
+                        (k, v) for k, v in self._sticky.items() if v > now
+                    )
+            return url
+
+        if self._sticky.get(key, 0) > now:
+            return url
+
+        replica = self.choose_replica()
+        if replica is None:
+            return url
+        return replica.url + url[len(self.primary_url):]
+
+    def get_replica(self, url):
+        """
+        :param url: a routed url
+        :return: the replica the url points to, None for the primary
+        """
+        for replica in self.replicas:
+            if url.startswith(replica.url):
+                return replica
+        return None
+
+    def report(self, url, success):
+        """
+        Update the health of the replica a request was sent to.
+
+        :param url: the routed url
+        :param success: False on a connection error or a server error
+        :return:
+        """
+        replica = self.get_replica(url)
+        if replica is None:
+            return
+
+        with self._lock:
+            if success:
+                replica.failures = 0
+                replica.weight = min(1.0, replica.weight + 0.1)
+            else:
+                replica.failures += 1
+                replica.weight = max(0.1, replica.weight / 2)
+                if replica.failures >= self.max_failures:
+                    replica.down_until = time.time() + self.down_time
+                    replica.failures = 0
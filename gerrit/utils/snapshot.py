@@ -0,0 +1,256 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+import os
+import gzip
+import json
+import time
+import threading
+from gerrit.utils.common import logger
+from gerrit.utils.registry import EntityRegistry, get_resource
+
+
+class Snapshot(object):
+    """
+    What a GerritClient learned about the server, saved to a file for the next
+    processes: the projects, accounts and groups fetched, the branch and tag
+    listings of the ref cache and the server version.
+
+    .. code-block:: python
+
+        # when building the worker image
+        gerrit = GerritClient(base_url=url, username=username, password=password, ref_cache=True,
+                              snapshot="/var/cache/gerrit.snapshot")
+        ...
+        gerrit.save_snapshot()
+
+        # in the workers, the snapshot is loaded at construction
+        gerrit = GerritClient(base_url=url, username=username, password=password, ref_cache=True,
+                              snapshot="/var/cache/gerrit.snapshot")
+
+    Every entry keeps the time it was fetched, and is only used while it is fresh:
+    the entities for max_age seconds, the listings for the ttl of the ref cache
+    and the version for version_cache_ttl. Stale entries are fetched again on
+    first access. The entities mutated through the client are dropped.
+
+    The snapshot is only applied to a client of the same server and account.
+    The file is gzip compressed JSON.
+    """
+
+    FORMAT = 1
+
+    def __init__(self, path=None, base_url=None, max_age=3600.0, principal=None):
+        """
+        :param path: default file of load() and save()
+        :param base_url: url of the server the snapshot is about
+        :param max_age: seconds an entity is used after it was fetched, None for ever
+        :param principal: opaque id of the account the entities were fetched for,
+          see gerrit.utils.cache.make_principal()
+        """
+        self.path = path
+        self.base_url = base_url
+        self.principal = principal
+        self.max_age = max_age
+        self.created = None
+        self.version = None
+        self.refs = []
+        self._entities = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path, max_age=3600.0):
+        """
+        :param path: snapshot file
+        :param max_age: seconds an entity is used after it was fetched, None for ever
+        :return:
+        """
+        with gzip.open(path, "rb") as f:
+            data = json.loads(f.read().decode("utf-8"))
+        if data.get("format") != cls.FORMAT:
+            raise ValueError("Unsupported snapshot format: %s" % data.get("format"))
+
+        snapshot = cls(
+            path=path,
+            base_url=data.get("base_url"),
+            max_age=max_age,
+            principal=data.get("principal"),
+        )
+        snapshot.created = data.get("created")
+        snapshot.version = data.get("version")
+        snapshot.refs = data.get("refs") or []
+        for kind, records in (data.get("entities") or {}).items():
+            for record in records:
+                snapshot._store(kind, record)
+        return snapshot
+
+    def save(self, path=None):
+        """
+        Write the snapshot, through a temporary file renamed at the end.
+
+        :param path: snapshot file, defaults to the file it was loaded from
+        :return:
+        """
+        path = path or self.path
+        if path is None:
+            raise ValueError("No snapshot file given")
+        self.created = time.time()
+        entities = {}
+        with self._lock:
+            records = dict((id(record), record) for record in self._entities.values())
+        for record in records.values():
+            entities.setdefault(record["kind"], []).append(
+                {
+                    "ids": record["ids"],
+                    "data": record["data"],
+                    "fetched": record["fetched"],
+                }
+            )
+        data = {
+            "format": self.FORMAT,
+            "base_url": self.base_url,
+            "principal": self.principal,
+            "created": self.created,
+            "version": self.version,
+            "refs": self.refs,
+            "entities": entities,
+        }
+        temp = "%s.%s.tmp" % (path, os.getpid())
+        with gzip.open(temp, "wb") as f:
+            f.write(json.dumps(data, separators=(",", ":")).encode("utf-8"))
+        os.rename(temp, path)
+
+    def get(self, kind, id_):
+        """
+        :param kind: 'projects', 'accounts' or 'groups'
+        :param id_: an id of the entity
+        :return: the JSON object of the entity, None if unknown or stale
+        """
+        with self._lock:
+            record = self._entities.get(EntityRegistry.make_key(kind, id_))
+        if record is None:
+            return None
+        if self.max_age is not None and record["fetched"] + self.max_age < time.time():
+            return None
+        return record["data"]
+
+    def add(self, kind, data, *ids):
+        """
+        Record an entity fetched by the client.
+
+        :param kind: 'projects', 'accounts' or 'groups'
+        :param data: the JSON object of the entity
+        :param ids: the ids of the entity, None values are skipped
+        :return:
+        """
+        if not data:
+            return
+        ids = [str(id_) for id_ in ids if id_ is not None]
+        self._store(kind, {"ids": ids, "data": data, "fetched": time.time()})
+
+    def discard(self, kind, id_):
+        """
+        Forget an entity, under all its ids.
+
+        :param kind:
+        :param id_:
+        :return:
+        """
+        with self._lock:
+            record = self._entities.get(EntityRegistry.make_key(kind, id_))
+            if record is not None:
+                self._forget(record)
+
+    def invalidate_url(self, method, url):
+        """
+        Forget the entity mutated by a request.
+
+        :param method: http method
+        :param url:
+        :return:
+        """
+        if method.upper() in ("GET", "HEAD"):
+            return
+        resource = get_resource(url)
+        if resource is not None:
+            self.discard(*resource)
+
+    def capture(self, gerrit):
+        """
+        Take the version and the ref listings known by a client.
+
+        :param gerrit: a GerritClient
+        :return:
+        """
+        self.base_url = gerrit._base_url
+        self.principal = gerrit._principal
+        features = gerrit.features
+        if features._version is not None:
+            self.version = {
+                "version": features._version,
+                "fetched": features._fetched_at,
+            }
+        if gerrit.refs is not None:
+            self.refs = [
+                {"kind": kind, "project": project, "refs": rows, "fetched": fetched}
+                for kind, project, rows, fetched in gerrit.refs.export()
+            ]
+
+    def apply(self, gerrit):
+        """
+        Seed the caches of a client with the snapshot, ignored if it is about another
+        server or was taken by the client of another account.
+
+        :param gerrit: a GerritClient
+        :return:
+        """
+        if self.base_url is not None and self.base_url != gerrit._base_url:
+            logger.warning(
+                "Ignoring the snapshot of %s for %s" % (self.base_url, gerrit._base_url)
+            )
+            self._reset()
+            return
+        if self.principal is not None and self.principal != gerrit._principal:
+            logger.warning(
+                "Ignoring the snapshot of %s taken by another account" % self.base_url
+            )
+            self._reset()
+            return
+        self.base_url = gerrit._base_url
+        self.principal = gerrit._principal
+
+        if self.version and gerrit.features.is_stale():
+            gerrit.features.update(self.version["version"], self.version["fetched"])
+        if gerrit.refs is not None:
+            for listing in self.refs:
+                gerrit.refs.seed(
+                    listing["kind"],
+                    listing["project"],
+                    listing["refs"],
+                    listing["fetched"],
+                )
+
+    def _reset(self):
+        with self._lock:
+            self._entities.clear()
+        self.version = None
+        self.refs = []
+
+    def __len__(self):
+        with self._lock:
+            return len(set(id(record) for record in self._entities.values()))
+
+    def _store(self, kind, record):
+        record["kind"] = kind
+        with self._lock:
+            for id_ in record["ids"]:
+                old = self._entities.get(EntityRegistry.make_key(kind, id_))
+                if old is not None:
+                    self._forget(old)
+            for id_ in record["ids"]:
+                self._entities[EntityRegistry.make_key(kind, id_)] = record
+
+    def _forget(self, record):
+        for id_ in record["ids"]:
+            key = EntityRegistry.make_key(record["kind"], id_)
+            if self._entities.get(key) is record:
+                del self._entities[key]
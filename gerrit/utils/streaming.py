@@ -0,0 +1,295 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+import re
+import json
+import zlib
+import base64
+import codecs
+import struct
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_ZIP_LOCAL_HEADER = struct.Struct("<IHHHHHIIIHH")
+_ZIP_LOCAL_HEADER_SIGNATURE = 0x04034B50
+
+MAGIC_JSON_PREFIX = ")]}'"
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+def iter_base64_decode(chunks):
+    """
+    Decode a base64 encoded stream chunk by chunk.
+
+    :param chunks: iterable of bytes
+    :return: a generator of decoded bytes
+    """
+    remainder = b""
+    for chunk in chunks:
+        data = remainder + b"".join(chunk.split())
+        usable = len(data) - len(data) % 4
+        remainder = data[usable:]
+        if usable:
+            yield base64.b64decode(data[:usable])
+
+    if remainder:
+        yield base64.b64decode(remainder)
+
+
+def _fill(buffer, chunks, size):
+    while len(buffer) < size:
+        chunk = next(chunks, None)
+        if chunk is None:
+            raise ValueError("Truncated zip archive")
+        buffer += chunk
+    return buffer
+
+
+def iter_unzip(chunks):
+    """
+    Extract the first entry of a zip archive on the fly, without a seekable file.
+    Gerrit zips a single file, e.g. the patch of '/patch?zip' or an unsafe file download.
+
+    :param chunks: iterable of bytes
+    :return: a generator of the uncompressed bytes of the first entry
+    """
+    chunks = iter(chunks)
+    buffer = _fill(b"", chunks, _ZIP_LOCAL_HEADER.size)
+    (
+        signature,
+        _,
+        _,
+        method,
+        _,
+        _,
+        _,
+        compressed_size,
+        _,
+        name_length,
+        extra_length,
+    ) = _ZIP_LOCAL_HEADER.unpack(buffer[: _ZIP_LOCAL_HEADER.size])
+    if signature != _ZIP_LOCAL_HEADER_SIGNATURE:
+        raise ValueError("Not a zip archive")
+
+    header_length = _ZIP_LOCAL_HEADER.size + name_length + extra_length
+    buffer = _fill(buffer, chunks, header_length)
+    data = buffer[header_length:]
+    del buffer
+
+    if method == zlib.DEFLATED:
+        decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+        while True:
+            if data:
+                output = decompressor.decompress(data)
+                if output:
+                    yield output
+            if decompressor.eof:
+                return
+            data = next(chunks, None)
+            if data is None:
+                raise ValueError("Truncated zip archive")
+
+    elif method == 0:
+        remaining = compressed_size
+        while remaining > 0:
+            if not data:
+                data = next(chunks, None)
+                if data is None:
+                    raise ValueError("Truncated zip archive")
+            piece = data[:remaining]
+            data = data[len(piece):]
+            remaining -= len(piece)
+            yield piece
+
+    else:
+        raise ValueError("Unsupported zip compression method: %s" % method)
+
+
+def iter_content(response, chunk_size=DEFAULT_CHUNK_SIZE, encoding=None):
+    """
+    Iterate over the body of a streamed response, then close it.
+
+    :param response: a response requested with stream=True
+    :param chunk_size: size of the chunks read from the socket
+    :param encoding: None for the raw bytes, 'base64' or 'zip' to decode them on the fly
+    :return: a generator of bytes
+    """
+    try:
+        chunks = response.iter_content(chunk_size=chunk_size)
+        if encoding == "base64":
+            chunks = iter_base64_decode(chunks)
+        elif encoding == "zip":
+            chunks = iter_unzip(chunks)
+        elif encoding is not None:
+            raise ValueError("Unsupported encoding: %s" % encoding)
+
+        for chunk in chunks:
+            yield chunk
+    finally:
+        response.close()
+
+
+def save_content(chunks, dest):
+    """
+    Write chunks to a path or to a binary file object.
+
+    :param chunks: iterable of bytes
+    :param dest: file path or file object opened in binary mode
+    :return: the number of bytes written
+    """
+    if hasattr(dest, "write"):
+        return _write_chunks(chunks, dest)
+
+    with open(dest, "wb") as f:
+        return _write_chunks(chunks, f)
+
+
+def _write_chunks(chunks, f):
+    written = 0
+    for chunk in chunks:
+        f.write(chunk)
+        written += len(chunk)
+    return written
+
+
+class _JSONBuffer(object):
+    """
+    Text buffer fed by a stream of UTF-8 chunks, parsed one JSON value at a time.
+    """
+
+    def __init__(self, chunks):
+        self.chunks = iter(chunks)
+        self.decoder = codecs.getincrementaldecoder("utf-8")()
+        self.scanner = json.JSONDecoder()
+        self.text = ""
+        self.pos = 0
+        self.eof = False
+
+    def read(self, size=1):
+        """
+        Read chunks until at least size more characters are buffered, or the end of the stream.
+
+        :param size:
+        :return: False at the end of the stream
+        """
+        if self.eof:
+            return False
+
+        if self.pos > len(self.text) // 2:
+            self.text = self.text[self.pos:]
+            self.pos = 0
+
+        pieces = [self.text]
+        target = len(self.text) + size
+        length = len(self.text)
+        while length < target:
+            chunk = next(self.chunks, None)
+            if chunk is None:
+                pieces.append(self.decoder.decode(b"", final=True))
+                self.eof = True
+                break
+            piece = self.decoder.decode(chunk)
+            pieces.append(piece)
+            length += len(piece)
+        self.text = "".join(pieces)
+        return True
+
+    def peek(self):
+        """
+        Skip whitespaces and return the next character, "" at the end of the stream.
+
+        :return:
+        """
+        while True:
+            self.pos = _WHITESPACE.match(self.text, self.pos).end()
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not self.read():
+                return ""
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise ValueError(
+                "Invalid json content: expected %r at position %s" % (char, self.pos)
+            )
+        self.pos += 1
+
+    def skip_prefix(self):
+        if self.peek() == MAGIC_JSON_PREFIX[0]:
+            while len(self.text) - self.pos < len(MAGIC_JSON_PREFIX) and self.read():
+                pass
+            if self.text.startswith(MAGIC_JSON_PREFIX, self.pos):
+                self.pos += len(MAGIC_JSON_PREFIX)
+
+    def value(self):
+        """
+        Parse the next value. A value is only accepted once the delimiter following it
+        is buffered, e.g. '12' could be the beginning of '12.5'.
+
+        :return:
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = self.scanner.raw_decode(self.text, self.pos)
+            except ValueError:
+                value, end = None, None
+            if end is not None:
+                following = _WHITESPACE.match(self.text, end).end()
+                if self.eof or (
+                    following < len(self.text) and self.text[following] in ",:]}"
+                ):
+                    self.pos = end
+                    return value
+            # grow the buffer geometrically, so a large value is not re-parsed for every chunk
+            if not self.read(max(len(self.text) - self.pos, 1)):
+                raise ValueError(
+                    "Invalid json content at position %s: %s"
+                    % (self.pos, self.text[self.pos:self.pos + 64])
+                )
+
+    def items(self, opener, closer):
+        self.skip_prefix()
+        self.expect(opener)
+        if self.peek() == closer:
+            self.pos += 1
+            return
+
+        while True:
+            if opener == "{":
+                key = self.value()
+                self.expect(":")
+                yield key, self.value()
+            else:
+                yield self.value()
+
+            char = self.peek()
+            self.pos += 1
+            if char == closer:
+                return
+            if char != ",":
+                raise ValueError(
+                    "Invalid json content: expected ',' or %r at position %s"
+                    % (closer, self.pos - 1)
+                )
+
+
+def iter_json_object(chunks):
+    """
+    Parse a streamed JSON object incrementally, e.g. the map of '/projects/?all'.
+    Only one member is held in memory at a time, instead of the whole object.
+
+    :param chunks: iterable of UTF-8 bytes, the magic prefix ")]}'" is skipped
+    :return: a generator of (key, value)
+    """
+    return _JSONBuffer(chunks).items("{", "}")
+
+
+def iter_json_array(chunks):
+    """
+    Parse a streamed JSON array incrementally, yielding one element at a time.
+
+    :param chunks: iterable of UTF-8 bytes, the magic prefix ")]}'" is skipped
+    :return: a generator of the elements
+    """
+    return _JSONBuffer(chunks).items("[", "]")
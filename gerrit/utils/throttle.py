@@ -0,0 +1,212 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+import time
+import threading
+try:
+    from urllib.parse import urlparse
+except ImportError:
+    from urlparse import urlparse
+
+
+class TokenBucket(object):
+    """
+    Thread safe token bucket: rate tokens are added per second, up to burst.
+    """
+
+    def __init__(self, rate, burst=None):
+        """
+        :param rate: tokens per second
+        :param burst: bucket capacity, defaults to one second worth of tokens
+        """
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(rate, 1))
+        self._tokens = self.burst
+        self._updated = time.time()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens=1):
+        """
+        Take tokens from the bucket, waiting until they are available.
+
+        :param tokens:
+        :return: the number of seconds waited
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.time()
+                self._tokens = min(
+                    self.burst, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                delay = (tokens - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+class RateLimiter(object):
+    """
+    Client side rate limiter with one token bucket per host and endpoint class.
+
+    The endpoint classes are:
+
+    * admin: server configuration and plugin endpoints
+    * read: other GET and HEAD requests
+    * write: other requests
+
+    .. code-block:: python
+
+        limiter = RateLimiter(rates={"read": 50, "write": 5, "admin": 1})
+        gerrit = GerritClient(base_url=url, username=username, password=password, rate_limiter=limiter)
+
+    A class without a rate is not limited. Any object with an acquire(method, url) method can be
+    given to the client instead.
+    """
+
+    ADMIN_PATHS = ("/a/config/server", "/a/plugins/")
+    READ_METHODS = frozenset(["GET", "HEAD", "OPTIONS"])
+
+    def __init__(self, rates=None, bursts=None):
+        """
+        :param rates: requests per second by endpoint class
+        :param bursts: bucket capacity by endpoint class
+        """
+        self.rates = dict(rates or {})
+        self.bursts = dict(bursts or {})
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def classify(self, method, url):
+        """
+        :param method: http method
+        :param url:
+        :return: the endpoint class, read, write or admin
+        """
+        path = urlparse(url).path
+        for admin_path in self.ADMIN_PATHS:
+            if admin_path in path:
+                return "admin"
+        if method.upper() in self.READ_METHODS:
+            return "read"
+        return "write"
+
+    def get_bucket(self, host, endpoint_class):
+        """
+        :param host:
+        :param endpoint_class:
+        :return: the token bucket, None if the class is not limited
+        """
+        rate = self.rates.get(endpoint_class)
+        if not rate:
+            return None
+
+        key = (host, endpoint_class)
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = TokenBucket(rate, self.bursts.get(endpoint_class))
+                self._buckets[key] = bucket
+        return bucket
+
+    def acquire(self, method, url):
+        """
+        Wait until the request is allowed to be sent.
+
+        :param method: http method
+        :param url:
+        :return: the number of seconds waited
+        """
+        bucket = self.get_bucket(urlparse(url).netloc, self.classify(method, url))
+        if bucket is None:
+            return 0.0
+        return bucket.acquire()
+
+
+class ConcurrencyGovernor(object):
+    """
+    Adaptive limit of the number of requests in flight (AIMD).
+
+    Every successful request raises the limit additively (about +increase per
+    round of limit requests); a server error, a '429 Too Many Requests' or a
+    latency above latency_threshold cuts it multiplicatively, at most once per
+    cooldown seconds.
+    """
+
+    def __init__(
+        self,
+        initial=8,
+        minimum=1,
+        maximum=64,
+        increase=1.0,
+        decrease=0.5,
+        latency_threshold=None,
+        cooldown=1.0,
+    ):
+        """
+        :param initial: initial concurrency limit
+        :param minimum: lowest concurrency limit
+        :param maximum: highest concurrency limit
+        :param increase: additive increase per round of requests
+        :param decrease: multiplicative decrease factor
+        :param latency_threshold: seconds above which a response counts as overload
+        :param cooldown: minimum seconds between two decreases
+        """
+        self.minimum = minimum
+        self.maximum = maximum
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_threshold = latency_threshold
+        self.cooldown = cooldown
+        self._limit = float(initial)
+        self._in_flight = 0
+        self._last_decrease = 0.0
+        self._condition = threading.Condition()
+
+    @property
+    def limit(self):
+        return int(self._limit)
+
+    @property
+    def in_flight(self):
+        return self._in_flight
+
+    def acquire(self):
+        """
+        Wait for a free slot.
+
+        :return:
+        """
+        with self._condition:
+            while self._in_flight >= max(self.limit, self.minimum):
+                self._condition.wait()
+            self._in_flight += 1
+
+    def release(self, success, latency=None):
+        """
+        Give the slot back and adapt the limit.
+
+        :param success: False if the server reported an overload
+        :param latency: seconds the request took
+        :return:
+        """
+        overloaded = not success or (
+            self.latency_threshold is not None
+            and latency is not None
+            and latency > self.latency_threshold
+        )
+        with self._condition:
+            self._in_flight -= 1
+            now = time.time()
+            if overloaded:
+                if now - self._last_decrease >= self.cooldown:
+                    self._limit = max(self.minimum, self._limit * self.decrease)
+                    self._last_decrease = now
+            else:
+                self._limit = min(
+                    self.maximum, self._limit + self.increase / max(self._limit, 1.0)
+                )
+            self._condition.notify_all()
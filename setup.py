@@ -34,8 +34,7 @@ setup(
         "Intended Audience :: Developers",
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
-        "Programming Language :: Python :: 2.7",
-        "Programming Language :: Python :: 3.5",
+        "Programming Language :: Python :: 3 :: Only",
         "Programming Language :: Python :: 3.6",
         "Programming Language :: Python :: 3.7",
         "Programming Language :: Python :: 3.8",
@@ -43,14 +42,21 @@ setup(
     ],
     keywords="api gerrit client wrapper",
     packages=find_packages(exclude=["contrib", "docs", "test*"]),
+    # json.loads of bytes, OrderedDict.move_to_end and concurrent.futures
+    python_requires=">=3.6",
     # https://packaging.python.org/en/latest/requirements.html
     install_requires=[
         "requests",
     ],
-    extras_require={},
+    extras_require={
+        "async": ["aiohttp"],
+        "fastjson": ["orjson"],
+        "columnar": ["numpy", "pyarrow", "pandas"],
+    },
     package_data={},
     # http://docs.python.org/3.4/distutils/setupscript.html#installing-additional-files # noqa
     data_files=[],
     # Test suite (required for Py2)
     test_suite="tests",
+    tests_require=["pytest"],
 )
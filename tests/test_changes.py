@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+try:
+    from urllib.parse import parse_qs, urlsplit
+except ImportError:
+    from urlparse import parse_qs, urlsplit
+
+import pytest
+
+from gerrit.changes.changes import GerritChanges
+
+
+class FakeRequester(object):
+    def __init__(self, total):
+        self.total = total
+        self.urls = []
+
+    def get(self, url):
+        self.urls.append(url)
+        params = parse_qs(urlsplit(url).query)
+        size, start = int(params["n"][0]), int(params["S"][0])
+        end = min(start + size, self.total)
+        changes = [{"id": "c%d" % i} for i in range(start, end)]
+        if changes and start + size < self.total:
+            changes[-1]["_more_changes"] = True
+        return changes
+
+
+class FakeGerrit(object):
+    def __init__(self, total):
+        self.requester = FakeRequester(total)
+
+    def get_endpoint_url(self, endpoint):
+        return "http://gerrit/a" + endpoint
+
+    def decode_response(self, response):
+        return response
+
+
+def test_iter_search_pages():
+    gerrit = FakeGerrit(5)
+    changes = GerritChanges(gerrit)
+    query = "q=status:open+project:foo&o=LABELS"
+    ids = [change.id for change in changes.iter_search(query, page_size=2)]
+    assert ids == ["c0", "c1", "c2", "c3", "c4"]
+    assert len(gerrit.requester.urls) == 3
+    params = parse_qs(urlsplit(gerrit.requester.urls[-1]).query)
+    assert params == {
+        "q": ["status:open project:foo"],
+        "o": ["LABELS"],
+        "n": ["2"],
+        "S": ["4"],
+    }
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "q=status:open&n=10",
+        "q=status:open&S=20",
+        "q=status:open&start=20",
+        "q=status:open+limit:10",
+        "q=(status:open limit:10)",
+        "q=limit:10",
+    ],
+)
+def test_iter_search_rejects_paging(query):
+    gerrit = FakeGerrit(5)
+    with pytest.raises(ValueError):
+        next(GerritChanges(gerrit).iter_search(query))
+    assert gerrit.requester.urls == []
+
+
+def test_iter_search_allows_limit_in_text():
+    gerrit = FakeGerrit(1)
+    changes = list(GerritChanges(gerrit).iter_search('q=message:"nolimit:10"'))
+    assert len(changes) == 1
@@ -0,0 +1,42 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+import pytest
+
+from gerrit.changes.revision.files import File
+
+
+class FakeRequester(object):
+    def __init__(self):
+        self.urls = []
+
+    def get(self, url):
+        self.urls.append(url)
+        return {}
+
+
+class FakeGerrit(object):
+    def __init__(self):
+        self.requester = FakeRequester()
+
+    def get_endpoint_url(self, endpoint):
+        return "http://gerrit/a" + endpoint
+
+    def decode_response(self, response):
+        return response
+
+
+@pytest.mark.parametrize("intraline, query", [(False, ""), (True, "?intraline")])
+def test_get_diff_endpoint(intraline, query):
+    gerrit = FakeGerrit()
+    file = File.parse(
+        {"path": "gerrit/changes/change.py"},
+        change="myProject~master~I8473",
+        revision="current",
+        gerrit=gerrit,
+    )
+    file.get_diff(intraline=intraline)
+    assert gerrit.requester.urls == [
+        "http://gerrit/a/changes/myProject~master~I8473/revisions/current"
+        "/files/gerrit%2Fchanges%2Fchange.py/diff" + query
+    ]
@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+import pytest
+
+from gerrit.utils.cache import CachedResponse, MemoryCache, ResponseCache
+
+PREFIX = "https://review.example.com/a"
+
+
+@pytest.mark.parametrize(
+    "endpoint, stale",
+    [
+        ("/projects/foo/branches/stable", ["/projects/foo/branches/*"]),
+        ("/projects/foo/branches:delete", ["/projects/foo/branches/*"]),
+        ("/projects/foo/tags/v1.0", ["/projects/foo/tags/*"]),
+        (
+            "/projects/foo/description",
+            [
+                "/projects/foo",
+                "/projects/foo/config",
+                "/projects/foo/description",
+                "/projects/?*",
+            ],
+        ),
+        ("/projects/foo/HEAD", ["/projects/foo/HEAD", "/projects/foo/branches/*"]),
+        ("/projects/foo/gc", []),
+        (
+            "/projects/foo/delete-project~delete",
+            ["/projects/foo", "/projects/foo/*", "/projects/?*"],
+        ),
+        ("/projects/foo", ["/projects/foo", "/projects/foo/*", "/projects/?*"]),
+        ("/projects/foo/dashboards/main:closed", ["/projects/foo/dashboards/*"]),
+        ("/changes/", ["/changes/?*"]),
+        (
+            "/changes/foo~1/revisions/current/review",
+            ["/changes/foo~1", "/changes/foo~1/*", "/changes/?*"],
+        ),
+        (
+            "/accounts/self/name",
+            [
+                "/accounts/self",
+                "/accounts/self/detail",
+                "/accounts/self/name",
+                "/accounts/?*",
+            ],
+        ),
+        ("/accounts/1000096/sshkeys/1", ["/accounts/1000096/sshkeys*"]),
+        ("/groups/abc/members/jdoe", ["/groups/abc/members*"]),
+        (
+            "/groups/abc/description",
+            ["/groups/abc", "/groups/abc/*", "/groups/", "/groups/?*"],
+        ),
+        ("/config/server/preferences.diff", ["/config/server/preferences.diff"]),
+        ("/config/server/reload", ["/config/*"]),
+        ("/plugins/foo.jar", []),
+    ],
+)
+def test_get_stale_endpoints(endpoint, stale):
+    cache = ResponseCache(prefix=PREFIX)
+    assert cache.get_stale_endpoints(endpoint) == stale
+    # the query string of the mutation is ignored
+    assert cache.get_stale_endpoints(endpoint + "?notify=NONE") == stale
+
+
+def make_cache():
+    cache = ResponseCache(MemoryCache(), prefix=PREFIX)
+    for endpoint in (
+        "/projects/foo",
+        "/projects/foo/config",
+        "/projects/foo/branches/",
+        "/projects/foo/tags/",
+        "/projects/foobar",
+        "/projects/?all",
+        "/groups/",
+    ):
+        cache.backend.set(
+            cache.make_key(PREFIX + endpoint), CachedResponse(200, {}, b"{}"), 60
+        )
+    cache.backend.set(
+        cache.make_key(PREFIX + "/projects/foo", {"o": "DETAILS"}),
+        CachedResponse(200, {}, b"{}"),
+        60,
+    )
+    return cache
+
+
+def cached(cache, endpoint, params=None):
+    return cache.backend.get(cache.make_key(PREFIX + endpoint, params)) is not None
+
+
+@pytest.mark.parametrize("method", ["POST", "PUT", "DELETE"])
+def test_invalidate_branches(method):
+    cache = make_cache()
+    cache.invalidate(method, PREFIX + "/projects/foo/branches/stable")
+    assert not cached(cache, "/projects/foo/branches/")
+    assert cached(cache, "/projects/foo/tags/")
+    assert cached(cache, "/projects/foo/config")
+    assert cached(cache, "/projects/foo")
+
+
+def test_invalidate_exact_endpoint_with_query():
+    cache = make_cache()
+    cache.invalidate("PUT", PREFIX + "/projects/foo/description")
+    assert not cached(cache, "/projects/foo")
+    assert not cached(cache, "/projects/foo", {"o": "DETAILS"})
+    assert not cached(cache, "/projects/foo/config")
+    assert not cached(cache, "/projects/?all")
+    # an exact endpoint is not a prefix of the others
+    assert cached(cache, "/projects/foobar")
+    assert cached(cache, "/projects/foo/branches/")
+
+
+@pytest.mark.parametrize("method", ["GET", "HEAD"])
+def test_invalidate_ignores_reads(method):
+    cache = make_cache()
+    cache.invalidate(method, PREFIX + "/projects/foo")
+    assert cached(cache, "/projects/foo")
+
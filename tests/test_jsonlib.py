@@ -0,0 +1,34 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+import pytest
+
+from gerrit.utils import jsonlib
+
+DATA = ")]}'\n" + '{"subject": "café 中文", "_number": 3965}'
+VALUE = {"subject": "café 中文", "_number": 3965}
+
+
+@pytest.fixture(params=sorted(jsonlib.BACKENDS))
+def backend(request):
+    previous = jsonlib.backend
+    jsonlib.use_backend(request.param)
+    yield request.param
+    jsonlib.use_backend(previous)
+
+
+def test_loads_bytes(backend):
+    assert jsonlib.loads(DATA[5:].encode("utf-8")) == VALUE
+
+
+def test_loads_memoryview_slice(backend):
+    assert jsonlib.loads(memoryview(DATA.encode("utf-8"))[5:]) == VALUE
+
+
+def test_loads_str(backend):
+    assert jsonlib.loads(DATA[5:]) == VALUE
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        jsonlib.use_backend("simplejson")
@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+import pytest
+
+from gerrit.utils.models import BaseModel
+from gerrit.accounts.account import GerritAccount
+
+
+def all_models(cls=BaseModel):
+    for sub in cls.__subclasses__():
+        yield sub
+        for model in all_models(sub):
+            yield model
+
+
+@pytest.mark.parametrize("model", list(all_models()), ids=lambda m: m.__name__)
+def test_fields_derived_from_attributes(model):
+    assert model.fields == frozenset(model.attributes)
+
+
+class FakeFeatures(object):
+    def supports(self, name):
+        return True
+
+
+class FakeRequester(object):
+    def __init__(self):
+        self.calls = []
+
+    def put(self, url, **kwargs):
+        self.calls.append((url, kwargs))
+        return kwargs["json"]["display_name"]
+
+
+class FakeGerrit(object):
+    default_headers = {}
+
+    def __init__(self):
+        self.features = FakeFeatures()
+        self.requester = FakeRequester()
+
+    def get_endpoint_url(self, endpoint):
+        return "http://gerrit" + endpoint
+
+    def decode_response(self, response):
+        return response
+
+
+def test_set_displayname_updates_the_model():
+    gerrit = FakeGerrit()
+    account = GerritAccount.parse({"username": "kevin"}, gerrit=gerrit)
+    assert account.set_displayname({"display_name": "Kevin"}) == "Kevin"
+    assert account.display_name == "Kevin"
+    assert gerrit.requester.calls[0][0] == "http://gerrit/accounts/kevin/displayname"
@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+import time
+
+import pytest
+
+from gerrit.projects.branches import Branches
+from gerrit.projects.tags import Tags
+from gerrit.utils.exceptions import UnknownBranch, UnknownTag
+from gerrit.utils.refs import RefCache
+from gerrit.utils.registry import NegativeCache
+
+
+class FakeRequester(object):
+    response_cache = None
+
+    def __init__(self, server):
+        self.server = server
+
+    def get(self, url):
+        return self.server[url]
+
+
+class FakeGerrit(object):
+    def __init__(self, refs=None):
+        self.server = {"/projects/foo/branches/": [], "/projects/foo/tags/": []}
+        self.requester = FakeRequester(self.server)
+        self.negative_cache = NegativeCache()
+        self.refs = refs
+
+    def get_endpoint_url(self, endpoint):
+        return endpoint
+
+    def decode_response(self, response):
+        return list(response)
+
+
+@pytest.mark.parametrize(
+    "kind, cls, error",
+    [("branches", Branches, UnknownBranch), ("tags", Tags, UnknownTag)],
+)
+def test_created_out_of_band(kind, cls, error):
+    gerrit = FakeGerrit()
+    ref = "refs/heads/stable" if kind == "branches" else "refs/tags/v1.0"
+    with pytest.raises(error):
+        cls("foo", gerrit)[ref]
+
+    gerrit.server["/projects/foo/%s/" % kind].append({"ref": ref, "revision": "abc"})
+    assert ref in cls("foo", gerrit)
+    assert cls("foo", gerrit)[ref].ref == ref
+
+
+@pytest.mark.parametrize(
+    "kind, cls, error",
+    [("branches", Branches, UnknownBranch), ("tags", Tags, UnknownTag)],
+)
+def test_seeded_listing(kind, cls, error):
+    gerrit = FakeGerrit(refs=RefCache())
+    ref = "refs/heads/stable" if kind == "branches" else "refs/tags/v1.0"
+    with pytest.raises(error):
+        cls("foo", gerrit)[ref]
+
+    # e.g. applied from a snapshot, without a request
+    gerrit.refs.seed(kind, "foo", [{"ref": ref, "revision": "abc"}], time.time() + 1)
+    refs = cls("foo", gerrit)
+    assert ref in refs
+    assert refs[ref].ref == ref
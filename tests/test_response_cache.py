@@ -0,0 +1,43 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+from gerrit.utils.cache import CachedResponse, MemoryCache, ResponseCache, make_principal
+
+PREFIX = "https://review.example.com/a"
+
+
+def make_cache(principal):
+    cache = ResponseCache(MemoryCache(), prefix=PREFIX, principal=principal)
+    cache.backend.set(
+        cache.make_key(PREFIX + "/groups/"), CachedResponse(200, {}, b"{}"), 60
+    )
+    return cache
+
+
+def cached(cache, endpoint, params=None):
+    return cache.backend.get(cache.make_key(PREFIX + endpoint, params)) is not None
+
+
+def test_make_principal():
+    assert make_principal("alice") == make_principal("alice")
+    assert make_principal("alice") != make_principal("bob")
+    assert make_principal(None) == make_principal("")
+
+
+def test_invalidate_all_principals():
+    alice = make_cache("alice")
+    bob = ResponseCache(alice.backend, prefix=PREFIX, principal="bob")
+    bob.backend.set(
+        bob.make_key(PREFIX + "/groups/"), CachedResponse(200, {}, b"{}"), 60
+    )
+    assert cached(alice, "/groups/") and cached(bob, "/groups/")
+    alice.invalidate("POST", PREFIX + "/groups/abc/description")
+    assert not cached(alice, "/groups/")
+    assert not cached(bob, "/groups/")
+
+
+def test_principals_are_isolated():
+    alice = make_cache("alice")
+    bob = ResponseCache(alice.backend, prefix=PREFIX, principal="bob")
+    assert alice.get(PREFIX + "/groups/") is not None
+    assert bob.get(PREFIX + "/groups/") is None
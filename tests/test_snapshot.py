@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+from gerrit.accounts.resolver import AccountResolver
+from gerrit.utils.cache import make_principal
+from gerrit.utils.snapshot import Snapshot
+
+
+class FakeFeatures(object):
+    _version = None
+    _fetched_at = None
+
+    def is_stale(self):
+        return True
+
+    def update(self, version, fetched):
+        self._version = version
+        self._fetched_at = fetched
+
+
+class FakeGerrit(object):
+    refs = None
+
+    def __init__(self, username, base_url="http://gerrit"):
+        self._base_url = base_url
+        self._principal = make_principal(username)
+        self.features = FakeFeatures()
+
+
+def saved_snapshot(tmp_path, username):
+    path = str(tmp_path / "gerrit.snapshot")
+    snapshot = Snapshot(path=path)
+    snapshot.add("accounts", {"_account_id": 1000096, "username": "kevin"}, 1000096, "kevin")
+    gerrit = FakeGerrit(username)
+    gerrit.features.update("3.4.0", 1.0)
+    snapshot.capture(gerrit)
+    snapshot.save()
+    return path
+
+
+def test_principal_saved_in_the_header(tmp_path):
+    path = saved_snapshot(tmp_path, "kevin")
+    snapshot = Snapshot.load(path)
+    assert snapshot.principal == make_principal("kevin")
+    assert snapshot.base_url == "http://gerrit"
+
+
+def test_applied_to_the_same_account(tmp_path):
+    snapshot = Snapshot.load(saved_snapshot(tmp_path, "kevin"))
+    gerrit = FakeGerrit("kevin")
+    snapshot.apply(gerrit)
+    assert snapshot.get("accounts", "kevin") is not None
+    assert gerrit.features._version == "3.4.0"
+
+
+def test_rejected_for_another_account(tmp_path):
+    snapshot = Snapshot.load(saved_snapshot(tmp_path, "kevin"))
+    gerrit = FakeGerrit("admin")
+    snapshot.apply(gerrit)
+    assert len(snapshot) == 0
+    assert snapshot.get("accounts", "kevin") is None
+    assert gerrit.features._version is None
+
+
+def test_rejected_for_another_server(tmp_path):
+    snapshot = Snapshot.load(saved_snapshot(tmp_path, "kevin"))
+    snapshot.apply(FakeGerrit("kevin", base_url="http://other"))
+    assert len(snapshot) == 0
+
+
+def test_self_alias_not_saved():
+    gerrit = FakeGerrit("kevin")
+    gerrit.snapshot = Snapshot()
+    resolver = AccountResolver(gerrit=gerrit)
+    data = {"_account_id": 1000096, "username": "kevin", "email": "kevin@example.com"}
+    account = resolver.add(data, "self")
+    assert resolver.get("self") is account
+    assert gerrit.snapshot.get("accounts", "self") is None
+    for id_ in (1000096, "kevin", "kevin@example.com"):
+        assert gerrit.snapshot.get("accounts", id_) == data
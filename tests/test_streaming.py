@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+# @Author: Jialiang Shi
+import io
+import json
+import base64
+import zipfile
+
+import pytest
+
+from gerrit.utils.streaming import (
+    iter_base64_decode,
+    iter_json_array,
+    iter_json_object,
+    iter_unzip,
+)
+
+CHUNK_SIZES = [1, 2, 3, 4, 5, 7, 16, 64, 1 << 20]
+
+
+def chunked(data, size):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize("size", CHUNK_SIZES)
+@pytest.mark.parametrize(
+    "value",
+    [
+        [],
+        [1],
+        [12, 12.5, -3e10, 0],
+        ["a", "", "café", "中文", "\U0001f600", "quote \" and \\ backslash"],
+        [True, False, None],
+        [{"ref": "refs/heads/master", "nested": {"a": [1, {"b": []}]}}, [[], [[]]]],
+    ],
+)
+@pytest.mark.parametrize("prefix", [b"", b")]}'\n", b")]}'"])
+def test_iter_json_array(value, size, prefix):
+    data = prefix + json.dumps(value, ensure_ascii=False).encode("utf-8")
+    assert list(iter_json_array(chunked(data, size))) == value
+
+
+@pytest.mark.parametrize("size", CHUNK_SIZES)
+@pytest.mark.parametrize(
+    "value",
+    [
+        {},
+        {"a": 1},
+        {"All-Projects": {"id": "All-Projects", "state": "ACTIVE"}, "café": {"n": 10}},
+        {"k%d" % i: i * 1.5 for i in range(50)},
+    ],
+)
+def test_iter_json_object(value, size):
+    data = b")]}'\n" + json.dumps(value, ensure_ascii=False, indent=2).encode("utf-8")
+    assert list(iter_json_object(chunked(data, size))) == list(value.items())
+
+
+@pytest.mark.parametrize("size", CHUNK_SIZES)
+def test_iter_json_array_number_at_chunk_boundary(size):
+    # '12' must not be taken for a whole number before the '.5' which follows it
+    data = b"[12.5, 1234567890, 1e5]"
+    assert list(iter_json_array(chunked(data, size))) == [12.5, 1234567890, 1e5]
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 5])
+@pytest.mark.parametrize(
+    "data",
+    [b"[1, 2", b"[1 2]", b"{\"a\" 1}", b"{\"a\": 1", b"", b"[\"abc"],
+)
+def test_iter_json_invalid(data, size):
+    parse = iter_json_object if data.startswith(b"{") else iter_json_array
+    with pytest.raises(ValueError):
+        list(parse(chunked(data, size)))
+
+
+@pytest.mark.parametrize("size", CHUNK_SIZES)
+@pytest.mark.parametrize("length", [0, 1, 2, 3, 4, 5, 57, 1000])
+def test_iter_base64_decode(length, size):
+    content = bytes(bytearray(i % 256 for i in range(length)))
+    encoded = base64.encodebytes(content)  # with a newline every 76 characters
+    assert b"".join(iter_base64_decode(chunked(encoded, size))) == content
+
+
+def make_zip(content, compression):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", compression) as archive:
+        archive.writestr("0001-change.patch", content)
+    return buffer.getvalue()
+
+
+@pytest.mark.parametrize("size", CHUNK_SIZES)
+@pytest.mark.parametrize("compression", [zipfile.ZIP_DEFLATED, zipfile.ZIP_STORED])
+@pytest.mark.parametrize("length", [0, 1, 100, 100000])
+def test_iter_unzip(length, compression, size):
+    content = b"".join(b"line %d\n" % i for i in range(length))[:length]
+    data = make_zip(content, compression)
+    assert b"".join(iter_unzip(chunked(data, size))) == content
+
+
+@pytest.mark.parametrize("size", [1, 7, 64])
+@pytest.mark.parametrize("compression", [zipfile.ZIP_DEFLATED, zipfile.ZIP_STORED])
+def test_iter_unzip_truncated(compression, size):
+    data = make_zip(b"x" * 1000 + bytes(bytearray(range(256))), compression)
+    with pytest.raises(ValueError):
+        list(iter_unzip(chunked(data[:60], size)))
+
+
+def test_iter_unzip_not_a_zip():
+    with pytest.raises(ValueError):
+        list(iter_unzip([b"x" * 64]))